@@ -0,0 +1,545 @@
+import bisect
+import contextlib
+import multiprocessing
+import tempfile
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from employee import AGE_GROUP_BOUNDS, MICROSECONDS_PER_DAY, EmployeeTable, current_timestamp
+
+
+class GroupedAggregates:
+    """Metrics of all employees aggregated into a department × age_group × gender × education cube
+
+    Every analyzer question about a grouping (by department, by gender, by age group and
+    gender, ...) is answered by reducing the cube over the other axes, without touching
+    the employee rows again.
+    """
+
+    KEYS = ['department_name', 'age_group', 'gender', 'education']
+
+    # Metrics added up per cell
+    SUM_METRICS = [
+        'count', 'age', 'tenure_years', 'performance_score', 'salary', 'experience_years',
+        'team_leads', 'short_tenure', 'high_potential',
+        'team_lead_tenure', 'team_lead_experience',
+        'team_lead_tenure_0_2', 'team_lead_tenure_2_5', 'team_lead_tenure_5_10', 'team_lead_tenure_10_plus'
+    ]
+    # Metrics reduced with min / max per cell (empty cells hold +inf / -inf)
+    MIN_METRICS = ['first_row', 'age_min', 'salary_min', 'team_lead_tenure_min']
+    MAX_METRICS = ['age_max', 'salary_max', 'team_lead_tenure_max']
+    # Fractional metrics also summed per department in row order: reports print their
+    # department averages, which then round exactly like a sum over the employee list
+    DEPARTMENT_SUM_METRICS = ['age', 'tenure_years', 'performance_score', 'team_lead_tenure']
+
+    def __init__(self, categories: Dict[str, List[str]], cube: Dict[str, np.ndarray],
+                 salary_medians: np.ndarray, high_potential_rows: Union[np.ndarray, Callable[[], np.ndarray]],
+                 tenure_threshold: float, performance_threshold: float,
+                 department_sums: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            categories: Labels of every cube axis
+            cube: Metric name -> array shaped like the cube
+            salary_medians: Median salary per education code
+            high_potential_rows: Table rows of high-potential employees (not team leads,
+                performance >= performance_threshold, tenure >= 1 year), or a function
+                returning them (called on first use)
+            tenure_threshold: Tenure (years) below which an employee counts as short tenure
+            performance_threshold: Performance score used for high_potential
+            department_sums: DEPARTMENT_SUM_METRICS summed per department in row order
+                (per-department marginals of these metrics are reduced from the cube if None)
+        """
+        self.categories = categories
+        self.cube = cube
+        self.department_sums = department_sums or {}
+        self.salary_medians = salary_medians
+        self._high_potential_rows = high_potential_rows
+        self.tenure_threshold = tenure_threshold
+        self.performance_threshold = performance_threshold
+
+    @property
+    def high_potential_rows(self) -> np.ndarray:
+        """Table rows of high-potential employees"""
+        if callable(self._high_potential_rows):
+            self._high_potential_rows = self._high_potential_rows()
+        return self._high_potential_rows
+
+    @property
+    def total(self) -> int:
+        """Number of aggregated employees"""
+        return int(self.cube['count'].sum())
+
+    def marginal(self, metric: str, keys: Sequence[str] = ()) -> np.ndarray:
+        """
+        Reduce a metric over every cube axis not listed in keys
+
+        Args:
+            metric: Metric name
+            keys: Axes to keep, in cube order (e.g. ['department_name', 'gender'])
+        """
+        if list(keys) == ['department_name'] and metric in self.department_sums:
+            return self.department_sums[metric].copy()
+        axes = tuple(axis for axis, key in enumerate(self.KEYS) if key not in keys)
+        # initial keeps the reductions defined on an empty cube (no employees)
+        if metric in self.MIN_METRICS:
+            return self.cube[metric].min(axis=axes, initial=np.inf)
+        if metric in self.MAX_METRICS:
+            return self.cube[metric].max(axis=axes, initial=-np.inf)
+        return self.cube[metric].sum(axis=axes)
+
+    def group_keys(self, key: str) -> np.ndarray:
+        """Codes of the groups of a key that have employees, in order of first appearance"""
+        first_rows = self.marginal('first_row', [key])
+        present = np.flatnonzero(np.isfinite(first_rows))
+        return present[np.argsort(first_rows[present], kind='stable')]
+
+    def label(self, key: str, code: int) -> str:
+        """Label of a group code"""
+        return self.categories[key][code]
+
+
+class PartialAggregates:
+    """Mergeable aggregates of one shard (a range of rows) of the employee table
+
+    Sums are added, minimums and maximums are reduced element-wise and salaries are kept
+    as value counts per education, so merging partials gives exactly what aggregating the
+    merged rows would give.
+    """
+
+    def __init__(self, cube: Dict[str, np.ndarray], salary_counts: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                 high_potential_rows: np.ndarray, department_sums: Dict[str, np.ndarray]):
+        """
+        Args:
+            cube: Metric name -> array shaped like the cube
+            salary_counts: (education codes, salaries, counts) of the distinct pairs, sorted
+            high_potential_rows: Table rows of high-potential employees, sorted
+            department_sums: GroupedAggregates.DEPARTMENT_SUM_METRICS summed per department in row order
+        """
+        self.cube = cube
+        self.salary_counts = salary_counts
+        self.high_potential_rows = high_potential_rows
+        self.department_sums = department_sums
+
+    def merge(self, other: 'PartialAggregates') -> 'PartialAggregates':
+        """Combine with the partial of the rows that follow this one"""
+        cube = {}
+        for metric, values in self.cube.items():
+            if metric in GroupedAggregates.MIN_METRICS:
+                cube[metric] = np.minimum(values, other.cube[metric])
+            elif metric in GroupedAggregates.MAX_METRICS:
+                cube[metric] = np.maximum(values, other.cube[metric])
+            else:
+                cube[metric] = values + other.cube[metric]
+
+        education, salaries, counts = (np.concatenate(pair) for pair in zip(self.salary_counts, other.salary_counts))
+        return PartialAggregates(cube, _count_pairs(education, salaries, counts),
+                                 np.concatenate([self.high_potential_rows, other.high_potential_rows]),
+                                 {metric: values + other.department_sums[metric]
+                                  for metric, values in self.department_sums.items()})
+
+    def salary_medians(self, education_count: int) -> np.ndarray:
+        """Median salary per education code"""
+        education, salaries, counts = self.salary_counts
+        medians = np.full(education_count, np.nan)
+        for code in np.unique(education):
+            in_group = education == code
+            values = salaries[in_group].astype(np.float64)
+            positions = np.cumsum(counts[in_group])
+            total = positions[-1]
+            # Middle values of the group as if every salary was repeated count times
+            lower = values[np.searchsorted(positions, (total - 1) // 2, side='right')]
+            upper = values[np.searchsorted(positions, total // 2, side='right')]
+            medians[code] = (lower + upper) / 2
+        return medians
+
+
+def _count_pairs(education: np.ndarray, salaries: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Add up the counts of equal (education, salary) pairs, sorting the pairs"""
+    if len(education) == 0:
+        return education, salaries, counts
+    order = np.lexsort((salaries, education))
+    education, salaries, counts = education[order], salaries[order], counts[order]
+    starts = np.flatnonzero(np.r_[True, (education[1:] != education[:-1]) | (salaries[1:] != salaries[:-1])])
+    return education[starts], salaries[starts], np.add.reduceat(counts, starts)
+
+
+# Engine used by shard worker processes (inherited on fork or opened by _init_shard_worker)
+_shard_engine = None
+
+
+def _init_shard_worker(mapped_directory: Optional[str], tenure_threshold: float, performance_threshold: float):
+    """Open the memory-mapped employee columns in a worker started without fork"""
+    global _shard_engine
+    if mapped_directory is not None:
+        _shard_engine = AggregationEngine(EmployeeTable.open_mapped(mapped_directory),
+                                          tenure_threshold, performance_threshold)
+
+
+def _aggregate_shard(bounds: Tuple[int, int]) -> PartialAggregates:
+    """Aggregate one shard in a worker process"""
+    return _shard_engine.aggregate_shard(*bounds)
+
+
+class AggregationEngine:
+    """Computes the grouped metrics used by all analyzers in one fused pass over the employee table
+
+    The table is cut into shards of shard_size rows whose partial aggregates are merged in
+    order. Shard boundaries do not depend on the number of jobs, so the result is the same
+    bit for bit whether shards run serially or on a process pool.
+    """
+
+    SHARD_SIZE = 1 << 20
+
+    def __init__(self, table: EmployeeTable, tenure_threshold: float = 2.0, performance_threshold: float = 85.0,
+                 jobs: int = 1, shard_size: int = SHARD_SIZE):
+        self.table = table
+        self.tenure_threshold = tenure_threshold
+        self.performance_threshold = performance_threshold
+        self.jobs = jobs
+        self.shard_size = shard_size
+
+    def shards(self) -> List[Tuple[int, int]]:
+        """Row ranges (start, end) of the shards"""
+        starts = range(0, max(len(self.table), 1), self.shard_size)
+        return [(start, min(start + self.shard_size, len(self.table))) for start in starts]
+
+    def run(self) -> GroupedAggregates:
+        """Aggregate every metric of GroupedAggregates into the cube"""
+        shards = self.shards()
+        if self.jobs <= 1 or len(shards) == 1:
+            partials = [self.aggregate_shard(start, end) for start, end in shards]
+        else:
+            partials = self._run_pool(shards)
+
+        merged = partials[0]
+        for partial in partials[1:]:
+            merged = merged.merge(partial)
+
+        categories = {key: self.table.categories[key] for key in GroupedAggregates.KEYS}
+        return GroupedAggregates(categories, merged.cube,
+                                 merged.salary_medians(len(categories['education'])),
+                                 merged.high_potential_rows,
+                                 self.tenure_threshold, self.performance_threshold,
+                                 merged.department_sums)
+
+    def _run_pool(self, shards: List[Tuple[int, int]]) -> List[PartialAggregates]:
+        """Aggregate shards on worker processes sharing the table (inherited on fork, otherwise memory-mapped)"""
+        global _shard_engine
+        with contextlib.ExitStack() as stack:
+            if 'fork' in multiprocessing.get_all_start_methods():
+                _shard_engine = self
+                context = multiprocessing.get_context('fork')
+                mapped_directory = None
+            else:
+                context = multiprocessing.get_context()
+                mapped_directory = stack.enter_context(tempfile.TemporaryDirectory())
+                self.table.save_columns(mapped_directory)
+
+            pool = stack.enter_context(context.Pool(
+                min(self.jobs, len(shards)), _init_shard_worker,
+                (mapped_directory, self.tenure_threshold, self.performance_threshold)))
+            return pool.map(_aggregate_shard, shards)
+
+    def aggregate_shard(self, start: int, end: int) -> PartialAggregates:
+        """
+        Aggregate the rows start..end of the table
+
+        Args:
+            start: First row of the shard
+            end: Row after the last row of the shard
+        """
+        table = self.table
+        shape = tuple(len(table.categories[key]) for key in GroupedAggregates.KEYS)
+        size = int(np.prod(shape))
+        rows = slice(start, end)
+
+        # One cell code per employee: all groupings are derived from it
+        cells = np.zeros(end - start, dtype=np.int64)
+        for key, axis_size in zip(GroupedAggregates.KEYS, shape):
+            cells = cells * axis_size + table.codes[key][rows]
+
+        team_lead = np.asarray(table.is_team_lead[rows])
+        tenure = np.asarray(table.tenure_years[rows])
+        performance = np.asarray(table.performance_score[rows])
+        age = np.asarray(table.age[rows])
+        salary = np.asarray(table.salary[rows])
+        experience = np.asarray(table.experience_years[rows])
+        tenure_bands = np.digitize(tenure, [2, 5, 10], right=True)
+        high_potential = ~team_lead & (performance >= self.performance_threshold) & (tenure >= 1.0)
+
+        sums = {
+            'count': None,
+            'age': age,
+            'tenure_years': tenure,
+            'performance_score': performance,
+            'salary': salary,
+            'experience_years': experience,
+            'team_leads': team_lead,
+            'short_tenure': tenure < self.tenure_threshold,
+            'high_potential': high_potential,
+            'team_lead_tenure': np.where(team_lead, tenure, 0.0),
+            'team_lead_experience': np.where(team_lead, experience, 0),
+            'team_lead_tenure_0_2': team_lead & (tenure_bands == 0),
+            'team_lead_tenure_2_5': team_lead & (tenure_bands == 1),
+            'team_lead_tenure_5_10': team_lead & (tenure_bands == 2),
+            'team_lead_tenure_10_plus': team_lead & (tenure_bands == 3)
+        }
+        minimums = {
+            'first_row': np.arange(start, end, dtype=np.float64),
+            'age_min': age,
+            'salary_min': salary,
+            'team_lead_tenure_min': np.where(team_lead, tenure, np.inf)
+        }
+        maximums = {
+            'age_max': age,
+            'salary_max': salary,
+            'team_lead_tenure_max': np.where(team_lead, tenure, -np.inf)
+        }
+
+        cube = {}
+        for metric, values in sums.items():
+            weights = None if values is None else np.asarray(values, dtype=np.float64)
+            cube[metric] = np.bincount(cells, weights=weights, minlength=size).reshape(shape)
+        for metric, values in minimums.items():
+            result = np.full(size, np.inf)
+            np.minimum.at(result, cells, values)
+            cube[metric] = result.reshape(shape)
+        for metric, values in maximums.items():
+            result = np.full(size, -np.inf)
+            np.maximum.at(result, cells, values)
+            cube[metric] = result.reshape(shape)
+
+        # Summed over the rows in order, not over the cells of each department
+        departments = np.asarray(table.codes['department_name'][rows])
+        department_sums = {metric: np.bincount(departments, weights=np.asarray(sums[metric], dtype=np.float64),
+                                               minlength=shape[0])
+                           for metric in GroupedAggregates.DEPARTMENT_SUM_METRICS}
+
+        # Medians cannot be derived from cell sums: keep every salary, as counts of distinct values
+        education = np.asarray(table.codes['education'][rows])
+        salary_counts = _count_pairs(education, salary, np.ones(end - start, dtype=np.int64))
+
+        return PartialAggregates(cube, salary_counts, start + np.flatnonzero(high_potential), department_sums)
+
+
+def aggregate(table: EmployeeTable, tenure_threshold: float = 2.0,
+              performance_threshold: float = 85.0, jobs: int = 1) -> GroupedAggregates:
+    """
+    Run the aggregation engine over a table
+
+    Args:
+        table: Employee table
+        tenure_threshold: Tenure (years) below which an employee counts as short tenure
+        performance_threshold: Performance score used for high_potential
+        jobs: Number of processes the shards are aggregated on (the result does not depend on it)
+    """
+    return AggregationEngine(table, tenure_threshold, performance_threshold, jobs).run()
+
+
+def matching_aggregates(aggregates: GroupedAggregates, table: EmployeeTable, tenure_threshold: float = 2.0,
+                        performance_threshold: float = 85.0) -> GroupedAggregates:
+    """Return aggregates if they were computed with the given thresholds, otherwise run the engine again"""
+    if (aggregates.tenure_threshold == tenure_threshold and
+            aggregates.performance_threshold == performance_threshold):
+        return aggregates
+    return aggregate(table, tenure_threshold, performance_threshold)
+
+
+class RunningAggregates:
+    """Aggregates kept up to date while employees are added, removed and updated one at a time
+
+    Sums are adjusted in place. Minimums, maximums, the order of first appearance and the
+    salary medians are backed by sorted lists per cell (per education for medians), so a
+    change costs a binary search and an insert into one short list instead of a pass over
+    all employees. Float sums are adjusted by subtraction on removal and may differ from a
+    fresh aggregation in the last bits.
+
+    Employees are identified by a sequence number that increases in table order and is
+    kept while the employee is managed (see EmployeeManager), so first_row holds sequence
+    numbers instead of rows: group order is the same.
+    """
+
+    # Values kept sorted per cell -> the min / max metrics they back
+    SORTED_VALUES = {
+        'first_row': ('first_row', None),
+        'age': ('age_min', 'age_max'),
+        'salary': ('salary_min', 'salary_max'),
+        'team_lead_tenure': ('team_lead_tenure_min', 'team_lead_tenure_max')
+    }
+
+    def __init__(self, table: EmployeeTable, sequences: np.ndarray,
+                 tenure_threshold: float = 2.0, performance_threshold: float = 85.0):
+        """
+        Args:
+            table: Employees to start from
+            sequences: Increasing sequence number of every table row
+            tenure_threshold: Tenure (years) below which an employee counts as short tenure
+            performance_threshold: Performance score used for high_potential
+        """
+        aggregates = aggregate(table, tenure_threshold, performance_threshold)
+        # Age and tenure of changed employees are calculated at the table's date
+        self.current_timestamp = current_timestamp(table.current_date)
+        self.tenure_threshold = tenure_threshold
+        self.performance_threshold = performance_threshold
+        self.categories = {key: list(labels) for key, labels in aggregates.categories.items()}
+        self.lookup = {key: {label: code for code, label in enumerate(labels)}
+                       for key, labels in self.categories.items()}
+        self.cube = {metric: values.copy() for metric, values in aggregates.cube.items()}
+        self.department_sums = {metric: values.copy() for metric, values in aggregates.department_sums.items()}
+
+        sequences = np.asarray(sequences, dtype=np.int64)
+        first_rows = self.cube['first_row']
+        present = np.isfinite(first_rows)
+        first_rows[present] = sequences[first_rows[present].astype(np.int64)]
+
+        shape = first_rows.shape
+        cells = np.zeros(len(table), dtype=np.int64)
+        for key, axis_size in zip(GroupedAggregates.KEYS, shape):
+            cells = cells * axis_size + table.codes[key]
+        team_lead = np.asarray(table.is_team_lead)
+
+        self.sorted_values = {
+            'first_row': self._split(cells, sequences, shape),
+            'age': self._split(cells, np.asarray(table.age), shape),
+            'salary': self._split(cells, np.asarray(table.salary), shape),
+            'team_lead_tenure': self._split(cells[team_lead], np.asarray(table.tenure_years)[team_lead], shape)
+        }
+        self.salaries = self._split(np.asarray(table.codes['education'], dtype=np.int64),
+                                    np.asarray(table.salary), (len(self.categories['education']),))
+        self.high_potential = sequences[aggregates.high_potential_rows].tolist()
+
+    @staticmethod
+    def _split(cells: np.ndarray, values: np.ndarray, shape: Tuple[int, ...]) -> Dict[Tuple[int, ...], List]:
+        """Sorted lists of values per cell (cells are flat indices into shape)"""
+        if len(cells) == 0:
+            return {}
+        order = np.lexsort((values, cells))
+        cells = cells[order]
+        values = values[order]
+        starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+        ends = np.r_[starts[1:], len(cells)]
+        keys = np.stack(np.unravel_index(cells[starts], shape), axis=1).tolist()
+        return {tuple(key): values[start:end].tolist() for key, start, end in zip(keys, starts, ends)}
+
+    def _code(self, key: str, label: str) -> int:
+        """Code of a label, growing the cube along the key's axis for a new label"""
+        codes = self.lookup[key]
+        if label not in codes:
+            codes[label] = len(codes)
+            self.categories[key].append(label)
+            padding = [(0, 0)] * len(GroupedAggregates.KEYS)
+            padding[GroupedAggregates.KEYS.index(key)] = (0, 1)
+            for metric, values in self.cube.items():
+                fill = (np.inf if metric in GroupedAggregates.MIN_METRICS else
+                        -np.inf if metric in GroupedAggregates.MAX_METRICS else 0)
+                self.cube[metric] = np.pad(values, padding, constant_values=fill)
+            if key == 'department_name':
+                for metric, values in self.department_sums.items():
+                    self.department_sums[metric] = np.append(values, 0.0)
+        return codes[label]
+
+    @staticmethod
+    def _change(values: List, value: Any, sign: int):
+        """Insert (sign 1) or remove (sign -1) a value of a sorted list"""
+        if sign > 0:
+            bisect.insort(values, value)
+        else:
+            del values[bisect.bisect_left(values, value)]
+
+    def _change_sorted(self, name: str, cell: Tuple[int, ...], value: Any, sign: int):
+        """Insert or remove a value of a cell and refresh the min / max metrics it backs"""
+        values = self.sorted_values[name].setdefault(cell, [])
+        self._change(values, value, sign)
+        minimum, maximum = self.SORTED_VALUES[name]
+        self.cube[minimum][cell] = values[0] if values else np.inf
+        if maximum is not None:
+            self.cube[maximum][cell] = values[-1] if values else -np.inf
+
+    def _apply(self, employee: Union[Dict[str, Any], Any], sequence: int, sign: int):
+        """Add (sign 1) or remove (sign -1) one employee (Employee or analytics row dict)"""
+        def value(name: str) -> Any:
+            return employee[name] if isinstance(employee, dict) else getattr(employee, name)
+
+        if isinstance(employee, dict):
+            # Analytics rows of the table already hold age and tenure at its date
+            age = employee['age']
+            tenure = employee['tenure_years']
+        else:
+            # Not Employee.age / tenure_years, which use Employee.current_date
+            age = (self.current_timestamp - employee.birth_timestamp) // MICROSECONDS_PER_DAY / 365.25
+            tenure = (self.current_timestamp - employee.hire_timestamp) // MICROSECONDS_PER_DAY / 365.25
+        salary = value('salary')
+        performance = value('performance_score')
+        experience = value('experience_years')
+        team_lead = bool(value('is_team_lead'))
+        education = self._code('education', value('education'))
+        cell = (self._code('department_name', value('department_name')),
+                bisect.bisect_left(AGE_GROUP_BOUNDS, age),
+                self._code('gender', value('gender')),
+                education)
+        tenure_band = bisect.bisect_left([2, 5, 10], tenure)
+        high_potential = not team_lead and performance >= self.performance_threshold and tenure >= 1.0
+
+        deltas = {
+            'count': 1,
+            'age': age,
+            'tenure_years': tenure,
+            'performance_score': performance,
+            'salary': salary,
+            'experience_years': experience,
+            'team_leads': team_lead,
+            'short_tenure': tenure < self.tenure_threshold,
+            'high_potential': high_potential,
+            'team_lead_tenure': tenure if team_lead else 0.0,
+            'team_lead_experience': experience if team_lead else 0,
+            'team_lead_tenure_0_2': team_lead and tenure_band == 0,
+            'team_lead_tenure_2_5': team_lead and tenure_band == 1,
+            'team_lead_tenure_5_10': team_lead and tenure_band == 2,
+            'team_lead_tenure_10_plus': team_lead and tenure_band == 3
+        }
+        for metric, delta in deltas.items():
+            self.cube[metric][cell] += sign * delta
+        for metric, values in self.department_sums.items():
+            values[cell[0]] += sign * deltas[metric]
+
+        self._change_sorted('first_row', cell, sequence, sign)
+        self._change_sorted('age', cell, age, sign)
+        self._change_sorted('salary', cell, salary, sign)
+        if team_lead:
+            self._change_sorted('team_lead_tenure', cell, tenure, sign)
+        self._change(self.salaries.setdefault((education,), []), salary, sign)
+        if high_potential:
+            self._change(self.high_potential, sequence, sign)
+
+    def add(self, employee: Union[Dict[str, Any], Any], sequence: int):
+        """
+        Account for a new employee
+
+        Args:
+            employee: Employee object or analytics row dict (EmployeeTable.row)
+            sequence: Sequence number of the employee
+        """
+        self._apply(employee, sequence, 1)
+
+    def remove(self, employee: Union[Dict[str, Any], Any], sequence: int):
+        """Stop accounting for an employee (with the values it was added with)"""
+        self._apply(employee, sequence, -1)
+
+    def to_aggregates(self, rows_of: Callable[[np.ndarray], np.ndarray]) -> GroupedAggregates:
+        """
+        Current state as GroupedAggregates (copied, later changes do not affect it)
+
+        Args:
+            rows_of: Maps sequence numbers to the table rows of the employees
+        """
+        medians = np.full(len(self.categories['education']), np.nan)
+        for (code,), salaries in self.salaries.items():
+            if salaries:
+                middle = len(salaries)
+                medians[code] = (float(salaries[(middle - 1) // 2]) + float(salaries[middle // 2])) / 2
+
+        high_potential = np.array(self.high_potential, dtype=np.int64)
+        return GroupedAggregates({key: list(labels) for key, labels in self.categories.items()},
+                                 {metric: values.copy() for metric, values in self.cube.items()},
+                                 medians, lambda: rows_of(high_potential),
+                                 self.tenure_threshold, self.performance_threshold,
+                                 {metric: values.copy() for metric, values in self.department_sums.items()})
@@ -0,0 +1,140 @@
+import inspect
+import pandas as pd
+from typing import Any, Dict, List, Optional, Union
+from employee import Employee, EmployeeManager, EmployeeTable, as_employee_table
+from analyzers.AggregationEngine import GroupedAggregates, aggregate
+from analyzers import DemographicAnalyzer
+from analyzers import TurnoverAnalyzer
+from analyzers import EducationAnalyzer
+from analyzers import CareerDevelompentAnalyzer
+from analyzers import HRStrategyAdvisor
+
+
+class AnalysisSession:
+    """Owns one instance of every analyzer over a dataset and a shared cache of their results
+
+    Public analyzer methods are cached by (analyzer, method, arguments, dataset version),
+    including calls analyzers make to each other, so every metric is computed at most
+    once per dataset. Report methods (generate_*) are not cached because they print.
+    Cached results are shared between callers and must not be modified.
+
+    Over an EmployeeManager the session uses the manager's maintained aggregates and only
+    converts the employees to a table when a method needs rows, so after a change event
+    set_employees(manager) refreshes aggregate-based results without a pass over all employees.
+    """
+
+    ANALYZER_NAMES = ['demographic_analyzer', 'turnover_analyzer', 'education_analyzer',
+                      'career_analyzer', 'strategy_advisor']
+
+    def __init__(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                 aggregates: Optional[GroupedAggregates] = None):
+        self.version = 0
+        self.cache = {}
+        # As-of date -> session over the employees calculated at that date
+        self.as_of_sessions = {}
+        self._build(employees, aggregates)
+
+    def _build(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+               aggregates: Optional[GroupedAggregates]):
+        """Create the analyzers over the employees and route their public methods through the cache"""
+        if isinstance(employees, list):
+            employees = as_employee_table(employees)
+        self.employees = employees
+        if aggregates is None:
+            aggregates = employees.aggregates if isinstance(employees, EmployeeManager) else aggregate(employees)
+        self.aggregates = aggregates
+
+        self.demographic_analyzer = DemographicAnalyzer.DemographicAnalyzer(employees, self.aggregates)
+        self.turnover_analyzer = TurnoverAnalyzer.TurnoverAnalyzer(employees, self.aggregates)
+        self.education_analyzer = EducationAnalyzer.EducationAnalyzer(employees, self.aggregates)
+        self.career_analyzer = CareerDevelompentAnalyzer.CareerDevelopmentAnalyzer(employees, self.aggregates)
+        self.strategy_advisor = HRStrategyAdvisor.HRStrategyAdvisor(
+            employees, self.aggregates, turnover_analyzer=self.turnover_analyzer, career_analyzer=self.career_analyzer)
+
+        for name in self.ANALYZER_NAMES:
+            self._install_cache(name)
+
+    @property
+    def table(self) -> EmployeeTable:
+        """Employees of the session as a table"""
+        return as_employee_table(self.employees)
+
+    def _install_cache(self, name: str):
+        """Shadow the public methods of an analyzer instance with cached versions"""
+        analyzer = getattr(self, name)
+        for method in dir(type(analyzer)):
+            if method.startswith('_') or method.startswith('generate_') or not callable(getattr(type(analyzer), method)):
+                continue
+            setattr(analyzer, method, self._cached_method(name, method))
+
+    def _cached_method(self, name: str, method: str):
+        """Return a function calling analyzer method through the cache"""
+        def cached(*args, **kwargs):
+            return self.run(name, method, *args, **kwargs)
+        cached.__name__ = method
+        return cached
+
+    def run(self, name: str, method: str, *args, **kwargs) -> Any:
+        """
+        Get the result of an analyzer method, computing it only on the first call
+
+        Args:
+            name: Analyzer attribute name (e.g. 'turnover_analyzer')
+            method: Method name (e.g. 'calculate_turnover_rates')
+            *args, **kwargs: Method arguments; results of calls with unhashable arguments
+                (e.g. a list of dates) or with seed=None (a fresh random draw, e.g.
+                simulate_economic_effect) are computed without being cached
+        """
+        analyzer = getattr(self, name)
+        # The class function, not the instance attribute (which is the cached wrapper)
+        function = getattr(type(analyzer), method)
+
+        # Normalize arguments so f(), f(2.0) and f(tenure_threshold=2.0) share one entry
+        arguments = inspect.signature(function).bind(analyzer, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (name, method, tuple(arguments.arguments.items())[1:], self.version)
+        if 'seed' in arguments.arguments and arguments.arguments['seed'] is None:
+            return function(analyzer, *args, **kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return function(analyzer, *args, **kwargs)
+
+        if key not in self.cache:
+            self.cache[key] = function(analyzer, *args, **kwargs)
+        return self.cache[key]
+
+    def set_employees(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                      aggregates: Optional[GroupedAggregates] = None):
+        """Replace the dataset (or refresh it after manager changes), dropping results of the previous version"""
+        self.version += 1
+        self.cache = {key: value for key, value in self.cache.items() if key[-1] == self.version}
+        self.as_of_sessions = {}
+        self._build(employees, aggregates)
+
+    def as_of(self, current_date: Union[pd.Timestamp, str]) -> 'AnalysisSession':
+        """
+        Session over the same employees with age, tenure and age group calculated at another date
+
+        Sessions are kept per date (until set_employees), each with its own result cache, so
+        time-travel reports (e.g. month-end snapshots over a year) recompute derived columns
+        and aggregates once per date and never reload the data.
+
+        Args:
+            current_date: Date to calculate at (Timestamp or ISO string)
+        """
+        current_date = pd.Timestamp(current_date)
+        if current_date not in self.as_of_sessions:
+            if isinstance(self.employees, EmployeeManager):
+                table = self.employees.as_of(current_date)
+            else:
+                table = self.table.as_of(current_date)
+            self.as_of_sessions[current_date] = AnalysisSession(table)
+        return self.as_of_sessions[current_date]
+
+    def get_cache_info(self) -> Dict[str, int]:
+        """Number of cached results per analyzer"""
+        info = {name: 0 for name in self.ANALYZER_NAMES}
+        for key in self.cache:
+            info[key[0]] += 1
+        return info
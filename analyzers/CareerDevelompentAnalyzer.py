@@ -1,167 +1,307 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, List
-from employee import Employee
+from typing import Dict, List, Optional, Sequence, Union
+from employee import Employee, EmployeeManager, EmployeeTable, as_employee_table
+from analyzers.AggregationEngine import GroupedAggregates, aggregate, matching_aggregates
 
 
 class CareerDevelopmentAnalyzer:
     """Handles all career development analysis tasks"""
 
-    def __init__(self, employees: List[Employee]):
+    # Promotion readiness categories and the scores they start at
+    READINESS_CATEGORIES = ["Needs development", "Developing - 6-12 months", "Ready for promotion"]
+    READINESS_BOUNDS = [60, 80]
+    EDUCATION_POINTS = {
+        'Доктор наук': 10,
+        'Кандидат наук': 9,
+        'Магистратура': 8,
+        'Высшее': 6,
+        'Среднее специальное': 4
+    }
+    # Performance thresholds of count_high_potential_sweep by default
+    SWEEP_PERFORMANCE_THRESHOLDS = tuple(float(threshold) for threshold in range(70, 96))
+
+    def __init__(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                 aggregates: Optional[GroupedAggregates] = None):
         self.employees = employees
+        self._table = None
+        self.aggregates = aggregates
+        self._performance_index = None
+        # Dedicated aggregates per performance threshold other than the shared one
+        self._threshold_aggregates = {}
+
+    @property
+    def table(self) -> EmployeeTable:
+        """Employees as a table (converted on first use)"""
+        if self._table is None:
+            self._table = as_employee_table(self.employees)
+        return self._table
+
+    def _get_aggregates(self, performance_threshold: float = 85.0) -> GroupedAggregates:
+        """Shared aggregates of the table (computed on first use), or a dedicated run (once) for another threshold"""
+        if self.aggregates is None:
+            self.aggregates = aggregate(self.table)
+        if self.aggregates.performance_threshold == performance_threshold:
+            return self.aggregates
+        if performance_threshold not in self._threshold_aggregates:
+            self._threshold_aggregates[performance_threshold] = matching_aggregates(
+                self.aggregates, self.table, self.aggregates.tenure_threshold, performance_threshold)
+        return self._threshold_aggregates[performance_threshold]
 
     def analyze_team_lead_distribution(self) -> Dict:
         """Analyze the distribution of team lead positions by departments"""
-        department_team_leads = {}
-
-        for emp in self.employees:
-            dept = emp.department_name
-            if dept not in department_team_leads:
-                department_team_leads[dept] = {'total': 0, 'team_leads': 0}
-
-            department_team_leads[dept]['total'] += 1
-            if emp.is_team_lead:
-                department_team_leads[dept]['team_leads'] += 1
+        aggregates = self._get_aggregates()
+        totals = aggregates.marginal('count', ['department_name'])
+        team_leads = aggregates.marginal('team_leads', ['department_name'])
 
         result = {}
-        for dept, data in department_team_leads.items():
-            team_lead_ratio = (data['team_leads'] / data['total']) * 100
+        for code in aggregates.group_keys('department_name'):
+            dept = aggregates.label('department_name', code)
+            total = int(totals[code])
+            team_lead_count = int(team_leads[code])
+            team_lead_ratio = (team_lead_count / total) * 100
             result[dept] = {
-                'total_employees': data['total'],
-                'team_lead_count': data['team_leads'],
+                'total_employees': total,
+                'team_lead_count': team_lead_count,
                 'team_lead_ratio': round(team_lead_ratio, 1),
-                'team_lead_density': round(data['total'] / max(data['team_leads'], 1), 1)  # Employees per team lead
+                'team_lead_density': round(total / max(team_lead_count, 1), 1)  # Employees per team lead
             }
 
         return dict(sorted(result.items(), key=lambda x: x[1]['team_lead_ratio'], reverse=True))
 
     def calculate_average_promotion_time(self) -> Dict:
         """Determine the average time before promotion to team lead"""
-        team_leads = [emp for emp in self.employees if emp.is_team_lead]
+        aggregates = self._get_aggregates()
+        team_lead_count = int(aggregates.marginal('team_leads'))
 
-        if not team_leads:
+        if not team_lead_count:
             return {'average_tenure': 0, 'count': 0}
 
-        tenures = [emp.tenure_years for emp in team_leads]
-        experiences = [emp.experience_years for emp in team_leads]
-
         return {
-            'average_tenure_to_promotion': round(sum(tenures) / len(tenures), 1),
-            'average_experience_at_promotion': round(sum(experiences) / len(experiences), 1),
-            'min_tenure': round(min(tenures), 1),
-            'max_tenure': round(max(tenures), 1),
-            'team_lead_count': len(team_leads),
-            'tenure_distribution': self._categorize_tenure(tenures)
+            'average_tenure_to_promotion': round(float(aggregates.marginal('team_lead_tenure') / team_lead_count), 1),
+            'average_experience_at_promotion': round(
+                float(aggregates.marginal('team_lead_experience') / team_lead_count), 1),
+            'min_tenure': round(float(aggregates.marginal('team_lead_tenure_min')), 1),
+            'max_tenure': round(float(aggregates.marginal('team_lead_tenure_max')), 1),
+            'team_lead_count': team_lead_count,
+            'tenure_distribution': {
+                '0-2 years': int(aggregates.marginal('team_lead_tenure_0_2')),
+                '2-5 years': int(aggregates.marginal('team_lead_tenure_2_5')),
+                '5-10 years': int(aggregates.marginal('team_lead_tenure_5_10')),
+                '10+ years': int(aggregates.marginal('team_lead_tenure_10_plus'))
+            }
         }
 
-    def _categorize_tenure(self, tenures: List[float]) -> Dict:
-        """Categorize tenure into groups"""
-        categories = {
-            '0-2 years': 0,
-            '2-5 years': 0,
-            '5-10 years': 0,
-            '10+ years': 0
-        }
+    def _rank_rows(self, rows: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+        """
+        Order rows by performance score, then rounded tenure (both descending), keeping the best k
+
+        Only rows that can make the top k are sorted: the k-th best performance score is
+        found by partial selection first, so ranking costs O(n + k log k) for n rows.
+        Ties keep table order.
+
+        Args:
+            rows: Table rows in ascending order
+            k: Number of rows to keep (all if None)
+        """
+        performance = self.table.performance_score[rows]
+        if k is not None and len(rows) > k:
+            if k <= 0:
+                return rows[:0]
+            kth_best = np.partition(performance, len(rows) - k)[len(rows) - k]
+            survivors = performance >= kth_best
+            rows = rows[survivors]
+            performance = performance[survivors]
+
+        rounded_tenure = np.round(self.table.tenure_years[rows], 1)
+        return rows[np.lexsort((-rounded_tenure, -performance))][:k]
+
+    def _high_potential_records(self, rows: np.ndarray) -> List[Dict]:
+        """Report entries of the high-potential employees in the given table rows"""
+        table = self.table
+        readiness = self._score_promotion_readiness(rows)['category']
+        return [{
+            'employee_id': int(table.employee_id[row]),
+            'name': f"{table.first_name[row]} {table.last_name[row]}",
+            'department': table.categories['department_name'][table.codes['department_name'][row]],
+            'position': table.categories['position'][table.codes['position'][row]],
+            'performance_score': table.performance_value(row),
+            'tenure_years': round(float(table.tenure_years[row]), 1),
+            'experience_years': int(table.experience_years[row]),
+            'education': table.categories['education'][table.codes['education'][row]],
+            'salary': int(table.salary[row]),
+            'promotion_readiness': self.READINESS_CATEGORIES[category]
+        } for row, category in zip(rows, readiness)]
+
+    def _high_potential_by_department(self, performance_threshold: float) -> Dict[int, np.ndarray]:
+        """High-potential rows per department code (each in table order)"""
+        candidates = self._get_aggregates(performance_threshold).high_potential_rows
+        department_codes = self.table.codes['department_name'][candidates]
+        order = np.argsort(department_codes, kind='stable')
+        codes, starts = np.unique(department_codes[order], return_index=True)
+        groups = np.split(candidates[order], starts[1:])
+        return {int(code): rows for code, rows in zip(codes, groups)}
+
+    def find_high_potential_employees(self, performance_threshold: float = 85.0, top_k: int = 20,
+                                      department_limit: int = 20) -> Dict:
+        """
+        Find employees with a high performance_score but without a team lead position
+
+        Only the returned employees are turned into report entries and scored for
+        promotion readiness; use get_high_potential_page for further pages.
+
+        Args:
+            performance_threshold: Minimum performance score
+            top_k: Number of best employees in high_potential_employees
+            department_limit: Maximum number of employees listed per department in by_department
+        """
+        table = self.table
+        # Not team leads, performance >= threshold and at least 1 year tenure
+        candidates = self._get_aggregates(performance_threshold).high_potential_rows
+        by_department_rows = self._high_potential_by_department(performance_threshold)
+
+        # Departments in order of their best employee
+        best_rows = np.array([self._rank_rows(rows, 1)[0] for rows in by_department_rows.values()], dtype=np.int64)
+        department_order = [table.codes['department_name'][row] for row in self._rank_rows(np.sort(best_rows))]
 
-        for tenure in tenures:
-            if tenure <= 2:
-                categories['0-2 years'] += 1
-            elif tenure <= 5:
-                categories['2-5 years'] += 1
-            elif tenure <= 10:
-                categories['5-10 years'] += 1
-            else:
-                categories['10+ years'] += 1
-
-        return categories
-
-    def find_high_potential_employees(self, performance_threshold: float = 85.0) -> Dict:
-        """Find employees with a high performance_score but without a team lead position"""
-        high_potential = []
-
-        for emp in self.employees:
-            if (not emp.is_team_lead and
-                    emp.performance_score >= performance_threshold and
-                    emp.tenure_years >= 1.0):  # At least 1 year tenure
-
-                high_potential.append({
-                    'employee_id': emp.employee_id,
-                    'name': f"{emp.first_name} {emp.last_name}",
-                    'department': emp.department_name,
-                    'position': emp.position,
-                    'performance_score': emp.performance_score,
-                    'tenure_years': round(emp.tenure_years, 1),
-                    'experience_years': emp.experience_years,
-                    'education': emp.education,
-                    'salary': emp.salary,
-                    'promotion_readiness': self._calculate_promotion_readiness(emp)
-                })
-
-        # Sort by performance score and tenure
-        high_potential.sort(key=lambda x: (-x['performance_score'], -x['tenure_years']))
-
-        # Group by department
         by_department = {}
-        for emp in high_potential:
-            dept = emp['department']
-            if dept not in by_department:
-                by_department[dept] = []
-            by_department[dept].append(emp)
+        department_summary = {}
+        for code in department_order:
+            dept = table.categories['department_name'][code]
+            rows = by_department_rows[int(code)]
+            by_department[dept] = self._high_potential_records(self._rank_rows(rows, department_limit))
+            department_summary[dept] = len(rows)
 
         return {
-            'total_high_potential': len(high_potential),
-            'high_potential_employees': high_potential[:20],  # Top 20
+            'total_high_potential': len(candidates),
+            'high_potential_employees': self._high_potential_records(self._rank_rows(candidates, top_k)),
             'by_department': by_department,
-            'department_summary': {dept: len(emps) for dept, emps in by_department.items()}
+            'department_summary': department_summary
         }
 
-    def _calculate_promotion_readiness(self, employee: Employee) -> str:
-        """Calculate promotion readiness score"""
-        score = 0
-
-        # Performance (max 40 points)
-        if employee.performance_score >= 90:
-            score += 40
-        elif employee.performance_score >= 80:
-            score += 30
-        elif employee.performance_score >= 70:
-            score += 20
-        else:
-            score += 10
-
-        # Tenure (max 30 points)
-        if employee.tenure_years >= 3:
-            score += 30
-        elif employee.tenure_years >= 2:
-            score += 20
-        elif employee.tenure_years >= 1:
-            score += 10
-
-        # Experience (max 20 points)
-        if employee.experience_years >= 10:
-            score += 20
-        elif employee.experience_years >= 5:
-            score += 15
-        elif employee.experience_years >= 2:
-            score += 10
+    def get_high_potential_page(self, department: Optional[str] = None, offset: int = 0, limit: int = 20,
+                                performance_threshold: float = 85.0) -> List[Dict]:
+        """
+        Get one page of the ranked high-potential employees
+
+        Args:
+            department: Department to list (all departments if None)
+            offset: Number of best employees to skip
+            limit: Page size
+            performance_threshold: Minimum performance score
+        """
+        if department is None:
+            rows = self._get_aggregates(performance_threshold).high_potential_rows
         else:
-            score += 5
-
-        # Education (max 10 points)
-        education_points = {
-            'Доктор наук': 10,
-            'Кандидат наук': 9,
-            'Магистратура': 8,
-            'Высшее': 6,
-            'Среднее специальное': 4
+            code = self.table.code_of('department_name', department)
+            rows = self._high_potential_by_department(performance_threshold).get(code, np.array([], dtype=np.int64))
+        return self._high_potential_records(self._rank_rows(rows, offset + limit)[offset:])
+
+    def _get_performance_index(self) -> Dict[str, np.ndarray]:
+        """
+        Department -> sorted performance scores of the employees who can be high potential
+
+        Only employees who are not team leads and have at least 1 year tenure are indexed.
+        Their scores in department code c are performance[starts[c]:ends[c]], in ascending
+        order; codes lists the departments with employees in order of first appearance.
+        """
+        if self._performance_index is None:
+            table = self.table
+            dept_codes = table.codes['department_name']
+            eligible = np.flatnonzero(~table.is_team_lead & (table.tenure_years >= 1.0))
+            performance = table.performance_score[eligible]
+            eligible_codes = dept_codes[eligible]
+            order = np.lexsort((performance, eligible_codes))
+            ends = np.cumsum(np.bincount(eligible_codes, minlength=len(table.categories['department_name'])))
+            present, first_rows = np.unique(dept_codes, return_index=True)
+            self._performance_index = {
+                'codes': present[np.argsort(first_rows, kind='stable')],
+                'performance': performance[order],
+                'starts': np.r_[0, ends[:-1]],
+                'ends': ends
+            }
+        return self._performance_index
+
+    def count_high_potential_sweep(self, performance_thresholds: Sequence[float] = SWEEP_PERFORMANCE_THRESHOLDS) -> Dict:
+        """
+        Count the high-potential employees of every department for many performance thresholds at once
+
+        Performance scores are sorted per department once; every threshold is then a binary
+        search per department, so a sweep costs about as much as a single threshold.
+
+        Args:
+            performance_thresholds: Minimum performance scores (70 to 95 by default)
+
+        Returns:
+            Dictionary with the departments (in order of first appearance), the thresholds,
+            eligible (employees per department who are not team leads and have at least
+            1 year tenure) and the department x threshold array high_potential_count
+        """
+        thresholds = np.asarray(performance_thresholds, dtype=np.float64)
+        index = self._get_performance_index()
+        codes = index['codes']
+
+        counts = np.zeros((len(codes), len(thresholds)), dtype=np.int64)
+        for position, code in enumerate(codes):
+            performance = index['performance'][index['starts'][code]:index['ends'][code]]
+            counts[position] = len(performance) - np.searchsorted(performance, thresholds, side='left')
+
+        return {
+            'departments': [self.table.categories['department_name'][code] for code in codes],
+            'thresholds': thresholds,
+            'eligible': (index['ends'] - index['starts'])[codes],
+            'high_potential_count': counts
         }
-        score += education_points.get(employee.education, 5)
 
-        if score >= 80:
-            return "Ready for promotion"
-        elif score >= 60:
-            return "Developing - 6-12 months"
-        else:
-            return "Needs development"
+    def _score_promotion_readiness(self, rows: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Promotion readiness of many employees at once
+
+        Args:
+            rows: Table rows to score (all employees if None)
+
+        Returns:
+            Dictionary with the 'score' (0-100) and 'category' (index into READINESS_CATEGORIES) arrays
+        """
+        table = self.table
+        selection = slice(None) if rows is None else rows
+        performance_score = table.performance_score[selection]
+        tenure_years = table.tenure_years[selection]
+        experience_years = table.experience_years[selection]
+        education_points = np.array([self.EDUCATION_POINTS.get(education, 5)
+                                     for education in table.categories['education']], dtype=np.int8)
+
+        score = (
+            # Performance (max 40 points)
+            np.select([performance_score >= 90, performance_score >= 80, performance_score >= 70],
+                      [40, 30, 20], 10) +
+            # Tenure (max 30 points)
+            np.select([tenure_years >= 3, tenure_years >= 2, tenure_years >= 1], [30, 20, 10], 0) +
+            # Experience (max 20 points)
+            np.select([experience_years >= 10, experience_years >= 5, experience_years >= 2], [20, 15, 10], 5) +
+            # Education (max 10 points)
+            education_points[table.codes['education'][selection]]
+        ).astype(np.int8)
+
+        return {
+            'score': score,
+            'category': np.digitize(score, self.READINESS_BOUNDS).astype(np.int8)
+        }
+
+    def calculate_promotion_readiness_scores(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate the promotion readiness of the whole workforce
+
+        Returns:
+            Dictionary with per-employee arrays in table order: 'score' (0-100, int8) and
+            'category' (int8 index into READINESS_CATEGORIES)
+        """
+        return self._score_promotion_readiness()
+
+    def _calculate_promotion_readiness(self, row: int) -> str:
+        """Calculate promotion readiness score of the employee in the given table row"""
+        category = self._score_promotion_readiness(np.array([row]))['category'][0]
+        return self.READINESS_CATEGORIES[category]
 
     def generate_career_development_report(self):
         """Generate comprehensive career development report"""
@@ -1,56 +1,56 @@
 import pandas as pd
-from typing import Dict, List, Tuple
-from employee import Employee
+from typing import Dict, List, Optional, Tuple, Union
+from employee import Employee, EmployeeManager, EmployeeTable, AGE_GROUPS, as_employee_table
+from analyzers.AggregationEngine import GroupedAggregates, aggregate
 
 
 class DemographicAnalyzer:
     """Handles all demographic analysis tasks"""
 
-    def __init__(self, employees: List[Employee]):
+    def __init__(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                 aggregates: Optional[GroupedAggregates] = None):
         self.employees = employees
+        self._table = None
+        self.aggregates = aggregates
+
+    @property
+    def table(self) -> EmployeeTable:
+        """Employees as a table (converted on first use)"""
+        if self._table is None:
+            self._table = as_employee_table(self.employees)
+        return self._table
+
+    def _get_aggregates(self) -> GroupedAggregates:
+        """Shared aggregates of the table (computed on first use)"""
+        if self.aggregates is None:
+            self.aggregates = aggregate(self.table)
+        return self.aggregates
 
     def calculate_gender_age_distribution(self) -> Dict:
         """Calculate the distribution of employees by gender and age"""
+        aggregates = self._get_aggregates()
+        genders = aggregates.categories['gender']
         gender_count = {'male': 0, 'female': 0}
-        age_groups = {
-            '18-25': {'male': 0, 'female': 0, 'total': 0},
-            '26-35': {'male': 0, 'female': 0, 'total': 0},
-            '36-45': {'male': 0, 'female': 0, 'total': 0},
-            '46-55': {'male': 0, 'female': 0, 'total': 0},
-            '56-65': {'male': 0, 'female': 0, 'total': 0},
-            '65+': {'male': 0, 'female': 0, 'total': 0}
-        }
+        for gender, count in zip(genders, aggregates.marginal('count', ['gender'])):
+            gender_count[gender] = int(count)
+
+        pair_counts = aggregates.marginal('count', ['age_group', 'gender'])
+        age_groups = {}
+        for group_code, age_group in enumerate(AGE_GROUPS):
+            age_groups[age_group] = {'male': 0, 'female': 0, 'total': 0}
+            for gender_code, gender in enumerate(genders):
+                age_groups[age_group][gender] = int(pair_counts[group_code, gender_code])
+            age_groups[age_group]['total'] = int(pair_counts[group_code].sum())
 
-        for emp in self.employees:
-            # Count gender
-            gender_count[emp.gender] += 1
-
-            # Categorize by age
-            age = emp.age
-            if age <= 25:
-                age_group = '18-25'
-            elif age <= 35:
-                age_group = '26-35'
-            elif age <= 45:
-                age_group = '36-45'
-            elif age <= 55:
-                age_group = '46-55'
-            elif age <= 65:
-                age_group = '56-65'
-            else:
-                age_group = '65+'
-
-            age_groups[age_group][emp.gender] += 1
-            age_groups[age_group]['total'] += 1
-
-        total_employees = len(self.employees)
+        total_employees = aggregates.total
 
         return {
             'gender_distribution': {
                 'count': gender_count,
+                # No percentages of an empty workforce (e.g. an as-of date before every hire)
                 'percentage': {
-                    'male': round(gender_count['male'] / total_employees * 100, 1),
-                    'female': round(gender_count['female'] / total_employees * 100, 1)
+                    'male': round(gender_count['male'] / total_employees * 100, 1) if total_employees else 0.0,
+                    'female': round(gender_count['female'] / total_employees * 100, 1) if total_employees else 0.0
                 }
             },
             'age_gender_distribution': age_groups,
@@ -59,47 +59,48 @@ class DemographicAnalyzer:
 
     def calculate_average_age_by_department(self) -> Dict:
         """Determine the average age by department"""
-        department_ages = {}
-
-        for emp in self.employees:
-            dept = emp.department_name
-            if dept not in department_ages:
-                department_ages[dept] = []
-            department_ages[dept].append(emp.age)
+        aggregates = self._get_aggregates()
+        counts = aggregates.marginal('count', ['department_name'])
+        age_sums = aggregates.marginal('age', ['department_name'])
+        min_ages = aggregates.marginal('age_min', ['department_name'])
+        max_ages = aggregates.marginal('age_max', ['department_name'])
 
         result = {}
-        for dept, ages in department_ages.items():
-            avg_age = sum(ages) / len(ages)
+        for code in aggregates.group_keys('department_name'):
+            dept = aggregates.label('department_name', code)
+            avg_age = age_sums[code] / counts[code]
             result[dept] = {
-                'average_age': round(avg_age, 1),
-                'employee_count': len(ages),
-                'min_age': round(min(ages), 1),
-                'max_age': round(max(ages), 1),
-                'age_range': round(max(ages) - min(ages), 1)
+                'average_age': round(float(avg_age), 1),
+                'employee_count': int(counts[code]),
+                'min_age': round(float(min_ages[code]), 1),
+                'max_age': round(float(max_ages[code]), 1),
+                'age_range': round(float(max_ages[code] - min_ages[code]), 1)
             }
 
         return dict(sorted(result.items(), key=lambda x: x[1]['average_age'], reverse=True))
 
     def find_gender_imbalance(self) -> Dict:
         """Find the departments with the greatest gender imbalance"""
-        department_gender = {}
-
-        for emp in self.employees:
-            dept = emp.department_name
-            if dept not in department_gender:
-                department_gender[dept] = {'male': 0, 'female': 0}
-            department_gender[dept][emp.gender] += 1
+        aggregates = self._get_aggregates()
+        genders = aggregates.categories['gender']
+        # Without employees there are no department x gender counts (and no departments below)
+        pair_counts = aggregates.marginal('count', ['department_name', 'gender']) if aggregates.total else None
 
         result = {}
-        for dept, genders in department_gender.items():
-            total = genders['male'] + genders['female']
-            male_percentage = (genders['male'] / total) * 100
-            female_percentage = (genders['female'] / total) * 100
+        for code in aggregates.group_keys('department_name'):
+            dept = aggregates.label('department_name', code)
+            genders_count = {'male': 0, 'female': 0}
+            for gender_code, gender in enumerate(genders):
+                genders_count[gender] = int(pair_counts[code, gender_code])
+
+            total = genders_count['male'] + genders_count['female']
+            male_percentage = (genders_count['male'] / total) * 100
+            female_percentage = (genders_count['female'] / total) * 100
             imbalance_score = abs(male_percentage - 50)  # Distance from perfect balance
 
             result[dept] = {
-                'male_count': genders['male'],
-                'female_count': genders['female'],
+                'male_count': genders_count['male'],
+                'female_count': genders_count['female'],
                 'total_employees': total,
                 'male_percentage': round(male_percentage, 1),
                 'female_percentage': round(female_percentage, 1),
@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Sequence, Union
+from employee import EmployeeManager, EmployeeTable, as_employee_table, load_employee_table
+from json_stream import iter_json_array
+from analyzers.ProjectAnalyzer import ProjectAnalyzer, ProjectTable, load_projects
+from analyzers.EquipmentAnalyzer import EquipmentTable, load_equipment
+
+
+class KeyIndex:
+    """Hash index of integer keys (e.g. department_id) to their positions
+
+    Lookups of whole key arrays are one vectorized hash probe; keys that are not indexed
+    get position -1 and are left out of rollups.
+    """
+
+    def __init__(self, keys: Sequence[int]):
+        self.keys = np.asarray(keys, dtype=np.int64)
+        self._index = pd.Index(self.keys)
+        if not self._index.is_unique:
+            raise ValueError("Index keys must be unique")
+
+    def __len__(self) -> int:
+        """Return number of keys"""
+        return len(self.keys)
+
+    def positions(self, keys: Sequence[int]) -> np.ndarray:
+        """Position of every key (-1 for keys that are not indexed)"""
+        return self._index.get_indexer(np.asarray(keys, dtype=np.int64))
+
+    def rollup(self, positions: np.ndarray, values: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sum values (or count rows if None) per indexed key, given the rows' positions"""
+        matched = positions >= 0
+        weights = None if values is None else np.asarray(values, dtype=np.float64)[matched]
+        return np.bincount(positions[matched], weights=weights, minlength=len(self))
+
+
+class DepartmentJoin:
+    """Per-department fact table joining every section of company.json on department_id
+
+    The departments section is the dimension: a KeyIndex on its ids is built once, and
+    every other source (employees, kpi_metrics, project allocations, equipment) is mapped
+    to it with one vectorized probe and rolled up with bincounts, so there are no nested
+    loops over departments and rows.
+    """
+
+    def __init__(self, departments: List[Dict[str, Any]],
+                 employees: Union[EmployeeTable, EmployeeManager, None] = None,
+                 kpi_metrics: Optional[List[Dict[str, Any]]] = None,
+                 projects: Optional[ProjectTable] = None,
+                 equipment: Optional[EquipmentTable] = None,
+                 tenure_threshold: float = 2.0):
+        """
+        Args:
+            departments: Records of the departments section (id, name, type, budget)
+            employees: Employees to roll up (headcount, salaries, turnover)
+            kpi_metrics: Records of the kpi_metrics section
+            projects: Projects to roll up by allocation
+            equipment: Equipment to roll up
+            tenure_threshold: Tenure in years below which an employee counts as short tenure
+        """
+        self.departments = departments
+        self.index = KeyIndex([department['id'] for department in departments])
+        self.employees = employees
+        self.kpi_metrics = kpi_metrics
+        self.projects = projects
+        self.equipment = equipment
+        self.tenure_threshold = tenure_threshold
+        self._facts = None
+
+    @classmethod
+    def from_file(cls, file_path: str, employees: Union[EmployeeTable, EmployeeManager, None] = None,
+                  tenure_threshold: float = 2.0) -> 'DepartmentJoin':
+        """
+        Load every section of a JSON file and join them
+
+        Args:
+            file_path: Path to JSON file
+            employees: Already loaded employees (loaded from the file if None)
+            tenure_threshold: Tenure in years below which an employee counts as short tenure
+        """
+        return cls(list(iter_json_array(file_path, 'departments')),
+                   employees if employees is not None else load_employee_table(file_path),
+                   list(iter_json_array(file_path, 'kpi_metrics')),
+                   load_projects(file_path),
+                   load_equipment(file_path),
+                   tenure_threshold)
+
+    def _employee_columns(self) -> Dict[str, np.ndarray]:
+        """Headcount, payroll, performance and turnover rolled up from the employees"""
+        table = as_employee_table(self.employees)
+        positions = self.index.positions(table.department_id)
+        headcount = self.index.rollup(positions)
+        payroll = self.index.rollup(positions, table.salary)
+        short_tenure = self.index.rollup(positions, table.tenure_years < self.tenure_threshold)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'headcount': headcount.astype(np.int64),
+                'payroll': payroll,
+                'average_salary': payroll / headcount,
+                'average_performance': self.index.rollup(positions, table.performance_score) / headcount,
+                'team_lead_count': self.index.rollup(positions, table.is_team_lead).astype(np.int64),
+                'short_tenure_count': short_tenure.astype(np.int64),
+                'turnover_rate': short_tenure / headcount * 100
+            }
+
+    def _kpi_columns(self) -> Dict[str, np.ndarray]:
+        """KPI blocks flattened to kpi.<section>.<field> columns, aligned to the departments"""
+        frame = pd.json_normalize(self.kpi_metrics)
+        positions = self.index.positions(frame['department_id'])
+        matched = positions >= 0
+        columns = {}
+        for name in frame.columns:
+            if name in ('department_id', 'department_name'):
+                continue
+            values = frame[name].to_numpy(dtype=np.float64)
+            column = np.full(len(self.index), np.nan)
+            column[positions[matched]] = values[matched]
+            columns[f'kpi.{name}'] = column
+        return columns
+
+    def _project_columns(self) -> Dict[str, np.ndarray]:
+        """Project load, exposure, overrun and risk from the department x project matrix"""
+        analyzer = ProjectAnalyzer(self.projects)
+        metrics = analyzer.get_department_metrics()
+        positions = self.index.positions(analyzer.matrix.department_ids)
+        return {name: self.index.rollup(positions, values).astype(values.dtype) for name, values in metrics.items()}
+
+    def _equipment_columns(self) -> Dict[str, np.ndarray]:
+        """Asset counts, value and maintenance cost rolled up from the equipment"""
+        equipment = self.equipment
+        positions = self.index.positions(equipment.department_id)
+        count = self.index.rollup(positions)
+        operational_code = (equipment.categories['status'].index('operational')
+                            if 'operational' in equipment.categories['status'] else -1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'equipment_count': count.astype(np.int64),
+                'operational_equipment_count': self.index.rollup(
+                    positions, equipment.codes['status'] == operational_code).astype(np.int64),
+                'equipment_value': self.index.rollup(positions, equipment.cost),
+                'maintenance_cost_per_month': self.index.rollup(positions, equipment.maintenance_cost_per_month),
+                'average_equipment_efficiency': self.index.rollup(positions, equipment.efficiency_percentage) / count
+            }
+
+    def get_fact_table(self) -> pd.DataFrame:
+        """
+        Denormalized per-department fact table indexed by department_id (built once)
+
+        Columns come from the departments section (name, type, budget), the employee
+        rollups, cost_per_employee (budget per employee), the project and equipment rollups
+        and the kpi.* blocks, for the sources the join was given. Departments without rows
+        in a source get 0 counts and NaN averages.
+        """
+        if self._facts is None:
+            columns = {
+                'department_name': [department['name'] for department in self.departments],
+                'type': [department.get('type') for department in self.departments],
+                'budget': np.array([department.get('budget', np.nan) for department in self.departments],
+                                   dtype=np.float64)
+            }
+            if self.employees is not None:
+                columns.update(self._employee_columns())
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    columns['cost_per_employee'] = columns['budget'] / columns['headcount']
+            if self.projects is not None:
+                columns.update(self._project_columns())
+            if self.equipment is not None:
+                columns.update(self._equipment_columns())
+            if self.kpi_metrics is not None:
+                columns.update(self._kpi_columns())
+
+            self._facts = pd.DataFrame(columns, index=pd.Index(self.index.keys, name='department_id'))
+        return self._facts
+
+    def get_department(self, department_id: int, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Facts of one department (a single hash lookup into the fact table)
+
+        Args:
+            department_id: Department to look up
+            columns: Fact columns to return (all if None)
+        """
+        position = self.index.positions([department_id])[0]
+        if position < 0:
+            raise KeyError(department_id)
+        row = self.get_fact_table().iloc[position]
+        return (row if columns is None else row[list(columns)]).to_dict()
+
+    def compare(self, x: str, y: str) -> pd.DataFrame:
+        """
+        Two fact columns side by side for every department, with their correlation in attrs
+
+        Args:
+            x: Fact column (e.g. 'cost_per_employee')
+            y: Fact column (e.g. 'turnover_rate')
+        """
+        facts = self.get_fact_table()
+        result = facts[['department_name', x, y]]
+        result.attrs['correlation'] = float(facts[x].corr(facts[y]))
+        return result
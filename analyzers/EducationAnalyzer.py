@@ -1,14 +1,18 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List
-from employee import Employee
+from typing import Dict, List, Optional, Union
+from employee import Employee, EmployeeManager, EmployeeTable, HIGHER_EDUCATION, as_employee_table
+from analyzers.AggregationEngine import GroupedAggregates, aggregate
 
 
 class EducationAnalyzer:
     """Handles all educational analytics tasks"""
 
-    def __init__(self, employees: List[Employee]):
+    def __init__(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                 aggregates: Optional[GroupedAggregates] = None):
         self.employees = employees
+        self._table = None
+        self.aggregates = aggregates
         self.education_hierarchy = {
             'Среднее специальное': 1,  # Vocational/Technical
             'Высшее': 2,  # Bachelor's
@@ -17,20 +21,29 @@ class EducationAnalyzer:
             'Доктор наук': 5  # Doctor of Sciences
         }
 
-    def calculate_education_distribution(self) -> Dict:
-        """Make a distribution of employees by education level"""
-        education_count = {}
+    @property
+    def table(self) -> EmployeeTable:
+        """Employees as a table (converted on first use)"""
+        if self._table is None:
+            self._table = as_employee_table(self.employees)
+        return self._table
 
-        for emp in self.employees:
-            education = emp.education
-            if education not in education_count:
-                education_count[education] = 0
-            education_count[education] += 1
+    def _get_aggregates(self) -> GroupedAggregates:
+        """Shared aggregates of the table (computed on first use)"""
+        if self.aggregates is None:
+            self.aggregates = aggregate(self.table)
+        return self.aggregates
 
-        total_employees = len(self.employees)
+    def calculate_education_distribution(self) -> Dict:
+        """Make a distribution of employees by education level"""
+        aggregates = self._get_aggregates()
+        counts = aggregates.marginal('count', ['education'])
+        total_employees = aggregates.total
 
         result = {}
-        for education, count in education_count.items():
+        for code in aggregates.group_keys('education'):
+            education = aggregates.label('education', code)
+            count = int(counts[code])
             result[education] = {
                 'count': count,
                 'percentage': round(count / total_employees * 100, 1),
@@ -53,25 +66,24 @@ class EducationAnalyzer:
 
     def analyze_education_salary_correlation(self) -> Dict:
         """Determine the correlation between education and salary"""
-        education_salaries = {}
-
-        for emp in self.employees:
-            education = emp.education
-            if education not in education_salaries:
-                education_salaries[education] = []
-            education_salaries[education].append(emp.salary)
+        aggregates = self._get_aggregates()
+        counts = aggregates.marginal('count', ['education'])
+        salary_sums = aggregates.marginal('salary', ['education'])
+        min_salaries = aggregates.marginal('salary_min', ['education'])
+        max_salaries = aggregates.marginal('salary_max', ['education'])
 
         # Calculate statistics
         result = {}
-        for education, salaries in education_salaries.items():
+        for code in aggregates.group_keys('education'):
+            education = aggregates.label('education', code)
             result[education] = {
                 'education_level': self.education_hierarchy[education],
-                'avg_salary': round(sum(salaries) / len(salaries)),
-                'median_salary': round(np.median(salaries)),
-                'min_salary': min(salaries),
-                'max_salary': max(salaries),
-                'salary_range': max(salaries) - min(salaries),
-                'employee_count': len(salaries),
+                'avg_salary': round(float(salary_sums[code] / counts[code])),
+                'median_salary': round(float(aggregates.salary_medians[code])),
+                'min_salary': int(min_salaries[code]),
+                'max_salary': int(max_salaries[code]),
+                'salary_range': int(max_salaries[code] - min_salaries[code]),
+                'employee_count': int(counts[code]),
                 'english_translation': self._translate_education(education)
             }
 
@@ -135,25 +147,21 @@ class EducationAnalyzer:
 
     def find_departments_with_higher_education(self) -> Dict:
         """Find the departments with the largest number of employees with higher education"""
-        higher_education = ['Магистратура', 'Кандидат наук', 'Доктор наук']
-        department_education = {}
-
-        for emp in self.employees:
-            dept = emp.department_name
-            if dept not in department_education:
-                department_education[dept] = {'total': 0, 'higher_ed': 0}
-
-            department_education[dept]['total'] += 1
-            if emp.education in higher_education:
-                department_education[dept]['higher_ed'] += 1
+        aggregates = self._get_aggregates()
+        totals = aggregates.marginal('count', ['department_name'])
+        education_counts = aggregates.marginal('count', ['department_name', 'education'])
+        higher_ed_codes = [code for code, education in enumerate(aggregates.categories['education'])
+                           if education in HIGHER_EDUCATION]
+        higher_ed_counts = education_counts[:, higher_ed_codes].sum(axis=1)
 
         result = {}
-        for dept, data in department_education.items():
-            higher_ed_percentage = (data['higher_ed'] / data['total']) * 100
+        for code in aggregates.group_keys('department_name'):
+            dept = aggregates.label('department_name', code)
+            higher_ed_percentage = (higher_ed_counts[code] / totals[code]) * 100
             result[dept] = {
-                'total_employees': data['total'],
-                'higher_education_count': data['higher_ed'],
-                'higher_education_percentage': round(higher_ed_percentage, 1),
+                'total_employees': int(totals[code]),
+                'higher_education_count': int(higher_ed_counts[code]),
+                'higher_education_percentage': round(float(higher_ed_percentage), 1),
                 'classification': self._classify_education_level(higher_ed_percentage)
             }
 
@@ -177,7 +185,6 @@ class EducationAnalyzer:
         # Education Distribution
         distribution = self.calculate_education_distribution()
         print(f"\n1. EDUCATION LEVEL DISTRIBUTION")
-        total_employees = len(self.employees)
         for education, data in distribution.items():
             print(f"  {education} ({data['english_translation']}):")
             print(f"    Count: {data['count']} ({data['percentage']}%)")
@@ -0,0 +1,358 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from employee import CURRENT_DATE, MICROSECONDS_PER_DAY
+from json_stream import iter_json_array
+
+
+def as_timestamps(dates: Union[pd.Timestamp, str, Sequence]) -> np.ndarray:
+    """Dates (Timestamps, ISO strings or datetime64 values) as microseconds since the epoch"""
+    return np.asarray(pd.DatetimeIndex(np.atleast_1d(dates)).values.astype('datetime64[us]').view(np.int64))
+
+
+def as_end_timestamps(dates: Union[pd.Timestamp, str, Sequence]) -> np.ndarray:
+    """Window ends as microseconds since the epoch; a date (midnight) covers its whole day"""
+    times = as_timestamps(dates)
+    return np.where(times % MICROSECONDS_PER_DAY == 0, times + MICROSECONDS_PER_DAY - 1, times)
+
+
+class EquipmentTable:
+    """Columnar storage of the equipment section of company.json
+
+    Numeric and date fields are NumPy arrays with one element per asset (dates as
+    datetime64[us]); type, department and status are dictionary-encoded like the
+    categorical fields of EmployeeTable.
+    """
+
+    NUMERIC_FIELDS = {
+        'department_id': np.int64,
+        'cost': np.int64,
+        'efficiency_percentage': np.float64,
+        'maintenance_cost_per_month': np.int64,
+        'hours_used_daily': np.float64,
+        'utilization_rate': np.float64
+    }
+    DATE_FIELDS = ['purchase_date', 'warranty_end_date', 'last_maintenance_date', 'next_maintenance_date']
+    CATEGORICAL_FIELDS = ['type', 'department_name', 'status']
+    TEXT_FIELDS = ['equipment_id', 'name']
+
+    def __init__(self, columns: Dict[str, np.ndarray], codes: Dict[str, np.ndarray],
+                 categories: Dict[str, List[str]]):
+        """
+        Initialize table from already encoded columns
+
+        Args:
+            columns: Numeric, date and text columns by field name
+            codes: Integer codes of the categorical fields
+            categories: Distinct labels of the categorical fields (code -> label)
+        """
+        self.columns = columns
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'EquipmentTable':
+        """
+        Build table from raw JSON equipment records
+
+        Args:
+            records: Iterable of equipment dictionaries in the company.json layout
+        """
+        data = {name: [] for name in list(cls.NUMERIC_FIELDS) + cls.DATE_FIELDS +
+                cls.CATEGORICAL_FIELDS + cls.TEXT_FIELDS}
+
+        for record in records:
+            purchase_info = record['purchase_info']
+            operational_info = record['operational_info']
+            utilization = record['utilization']
+
+            data['equipment_id'].append(record['equipment_id'])
+            data['name'].append(record['name'])
+            data['type'].append(record['type'])
+            data['department_id'].append(record['department_id'])
+            data['department_name'].append(record['department_name'])
+            data['purchase_date'].append(purchase_info['purchase_date'])
+            data['cost'].append(purchase_info['cost'])
+            data['warranty_end_date'].append(purchase_info['warranty_end_date'])
+            data['status'].append(operational_info['status'])
+            data['efficiency_percentage'].append(operational_info['efficiency_percentage'])
+            data['maintenance_cost_per_month'].append(operational_info['maintenance_cost_per_month'])
+            data['last_maintenance_date'].append(operational_info['last_maintenance_date'])
+            data['next_maintenance_date'].append(operational_info['next_maintenance_date'])
+            data['hours_used_daily'].append(utilization['hours_used_daily'])
+            data['utilization_rate'].append(utilization['utilization_rate'])
+
+        columns = {name: np.asarray(data[name], dtype=dtype) for name, dtype in cls.NUMERIC_FIELDS.items()}
+        for name in cls.DATE_FIELDS:
+            columns[name] = np.array(data[name], dtype='datetime64[us]')
+        for name in cls.TEXT_FIELDS:
+            columns[name] = np.asarray(data[name], dtype=object)
+
+        codes = {}
+        categories = {}
+        for name in cls.CATEGORICAL_FIELDS:
+            field_codes, labels = pd.factorize(np.asarray(data[name], dtype=object))
+            codes[name] = field_codes.astype(np.int32)
+            categories[name] = list(labels)
+
+        return cls(columns, codes, categories)
+
+    def __len__(self) -> int:
+        """Return number of assets"""
+        return len(self.columns['cost'])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Access columns as attributes (e.g. table.cost)"""
+        columns = self.__dict__.get('columns', {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def timestamps(self, name: str) -> np.ndarray:
+        """Date column as microseconds since the epoch"""
+        return self.columns[name].view(np.int64)
+
+
+def load_equipment(file_path: str) -> EquipmentTable:
+    """Load the equipment section of a JSON file into an EquipmentTable (streamed, other sections are skipped)"""
+    return EquipmentTable.from_records(iter_json_array(file_path, 'equipment'))
+
+
+class SortedDateIndex:
+    """Sorted index of dated events (one date per event, each belonging to a row and a group)
+
+    Events are sorted by date overall and by (group, date) within groups, so a date range
+    is two binary searches and counts for many ranges and all groups are vectorized
+    searchsorted calls.
+    """
+
+    def __init__(self, times: np.ndarray, rows: np.ndarray, groups: np.ndarray, group_count: int):
+        """
+        Args:
+            times: Event dates in microseconds since the epoch
+            rows: Table row of every event
+            groups: Group code of every event (e.g. the department)
+            group_count: Number of group codes
+        """
+        order = np.argsort(times, kind='stable')
+        self.times = times[order]
+        self.rows = rows[order]
+
+        group_order = np.lexsort((times, groups))
+        self.group_times = times[group_order]
+        ends = np.cumsum(np.bincount(groups, minlength=group_count))
+        self.starts = np.r_[0, ends[:-1]]
+        self.ends = ends
+
+    def rows_between(self, low: int, high: int) -> np.ndarray:
+        """Rows of the events dated in [low, high], in date order"""
+        start = np.searchsorted(self.times, low, side='left')
+        end = np.searchsorted(self.times, high, side='right')
+        return self.rows[start:end]
+
+    def count_between(self, lows: np.ndarray, highs: np.ndarray) -> np.ndarray:
+        """Group x range array of the number of events dated in [lows[i], highs[i]]"""
+        counts = np.zeros((len(self.starts), len(lows)), dtype=np.int64)
+        for code in range(len(self.starts)):
+            times = self.group_times[self.starts[code]:self.ends[code]]
+            counts[code] = np.searchsorted(times, highs, side='right') - np.searchsorted(times, lows, side='left')
+        return counts
+
+    def count_before(self, dates: np.ndarray) -> np.ndarray:
+        """Group x date array of the number of events dated strictly before each date"""
+        counts = np.zeros((len(self.starts), len(dates)), dtype=np.int64)
+        for code in range(len(self.starts)):
+            counts[code] = np.searchsorted(self.group_times[self.starts[code]:self.ends[code]], dates, side='left')
+        return counts
+
+
+class EquipmentAnalyzer:
+    """Handles all equipment maintenance and warranty analysis tasks"""
+
+    def __init__(self, equipment: EquipmentTable):
+        self.equipment = equipment
+        self._maintenance_index = None
+        self._warranty_index = None
+        self._calendar_index = None
+
+    def _department_count(self) -> int:
+        """Number of department codes"""
+        return len(self.equipment.categories['department_name'])
+
+    def _get_maintenance_index(self) -> SortedDateIndex:
+        """Index of the next maintenance date of every asset (built on first use)"""
+        if self._maintenance_index is None:
+            equipment = self.equipment
+            self._maintenance_index = SortedDateIndex(
+                equipment.timestamps('next_maintenance_date'), np.arange(len(equipment)),
+                equipment.codes['department_name'], self._department_count())
+        return self._maintenance_index
+
+    def _get_warranty_index(self) -> SortedDateIndex:
+        """Index of the warranty end date of every asset (built on first use)"""
+        if self._warranty_index is None:
+            equipment = self.equipment
+            self._warranty_index = SortedDateIndex(
+                equipment.timestamps('warranty_end_date'), np.arange(len(equipment)),
+                equipment.codes['department_name'], self._department_count())
+        return self._warranty_index
+
+    def _get_calendar_index(self) -> SortedDateIndex:
+        """Index of all known maintenance events: the last and the next maintenance of every asset"""
+        if self._calendar_index is None:
+            equipment = self.equipment
+            rows = np.arange(len(equipment))
+            self._calendar_index = SortedDateIndex(
+                np.concatenate([equipment.timestamps('last_maintenance_date'),
+                                equipment.timestamps('next_maintenance_date')]),
+                np.concatenate([rows, rows]),
+                np.tile(equipment.codes['department_name'], 2), self._department_count())
+        return self._calendar_index
+
+    def _asset_records(self, rows: np.ndarray) -> List[Dict]:
+        """Report entries of the assets in the given rows"""
+        equipment = self.equipment
+        return [{
+            'equipment_id': equipment.equipment_id[row],
+            'name': equipment.name[row],
+            'type': equipment.categories['type'][equipment.codes['type'][row]],
+            'department': equipment.categories['department_name'][equipment.codes['department_name'][row]],
+            'status': equipment.categories['status'][equipment.codes['status'][row]],
+            'next_maintenance_date': pd.Timestamp(equipment.next_maintenance_date[row]),
+            'warranty_end_date': pd.Timestamp(equipment.warranty_end_date[row]),
+            'maintenance_cost_per_month': int(equipment.maintenance_cost_per_month[row])
+        } for row in rows]
+
+    def get_maintenance_due(self, start: Union[pd.Timestamp, str], end: Union[pd.Timestamp, str],
+                            department: Optional[str] = None) -> List[Dict]:
+        """
+        Find the assets whose next maintenance is due in [start, end], soonest first
+
+        Args:
+            start: First day of the window
+            end: Last day of the window (a date or midnight includes that whole day)
+            department: Only list assets of this department (all if None, none if unknown)
+        """
+        low = as_timestamps(start)[0]
+        high = as_end_timestamps(end)[0]
+        rows = self._get_maintenance_index().rows_between(low, high)
+        if department is not None:
+            departments = self.equipment.categories['department_name']
+            code = departments.index(department) if department in departments else -1
+            rows = rows[self.equipment.codes['department_name'][rows] == code]
+        return self._asset_records(rows)
+
+    def count_maintenance_due(self, window_starts: Sequence, window_ends: Sequence) -> Dict:
+        """
+        Count the assets due for maintenance per department for many windows at once
+
+        Args:
+            window_starts: First moment of every window
+            window_ends: Last moment of every window (a date or midnight includes that whole day)
+
+        Returns:
+            Dictionary with the departments, the windows and the department x window array counts
+        """
+        lows = as_timestamps(window_starts)
+        highs = as_end_timestamps(window_ends)
+        return {
+            'departments': list(self.equipment.categories['department_name']),
+            'window_starts': list(pd.DatetimeIndex(lows.view('datetime64[us]'))),
+            'window_ends': list(pd.DatetimeIndex(highs.view('datetime64[us]'))),
+            'counts': self._get_maintenance_index().count_between(lows, highs)
+        }
+
+    def calculate_weekly_maintenance_load(self, start: Union[pd.Timestamp, str], weeks: int = 52) -> Dict:
+        """
+        Count maintenance events per department and week, with each department's peak week
+
+        The calendar holds the last and the next maintenance of every asset; all weeks of
+        all departments are counted in one vectorized pass over the sorted events.
+
+        Args:
+            start: First day of the first week
+            weeks: Number of consecutive weeks
+
+        Returns:
+            Dictionary with the week starts, the department x week array counts and per
+            department its peak (most concurrent maintenance events in one week), the
+            start of that week and the total over all weeks
+        """
+        week_starts = pd.Timestamp(start) + pd.to_timedelta(np.arange(weeks + 1) * 7, unit='D')
+        boundaries = as_timestamps(week_starts)
+        counts = np.diff(self._get_calendar_index().count_before(boundaries), axis=1)
+        peak_weeks = counts.argmax(axis=1) if weeks else np.zeros(len(counts), dtype=np.int64)
+
+        return {
+            'week_starts': list(week_starts[:-1]),
+            'departments': list(self.equipment.categories['department_name']),
+            'counts': counts,
+            'by_department': {
+                dept: {
+                    'peak': int(counts[code].max()) if weeks else 0,
+                    'peak_week': week_starts[peak_weeks[code]] if weeks else None,
+                    'total': int(counts[code].sum())
+                } for code, dept in enumerate(self.equipment.categories['department_name'])
+            }
+        }
+
+    def get_out_of_warranty(self, as_of: Union[pd.Timestamp, str]) -> List[Dict]:
+        """
+        Find the assets whose warranty ended before a date, earliest end first
+
+        Args:
+            as_of: Date to check the warranty at
+        """
+        index = self._get_warranty_index()
+        end = np.searchsorted(index.times, as_timestamps(as_of)[0], side='left')
+        return self._asset_records(index.rows[:end])
+
+    def count_out_of_warranty(self, dates: Sequence) -> Dict:
+        """
+        Count the assets out of warranty per department at many dates at once
+
+        Args:
+            dates: Dates to check the warranty at
+
+        Returns:
+            Dictionary with the departments, the dates, the department x date array counts
+            and the share of each department's assets out of warranty (percent)
+        """
+        times = as_timestamps(dates)
+        counts = self._get_warranty_index().count_before(times)
+        assets = np.bincount(self.equipment.codes['department_name'], minlength=self._department_count())
+        return {
+            'departments': list(self.equipment.categories['department_name']),
+            'dates': list(pd.DatetimeIndex(times.view('datetime64[us]'))),
+            'counts': counts,
+            'share': np.round(counts / assets[:, None] * 100, 1)
+        }
+
+    def generate_equipment_report(self, as_of: Union[pd.Timestamp, str] = CURRENT_DATE):
+        """Generate equipment maintenance and warranty report"""
+        print("=== EQUIPMENT MAINTENANCE REPORT ===")
+        as_of = pd.Timestamp(as_of)
+
+        due = self.get_maintenance_due(as_of, as_of + pd.Timedelta(days=60))
+        print(f"\n1. MAINTENANCE DUE IN THE NEXT 60 DAYS")
+        print(f"Total Assets: {len(self.equipment)}, Due: {len(due)}")
+        for asset in due[:5]:
+            print(f"  {asset['equipment_id']} {asset['name']} ({asset['department']}): "
+                  f"{asset['next_maintenance_date']:%Y-%m-%d}")
+
+        load = self.calculate_weekly_maintenance_load(as_of - pd.Timedelta(weeks=26), 52)
+        peaks = sorted(load['by_department'].items(), key=lambda x: x[1]['peak'], reverse=True)
+        print(f"\n2. PEAK WEEKLY MAINTENANCE BY DEPARTMENT")
+        for dept, data in peaks[:5]:
+            print(f"  {dept}: {data['peak']} events in the week of {data['peak_week']:%Y-%m-%d} "
+                  f"({data['total']} in 52 weeks)")
+
+        out_of_warranty = self.get_out_of_warranty(as_of)
+        print(f"\n3. WARRANTY STATUS")
+        print(f"Out of Warranty: {len(out_of_warranty)} of {len(self.equipment)} assets")
+
+        return {
+            'maintenance_due': due,
+            'weekly_maintenance_load': load,
+            'out_of_warranty': out_of_warranty
+        }
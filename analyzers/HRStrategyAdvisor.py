@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, List
-from employee import Employee
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from employee import Employee, EmployeeManager, EmployeeTable, as_employee_table
+from analyzers.AggregationEngine import GroupedAggregates
 from analyzers import TurnoverAnalyzer
 from analyzers import CareerDevelompentAnalyzer
 
@@ -8,10 +10,44 @@ from analyzers import CareerDevelompentAnalyzer
 class HRStrategyAdvisor:
     """Handles all HR strategy and recommendations"""
 
-    def __init__(self, employees: List[Employee]):
+    # Comprehensive cost model (in RUB)
+    COST_COMPONENTS = {
+        'recruitment': 50000,  # Recruitment agency fees, advertising
+        'onboarding': 30000,  # Training, orientation, equipment
+        'training': 40000,  # Formal training programs
+        'productivity_loss': 70000,  # Ramp-up time, lost productivity
+        'knowledge_loss': 10000,  # Institutional knowledge loss
+        'manager_time': 20000  # Manager time for interviews, onboarding
+    }
+    # Investment required, as a share of the potential savings
+    INVESTMENT_SHARE = 0.15
+
+    def __init__(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                 aggregates: Optional[GroupedAggregates] = None,
+                 turnover_analyzer: Optional[TurnoverAnalyzer.TurnoverAnalyzer] = None,
+                 career_analyzer: Optional[CareerDevelompentAnalyzer.CareerDevelopmentAnalyzer] = None):
+        """
+        Args:
+            employees: Employees to advise on
+            aggregates: Shared aggregates of the employees
+            turnover_analyzer: Existing analyzer to reuse (e.g. from an AnalysisSession)
+            career_analyzer: Existing analyzer to reuse (e.g. from an AnalysisSession)
+        """
         self.employees = employees
-        self.turnover_analyzer = TurnoverAnalyzer.TurnoverAnalyzer(employees)
-        self.career_analyzer = CareerDevelompentAnalyzer.CareerDevelopmentAnalyzer(employees)
+        self._table = None
+
+        # Analyzers created here share one conversion of an Employee list
+        shared = self.table if isinstance(employees, list) and not (turnover_analyzer and career_analyzer) else employees
+        self.turnover_analyzer = turnover_analyzer or TurnoverAnalyzer.TurnoverAnalyzer(shared, aggregates)
+        self.career_analyzer = (career_analyzer or
+                                CareerDevelompentAnalyzer.CareerDevelopmentAnalyzer(shared, aggregates))
+
+    @property
+    def table(self) -> EmployeeTable:
+        """Employees as a table (converted on first use)"""
+        if self._table is None:
+            self._table = as_employee_table(self.employees)
+        return self._table
 
     def suggest_turnover_reduction_measures(self) -> Dict:
         """Suggest measures to reduce the turnover rate in problem departments"""
@@ -89,18 +125,7 @@ class HRStrategyAdvisor:
     def calculate_economic_effect(self, reduction_percent: float = 10) -> Dict:
         """Calculate the economic effect of reducing turnover by given percentage"""
         turnover_data = self.turnover_analyzer.calculate_turnover_rates()
-
-        # Comprehensive cost model (in RUB)
-        cost_components = {
-            'recruitment': 50000,  # Recruitment agency fees, advertising
-            'onboarding': 30000,  # Training, orientation, equipment
-            'training': 40000,  # Formal training programs
-            'productivity_loss': 70000,  # Ramp-up time, lost productivity
-            'knowledge_loss': 10000,  # Institutional knowledge loss
-            'manager_time': 20000  # Manager time for interviews, onboarding
-        }
-
-        avg_cost_per_turnover = sum(cost_components.values())
+        avg_cost_per_turnover = sum(self.COST_COMPONENTS.values())
 
         total_turnover_cost = 0
         potential_savings = 0
@@ -123,7 +148,7 @@ class HRStrategyAdvisor:
             }
 
         # Calculate investment required (estimated at 15% of potential savings)
-        investment_required = potential_savings * 0.15
+        investment_required = potential_savings * self.INVESTMENT_SHARE
 
         return {
             'current_annual_turnover_cost': round(total_turnover_cost),
@@ -136,6 +161,141 @@ class HRStrategyAdvisor:
             'department_breakdown': department_breakdown
         }
 
+    def _turnover_counts(self) -> Tuple[List[str], np.ndarray]:
+        """Departments (in calculate_turnover_rates order) and their short-tenure counts"""
+        turnover_data = self.turnover_analyzer.calculate_turnover_rates()
+        counts = np.array([data['short_tenure_count'] for data in turnover_data.values()], dtype=np.float64)
+        return list(turnover_data), counts
+
+    def calculate_economic_effect_grid(self, reduction_percents: Sequence[float] = (5, 10, 15, 20, 25, 30),
+                                       cost_models: Optional[Union[Dict[str, Dict[str, float]], np.ndarray]] = None
+                                       ) -> Dict[str, pd.DataFrame]:
+        """
+        Calculate the economic effect for every combination of reduction percentage and cost model
+
+        Turnover is computed once; the cost models x reductions x departments savings cube
+        is then one broadcast product, and each grid cell equals the matching
+        calculate_economic_effect result (unrounded).
+
+        Args:
+            reduction_percents: Turnover reductions in percent
+            cost_models: Named cost component tables (like COST_COMPONENTS), or an array with
+                one row of component costs per model in COST_COMPONENTS order (models are
+                then labelled by row number). COST_COMPONENTS alone if None.
+
+        Returns:
+            Dictionary with 'totals', a DataFrame indexed by (cost_model, reduction_percent)
+            with the company-wide costs, savings, investment, ROI and payback period, and
+            'department_savings', a DataFrame with the same index and one column per department
+        """
+        if cost_models is None:
+            cost_models = {'default': self.COST_COMPONENTS}
+        if isinstance(cost_models, dict):
+            model_names = list(cost_models)
+            cost_per_turnover = np.array([sum(components.values()) for components in cost_models.values()],
+                                         dtype=np.float64)
+        else:
+            cost_vectors = np.atleast_2d(np.asarray(cost_models, dtype=np.float64))
+            model_names = list(range(len(cost_vectors)))
+            cost_per_turnover = cost_vectors.sum(axis=1)
+
+        departments, counts = self._turnover_counts()
+        reductions = np.asarray(reduction_percents, dtype=np.float64)
+
+        # Cost models x reductions x departments
+        department_savings = (cost_per_turnover[:, None, None] * (reductions / 100)[None, :, None]
+                              * counts[None, None, :])
+        savings = department_savings.sum(axis=2)
+        investment = savings * self.INVESTMENT_SHARE
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = (savings - investment) / investment * 100
+            payback = investment / (savings / 12)
+
+        index = pd.MultiIndex.from_product([model_names, reductions], names=['cost_model', 'reduction_percent'])
+        totals = pd.DataFrame({
+            'cost_per_turnover': np.repeat(cost_per_turnover, len(reductions)),
+            'current_annual_turnover_cost': np.repeat(cost_per_turnover * counts.sum(), len(reductions)),
+            'potential_savings': savings.ravel(),
+            'required_investment': investment.ravel(),
+            'net_annual_savings': (savings - investment).ravel(),
+            'return_on_investment': roi.ravel(),
+            'payback_period_months': payback.ravel()
+        }, index=index)
+        return {
+            'totals': totals,
+            'department_savings': pd.DataFrame(department_savings.reshape(len(index), len(departments)),
+                                               index=index, columns=departments)
+        }
+
+    def simulate_economic_effect(self, scenarios: int = 10000, reduction_percent: float = 10,
+                                 reduction_spread: float = 5, cost_spread: float = 0.2,
+                                 percentiles: Sequence[float] = (5, 25, 50, 75, 95),
+                                 seed: Optional[int] = 0) -> Dict:
+        """
+        Monte Carlo version of calculate_economic_effect with uncertain reductions and costs
+
+        Each scenario draws a turnover reduction per department (normal around
+        reduction_percent, clipped to 0-100%) and every cost component (triangular within
+        +-cost_spread of COST_COMPONENTS). All scenarios are drawn and evaluated as
+        scenarios x departments arrays at once. The investment is the one planned by
+        calculate_economic_effect, so ROI and payback vary with the realized savings.
+
+        Args:
+            scenarios: Number of scenarios to draw
+            reduction_percent: Expected turnover reduction in percent
+            reduction_spread: Standard deviation of the reduction of a department, in percentage points
+            cost_spread: Relative half-width of the range of each cost component
+            percentiles: Percentiles reported for every metric
+            seed: Seed of the random generator (None for a fresh one)
+
+        Returns:
+            Dictionary with the planned investment, percentile bands (p5, p50, ...) of the
+            potential and net savings, ROI, payback period and the savings of each
+            department, and the probability that savings do not cover the investment
+        """
+        departments, counts = self._turnover_counts()
+        rng = np.random.default_rng(seed)
+
+        costs = np.array(list(self.COST_COMPONENTS.values()), dtype=np.float64)
+        if cost_spread > 0:
+            cost_draws = rng.triangular(costs * (1 - cost_spread), costs, costs * (1 + cost_spread),
+                                        size=(scenarios, len(costs)))
+        else:
+            cost_draws = np.broadcast_to(costs, (scenarios, len(costs)))
+        cost_per_turnover = cost_draws.sum(axis=1)
+
+        reductions = rng.normal(reduction_percent, reduction_spread, size=(scenarios, len(departments)))
+        np.clip(reductions, 0, 100, out=reductions)
+        department_savings = reductions * (counts / 100)
+        department_savings *= cost_per_turnover[:, None]
+        savings = department_savings.sum(axis=1)
+
+        investment = counts.sum() * reduction_percent / 100 * costs.sum() * self.INVESTMENT_SHARE
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = (savings - investment) / investment * 100
+            payback = investment / (savings / 12)
+
+        percentiles = list(percentiles)
+
+        def bands(values: np.ndarray, decimals: int = 0) -> Dict[str, float]:
+            return {f'p{p:g}': round(float(value), decimals) if decimals else round(float(value))
+                    for p, value in zip(percentiles, np.percentile(values, percentiles))}
+
+        department_bands = np.percentile(department_savings, percentiles, axis=0)
+        return {
+            'scenarios': scenarios,
+            'required_investment': round(investment),
+            'potential_savings': bands(savings),
+            'net_annual_savings': bands(savings - investment),
+            'return_on_investment': bands(roi, 1),
+            'payback_period_months': bands(payback, 1),
+            'probability_of_loss': round(float(np.mean(savings < investment)), 4),
+            'department_savings': {
+                dept: {f'p{p:g}': round(float(value)) for p, value in zip(percentiles, department_bands[:, position])}
+                for position, dept in enumerate(departments)
+            }
+        }
+
     def develop_high_potential_program(self) -> Dict:
         """Develop a development program for high-potential employees"""
         high_potential_data = self.career_analyzer.find_high_potential_employees()
@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Union
+from employee import EmployeeManager, EmployeeTable, as_employee_table
+from analyzers.DepartmentJoin import KeyIndex
+
+
+class KPIReconciler:
+    """Reconciles the employee_metrics blocks of kpi_metrics with the employees they describe
+
+    All recomputed metrics come from one vectorized pass over the employees (bincounts per
+    department_id). Each department is then classified:
+        match    - every checked metric is within its tolerance; the KPI block can be used
+                   as a trusted precomputed aggregate
+        drifting - same headcount, but another checked metric is out of tolerance
+        stale    - the headcount differs (the block describes another workforce)
+        missing  - there are employees but no KPI block
+
+    Trusted blocks are served by get_department_metrics and its report section. The
+    department analyzers do not read them: their metrics come from the one fused
+    aggregation pass over all employees (see AggregationEngine), which leaving trusted
+    departments out of would not make cheaper, and a block can only be trusted after
+    that pass has recomputed it.
+    """
+
+    # Largest accepted absolute difference per metric (KPI values are rounded). None means
+    # reported but not checked: the KPI turnover_rate is an annual rate, while the
+    # recomputed one is the share of employees below the tenure threshold.
+    TOLERANCES = {
+        'employee_count': 0,
+        'average_salary': 0.5,
+        'average_performance': 0.05,
+        'average_experience': 0.05,
+        'male': 0,
+        'female': 0,
+        'turnover_rate': None
+    }
+    # Absolute slack added to every tolerance for floating point error
+    EPSILON = 1e-9
+
+    def __init__(self, employees: Union[EmployeeTable, EmployeeManager], kpi_metrics: List[Dict[str, Any]],
+                 tolerances: Optional[Dict[str, Optional[float]]] = None, tenure_threshold: float = 2.0):
+        """
+        Args:
+            employees: Employees the KPI blocks should describe
+            kpi_metrics: Records of the kpi_metrics section
+            tolerances: Overrides of TOLERANCES (a metric mapped to None is not checked)
+            tenure_threshold: Tenure in years below which an employee counts as short tenure
+        """
+        self.employees = employees
+        self.kpi_metrics = kpi_metrics
+        self.tolerances = {**self.TOLERANCES, **(tolerances or {})}
+        self.tenure_threshold = tenure_threshold
+        self._reconciliation = None
+
+    def _kpi_values(self) -> Dict[str, np.ndarray]:
+        """KPI employee metrics as arrays in kpi_metrics order"""
+        blocks = [kpi['employee_metrics'] for kpi in self.kpi_metrics]
+        values = {name: np.array([block.get(name, np.nan) for block in blocks], dtype=np.float64)
+                  for name in ['employee_count', 'average_salary', 'average_performance',
+                               'average_experience', 'turnover_rate']}
+        for gender in ['male', 'female']:
+            values[gender] = np.array([block.get('gender_distribution', {}).get(gender, 0) for block in blocks],
+                                      dtype=np.float64)
+        return values
+
+    def _computed_values(self, index: KeyIndex) -> Dict[str, np.ndarray]:
+        """The KPI metrics recomputed from the employees, per indexed department_id"""
+        table = as_employee_table(self.employees)
+        positions = index.positions(table.department_id)
+        headcount = index.rollup(positions)
+        genders = table.categories['gender']
+        gender_codes = table.codes['gender']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            computed = {
+                'employee_count': headcount,
+                'average_salary': index.rollup(positions, table.salary) / headcount,
+                'average_performance': index.rollup(positions, table.performance_score) / headcount,
+                'average_experience': index.rollup(positions, table.experience_years) / headcount,
+                'turnover_rate': index.rollup(positions, table.tenure_years < self.tenure_threshold) / headcount * 100
+            }
+        for gender in ['male', 'female']:
+            code = genders.index(gender) if gender in genders else -1
+            computed[gender] = index.rollup(positions, gender_codes == code)
+        return computed
+
+    def reconcile(self) -> Dict:
+        """
+        Compare every KPI block with the recomputed metrics (computed once, then cached)
+
+        Returns:
+            Dictionary with per department (by name) its department_id, status, the metrics
+            out of tolerance and per metric the KPI value, the recomputed value, their
+            difference and whether it is within tolerance (None if not checked); and a
+            summary with the number of departments per status
+        """
+        if self._reconciliation is not None:
+            return self._reconciliation
+
+        table = as_employee_table(self.employees)
+        kpi_ids = np.array([kpi['department_id'] for kpi in self.kpi_metrics], dtype=np.int64)
+        # Departments with a KPI block first, then those that only have employees
+        department_ids = pd.unique(np.concatenate([kpi_ids, np.asarray(table.department_id, dtype=np.int64)]))
+        index = KeyIndex(department_ids)
+
+        names = {}
+        for kpi in self.kpi_metrics:
+            names[kpi['department_id']] = kpi['department_name']
+        employee_ids, first_rows = np.unique(table.department_id, return_index=True)
+        for department_id, row in zip(employee_ids, first_rows):
+            names.setdefault(int(department_id), table.categories['department_name'][table.codes['department_name'][row]])
+
+        computed = self._computed_values(index)
+        kpi_positions = index.positions(kpi_ids)
+        kpi = {}
+        for name, values in self._kpi_values().items():
+            kpi[name] = np.full(len(index), np.nan)
+            kpi[name][kpi_positions] = values
+        has_kpi = np.zeros(len(index), dtype=bool)
+        has_kpi[kpi_positions] = True
+
+        differences = {name: computed[name] - kpi[name] for name in self.tolerances}
+        within = {name: np.abs(differences[name]) <= tolerance + self.EPSILON
+                  for name, tolerance in self.tolerances.items() if tolerance is not None}
+        checked_ok = np.logical_and.reduce(list(within.values())) if within else np.ones(len(index), dtype=bool)
+        same_headcount = computed['employee_count'] == kpi['employee_count']
+        statuses = np.select([~has_kpi, ~same_headcount, ~checked_ok], ['missing', 'stale', 'drifting'], 'match')
+
+        departments = {}
+        for position, department_id in enumerate(index.keys):
+            metrics = {}
+            for name, tolerance in self.tolerances.items():
+                metrics[name] = {
+                    'kpi': None if np.isnan(kpi[name][position]) else float(kpi[name][position]),
+                    'computed': None if np.isnan(computed[name][position]) else float(computed[name][position]),
+                    'difference': None if np.isnan(differences[name][position]) else float(differences[name][position]),
+                    'within_tolerance': None if tolerance is None else bool(within[name][position])
+                }
+            departments[names[int(department_id)]] = {
+                'department_id': int(department_id),
+                'status': str(statuses[position]),
+                'out_of_tolerance': [name for name in within if not within[name][position]] if has_kpi[position] else [],
+                'metrics': metrics
+            }
+
+        self._reconciliation = {
+            'departments': departments,
+            'summary': {status: int(np.sum(statuses == status)) for status in ['match', 'drifting', 'stale', 'missing']}
+        }
+        return self._reconciliation
+
+    def get_trusted_blocks(self) -> Dict[str, Dict[str, Any]]:
+        """KPI employee_metrics blocks of the departments whose block matches (by department name)"""
+        statuses = {name: data['status'] for name, data in self.reconcile()['departments'].items()}
+        return {kpi['department_name']: kpi['employee_metrics'] for kpi in self.kpi_metrics
+                if statuses.get(kpi['department_name']) == 'match'}
+
+    def get_department_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Employee metrics per department for reports: the KPI block where it is trusted,
+        the recomputed values elsewhere
+
+        Trusted departments keep their block (including KPI-only fields such as
+        planned_employee_count) instead of rounded recomputed values. Both come from the
+        single cached reconcile() pass, which still aggregates every department: checking
+        a block requires its recomputed metrics. Metrics that are not checked (tolerance
+        None, e.g. turnover_rate) always hold the recomputed value, so a key means the
+        same in every department; the KPI value of a trusted block is kept as kpi_<name>.
+        """
+        trusted = self.get_trusted_blocks()
+        unchecked = [name for name, tolerance in self.tolerances.items() if tolerance is None]
+        result = {}
+        for dept, data in self.reconcile()['departments'].items():
+            computed = self._rounded_metrics({name: values['computed'] for name, values in data['metrics'].items()})
+            if dept not in trusted:
+                result[dept] = {**computed, 'source': 'computed'}
+                continue
+            result[dept] = dict(trusted[dept])
+            for name in unchecked:
+                if name in result[dept]:
+                    result[dept][f'kpi_{name}'] = result[dept][name]
+                result[dept][name] = computed[name]
+            result[dept]['source'] = 'kpi'
+        return result
+
+    @staticmethod
+    def _rounded_metrics(metrics: Dict[str, Optional[float]]) -> Dict[str, Any]:
+        """Recomputed metrics rounded and laid out like a KPI employee_metrics block"""
+        def rounded(name: str, digits: Optional[int]) -> Optional[float]:
+            return None if metrics[name] is None else round(metrics[name], digits)
+
+        return {
+            'employee_count': int(metrics['employee_count'] or 0),
+            'average_salary': rounded('average_salary', None),
+            'average_performance': rounded('average_performance', 1),
+            'turnover_rate': rounded('turnover_rate', 2),
+            'gender_distribution': {'male': int(metrics['male'] or 0), 'female': int(metrics['female'] or 0)},
+            'average_experience': rounded('average_experience', 1)
+        }
+
+    def generate_reconciliation_report(self):
+        """Generate KPI reconciliation report"""
+        print("=== KPI RECONCILIATION REPORT ===")
+        reconciliation = self.reconcile()
+
+        print(f"\n1. SUMMARY")
+        for status, count in reconciliation['summary'].items():
+            print(f"  {status}: {count} departments")
+
+        print(f"\n2. DEPARTMENTS NEEDING ATTENTION")
+        for dept, data in reconciliation['departments'].items():
+            if data['status'] == 'match':
+                continue
+            print(f"  {dept} ({data['status']})")
+            for name in data['out_of_tolerance']:
+                metric = data['metrics'][name]
+                print(f"    {name}: KPI {metric['kpi']}, recomputed {metric['computed']}")
+
+        metrics = self.get_department_metrics()
+        print(f"\n3. DEPARTMENT METRICS (source: trusted KPI block or recomputed)")
+        for dept, data in metrics.items():
+            print(f"  {dept} [{data['source']}]: {data['employee_count']} employees, "
+                  f"avg salary {data['average_salary']}, avg performance {data['average_performance']}, "
+                  f"short tenure {data['turnover_rate']}%")
+
+        return {**reconciliation, 'department_metrics': metrics}
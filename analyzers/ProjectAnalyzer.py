@@ -0,0 +1,300 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List
+from json_stream import iter_json_array
+
+
+class ProjectTable:
+    """Columnar storage of the projects section of company.json
+
+    Project fields are NumPy arrays with one element per project; status, risk level and
+    priority are dictionary-encoded like the categorical fields of EmployeeTable. The
+    participating departments are kept as one entry per (project, department) pair.
+    """
+
+    NUMERIC_FIELDS = {
+        'duration_days': np.int32,
+        'budget': np.int64,
+        'actual_cost': np.int64,
+        'profit': np.int64,
+        'roi_percentage': np.float64,
+        'completion_percentage': np.float64
+    }
+    DATE_FIELDS = ['start_date', 'end_date']
+    CATEGORICAL_FIELDS = ['status', 'risk_level', 'priority']
+    TEXT_FIELDS = ['project_id', 'name']
+    ALLOCATION_FIELDS = {
+        'allocation_project': np.int64,
+        'allocation_department_id': np.int64,
+        'budget_allocation': np.int64
+    }
+
+    def __init__(self, columns: Dict[str, np.ndarray], codes: Dict[str, np.ndarray],
+                 categories: Dict[str, List[str]], allocations: Dict[str, np.ndarray],
+                 department_names: Dict[int, str]):
+        """
+        Initialize table from already encoded columns
+
+        Args:
+            columns: Numeric, date and text columns by field name
+            codes: Integer codes of the categorical fields
+            categories: Distinct labels of the categorical fields (code -> label)
+            allocations: Participating departments (project row, department_id, budget_allocation)
+            department_names: department_id -> department name
+        """
+        self.columns = columns
+        self.codes = codes
+        self.categories = categories
+        self.allocations = allocations
+        self.department_names = department_names
+
+    @staticmethod
+    def _empty_raw_columns() -> Dict[str, List]:
+        """Per-field lists collected by from_records"""
+        return {name: [] for name in list(ProjectTable.NUMERIC_FIELDS) + ProjectTable.DATE_FIELDS +
+                ProjectTable.CATEGORICAL_FIELDS + ProjectTable.TEXT_FIELDS + list(ProjectTable.ALLOCATION_FIELDS)}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'ProjectTable':
+        """
+        Build table from raw JSON project records
+
+        Args:
+            records: Iterable of project dictionaries in the company.json layout
+        """
+        data = cls._empty_raw_columns()
+        department_names = {}
+
+        for row, record in enumerate(records):
+            timeline = record['timeline']
+            financials = record['financials']
+            metrics = record['metrics']
+
+            data['project_id'].append(record['project_id'])
+            data['name'].append(record['name'])
+            data['status'].append(record['status'])
+            data['start_date'].append(timeline['start_date'])
+            data['end_date'].append(timeline['end_date'])
+            data['duration_days'].append(timeline['duration_days'])
+            data['budget'].append(financials['budget'])
+            data['actual_cost'].append(financials['actual_cost'])
+            data['profit'].append(financials['profit'])
+            data['roi_percentage'].append(financials['roi_percentage'])
+            data['completion_percentage'].append(metrics['completion_percentage'])
+            data['risk_level'].append(metrics['risk_level'])
+            data['priority'].append(metrics['priority'])
+
+            for department in record['participating_departments']:
+                data['allocation_project'].append(row)
+                data['allocation_department_id'].append(department['department_id'])
+                data['budget_allocation'].append(department['budget_allocation'])
+                department_names.setdefault(department['department_id'], department['department_name'])
+
+        columns = {name: np.asarray(data[name], dtype=dtype) for name, dtype in cls.NUMERIC_FIELDS.items()}
+        for name in cls.DATE_FIELDS:
+            columns[name] = np.array(data[name], dtype='datetime64[us]')
+        for name in cls.TEXT_FIELDS:
+            columns[name] = np.asarray(data[name], dtype=object)
+
+        codes = {}
+        categories = {}
+        for name in cls.CATEGORICAL_FIELDS:
+            field_codes, labels = pd.factorize(np.asarray(data[name], dtype=object))
+            codes[name] = field_codes.astype(np.int32)
+            categories[name] = list(labels)
+
+        allocations = {name: np.asarray(data[name], dtype=dtype) for name, dtype in cls.ALLOCATION_FIELDS.items()}
+        return cls(columns, codes, categories, allocations, department_names)
+
+    def __len__(self) -> int:
+        """Return number of projects"""
+        return len(self.columns['budget'])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Access columns as attributes (e.g. table.budget)"""
+        columns = self.__dict__.get('columns', {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def labels(self, name: str) -> np.ndarray:
+        """Per-project labels of a categorical field"""
+        return np.asarray(self.categories[name], dtype=object)[self.codes[name]]
+
+
+class DepartmentProjectMatrix:
+    """Sparse department x project matrix of budget allocations (compressed rows)
+
+    Entries of department row d are columns[indptr[d]:indptr[d + 1]] (project rows) with
+    values in the same positions. Products with project vectors are weighted bincounts over
+    the stored entries, so their cost depends on the number of allocations only, not on
+    departments x projects.
+    """
+
+    def __init__(self, projects: ProjectTable):
+        allocations = projects.allocations
+        department_codes, department_ids = pd.factorize(allocations['allocation_department_id'])
+        order = np.argsort(department_codes, kind='stable')
+
+        self.department_ids = np.asarray(department_ids, dtype=np.int64)
+        self.department_names = [projects.department_names[int(department_id)] for department_id in department_ids]
+        self.shape = (len(department_ids), len(projects))
+        self.rows = department_codes[order]
+        self.columns = allocations['allocation_project'][order]
+        self.values = allocations['budget_allocation'][order].astype(np.float64)
+        self.indptr = np.r_[0, np.cumsum(np.bincount(self.rows, minlength=self.shape[0]))]
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored allocations"""
+        return len(self.values)
+
+    def dot(self, project_values: np.ndarray) -> np.ndarray:
+        """Matrix-vector product: per department, the sum of allocation x project value"""
+        return np.bincount(self.rows, weights=self.values * project_values[self.columns], minlength=self.shape[0])
+
+    def pattern_dot(self, project_values: np.ndarray) -> np.ndarray:
+        """Product of the 0/1 participation pattern with a project vector"""
+        return np.bincount(self.rows, weights=project_values[self.columns], minlength=self.shape[0])
+
+    def column_sums(self) -> np.ndarray:
+        """Total allocation of every project over its departments"""
+        return np.bincount(self.columns, weights=self.values, minlength=self.shape[1])
+
+    def to_dense(self) -> np.ndarray:
+        """Dense departments x projects array (for small matrices only)"""
+        dense = np.zeros(self.shape)
+        np.add.at(dense, (self.rows, self.columns), self.values)
+        return dense
+
+
+def load_projects(file_path: str) -> ProjectTable:
+    """Load the projects section of a JSON file into a ProjectTable (streamed, other sections are skipped)"""
+    return ProjectTable.from_records(iter_json_array(file_path, 'projects'))
+
+
+class ProjectAnalyzer:
+    """Handles all project portfolio analysis tasks"""
+
+    # Share of the open (not yet completed) allocation assumed at risk per risk level
+    RISK_WEIGHTS = {
+        'low': 0.1,
+        'medium': 0.25,
+        'high': 0.5
+    }
+    # Statuses of projects that are not finished (completed projects have nothing left open)
+    OPEN_STATUSES = ['active', 'planning', 'on_hold']
+
+    def __init__(self, projects: ProjectTable):
+        self.projects = projects
+        self._matrix = None
+        self._metrics = None
+
+    @property
+    def matrix(self) -> DepartmentProjectMatrix:
+        """Department x project allocation matrix (built on first use)"""
+        if self._matrix is None:
+            self._matrix = DepartmentProjectMatrix(self.projects)
+        return self._matrix
+
+    def get_department_metrics(self) -> Dict[str, np.ndarray]:
+        """Per-department project metrics as arrays in matrix row order (see matrix.department_ids), computed once"""
+        if self._metrics is None:
+            projects = self.projects
+            matrix = self.matrix
+            ones = np.ones(len(projects))
+
+            # Overruns are shared between departments in proportion to their allocation
+            overrun = np.maximum(projects.actual_cost - projects.budget, 0).astype(np.float64)
+            allocated = matrix.column_sums()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                overrun_per_allocation = np.where(allocated > 0, overrun / allocated, 0.0)
+
+            risk_labels = projects.categories['risk_level']
+            risk_weights = np.array([self.RISK_WEIGHTS.get(label, self.RISK_WEIGHTS['medium'])
+                                     for label in risk_labels])[projects.codes['risk_level']]
+            is_open = np.isin(projects.codes['status'],
+                              [code for code, label in enumerate(projects.categories['status'])
+                               if label in self.OPEN_STATUSES]).astype(np.float64)
+            open_share = is_open * (1 - np.clip(projects.completion_percentage, 0, 100) / 100)
+
+            self._metrics = {
+                'project_count': matrix.pattern_dot(ones).astype(np.int64),
+                'open_project_count': matrix.pattern_dot(is_open).astype(np.int64),
+                'budget_exposure': matrix.dot(ones),
+                'open_exposure': matrix.dot(open_share),
+                'cost_overrun': matrix.dot(overrun_per_allocation),
+                'risk_weighted_allocation': matrix.dot(risk_weights * open_share)
+            }
+        return self._metrics
+
+    def calculate_department_project_load(self) -> Dict:
+        """
+        Calculate project load, budget exposure, cost overrun and risk-weighted allocation per department
+
+        Budget exposure is the total allocation of a department; open exposure and the
+        risk-weighted allocation only count the part of open projects (OPEN_STATUSES) not
+        yet completed, the latter weighted by RISK_WEIGHTS. Cost overruns (actual cost above budget) are
+        shared between the departments of a project by allocation.
+        """
+        metrics = self.get_department_metrics()
+        matrix = self.matrix
+
+        result = {}
+        for row, dept in enumerate(matrix.department_names):
+            exposure = metrics['budget_exposure'][row]
+            result[dept] = {
+                'department_id': int(matrix.department_ids[row]),
+                'project_count': int(metrics['project_count'][row]),
+                'open_project_count': int(metrics['open_project_count'][row]),
+                'budget_exposure': round(float(exposure)),
+                'open_exposure': round(float(metrics['open_exposure'][row])),
+                'cost_overrun': round(float(metrics['cost_overrun'][row])),
+                'risk_weighted_allocation': round(float(metrics['risk_weighted_allocation'][row])),
+                'risk_ratio': round(float(metrics['risk_weighted_allocation'][row] / exposure * 100), 1) if exposure else 0.0
+            }
+
+        return dict(sorted(result.items(), key=lambda x: x[1]['budget_exposure'], reverse=True))
+
+    def analyze_portfolio_status(self) -> Dict:
+        """Summarize projects by status: count, budget, actual cost and average completion"""
+        projects = self.projects
+        codes = projects.codes['status']
+        size = len(projects.categories['status'])
+        counts = np.bincount(codes, minlength=size)
+        budgets = np.bincount(codes, weights=projects.budget, minlength=size)
+        costs = np.bincount(codes, weights=projects.actual_cost, minlength=size)
+        completion = np.bincount(codes, weights=projects.completion_percentage, minlength=size)
+
+        return {
+            status: {
+                'project_count': int(counts[code]),
+                'total_budget': round(float(budgets[code])),
+                'total_actual_cost': round(float(costs[code])),
+                'average_completion': round(float(completion[code] / counts[code]), 1)
+            }
+            for code, status in enumerate(projects.categories['status']) if counts[code]
+        }
+
+    def generate_project_report(self):
+        """Generate comprehensive project portfolio report"""
+        print("=== PROJECT PORTFOLIO REPORT ===")
+
+        status = self.analyze_portfolio_status()
+        print(f"\n1. PORTFOLIO STATUS")
+        print(f"Total Projects: {len(self.projects)}")
+        for name, data in status.items():
+            print(f"  {name}: {data['project_count']} projects, "
+                  f"budget {data['total_budget']:,} RUB, {data['average_completion']}% complete")
+
+        load = self.calculate_department_project_load()
+        print(f"\n2. DEPARTMENT PROJECT LOAD (Top 10 by budget exposure)")
+        for dept, data in list(load.items())[:10]:
+            print(f"  {dept}: {data['project_count']} projects ({data['open_project_count']} open)")
+            print(f"    Exposure: {data['budget_exposure']:,} RUB, Overrun: {data['cost_overrun']:,} RUB, "
+                  f"Risk-weighted: {data['risk_weighted_allocation']:,} RUB ({data['risk_ratio']}%)")
+
+        return {
+            'portfolio_status': status,
+            'department_project_load': load
+        }
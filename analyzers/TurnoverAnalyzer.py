@@ -1,53 +1,230 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List
-from employee import Employee
+from typing import Dict, List, Optional, Sequence, Union
+from employee import MICROSECONDS_PER_DAY, Employee, EmployeeManager, EmployeeTable, as_employee_table
+from analyzers.AggregationEngine import GroupedAggregates, aggregate
 
 
 class TurnoverAnalyzer:
     """Handles all turnover and flow analysis tasks"""
 
-    def __init__(self, employees: List[Employee]):
+    # Tenure thresholds (years) of calculate_turnover_sweep by default
+    SWEEP_TENURE_THRESHOLDS = tuple(np.arange(0.5, 5.01, 0.25).tolist())
+
+    def __init__(self, employees: Union[List[Employee], EmployeeTable, EmployeeManager],
+                 aggregates: Optional[GroupedAggregates] = None):
         self.employees = employees
+        self._table = None
+        self.aggregates = aggregates
+        self._department_index = None
+        self._hire_index = None
+        self._department_codes = None
+        self._turnover_cache = {}
 
-    def calculate_turnover_rates(self, tenure_threshold: float = 2.0) -> Dict:
-        """Calculate the turnover rate for each department"""
-        department_data = {}
+    @property
+    def table(self) -> EmployeeTable:
+        """Employees as a table (converted on first use)"""
+        if self._table is None:
+            self._table = as_employee_table(self.employees)
+        return self._table
+
+    def _get_aggregates(self) -> GroupedAggregates:
+        """Shared aggregates of the table (computed on first use)"""
+        if self.aggregates is None:
+            self.aggregates = aggregate(self.table)
+        return self.aggregates
+
+    def _get_department_index(self) -> Dict[str, np.ndarray]:
+        """
+        Department -> rows inverted index, built once
+
+        Rows of department code c are rows[starts[c]:ends[c]], ordered by tenure, and
+        tenures holds their tenure_years in the same order.
+        """
+        if self._department_index is None:
+            dept_codes = self.table.codes['department_name']
+            rows = np.lexsort((self.table.tenure_years, dept_codes))
+            ends = np.cumsum(np.bincount(dept_codes, minlength=len(self.table.categories['department_name'])))
+            self._department_index = {
+                'rows': rows,
+                'starts': np.r_[0, ends[:-1]],
+                'ends': ends,
+                'tenures': self.table.tenure_years[rows]
+            }
+        return self._department_index
+
+    def _get_hire_index(self) -> Dict[str, np.ndarray]:
+        """
+        Department -> hire times inverted index, built once
+
+        Hire times (microseconds since the epoch) of department code c are
+        hires[starts[c]:ends[c]], in ascending order.
+        """
+        if self._hire_index is None:
+            dept_codes = self.table.codes['department_name']
+            hires = self.table.hire_date.astype('datetime64[us]').view(np.int64)
+            rows = np.lexsort((hires, dept_codes))
+            ends = np.cumsum(np.bincount(dept_codes, minlength=len(self.table.categories['department_name'])))
+            self._hire_index = {
+                'hires': hires[rows],
+                'starts': np.r_[0, ends[:-1]],
+                'ends': ends
+            }
+        return self._hire_index
+
+    def _get_department_codes(self) -> np.ndarray:
+        """Codes of the departments with employees, in order of first appearance in the table"""
+        if self._department_codes is None:
+            present, first_rows = np.unique(self.table.codes['department_name'], return_index=True)
+            self._department_codes = present[np.argsort(first_rows, kind='stable')]
+        return self._department_codes
+
+    @staticmethod
+    def _short_tenure_days(tenure_threshold: float) -> int:
+        """Smallest whole number of days whose tenure in years is not below the threshold"""
+        days = max(int(np.ceil(tenure_threshold * 365.25)), 0)
+        # Settle float rounding at the boundary the way tenure_days / 365.25 < threshold does
+        while days > 0 and (days - 1) / 365.25 >= tenure_threshold:
+            days -= 1
+        while days / 365.25 < tenure_threshold:
+            days += 1
+        return days
+
+    def _count_short_tenure(self, departments: Sequence[str], tenure_threshold: float) -> np.ndarray:
+        """
+        Number of employees with tenure below the threshold per department (binary search per department)
 
-        for emp in self.employees:
-            dept = emp.department_name
-            if dept not in department_data:
-                department_data[dept] = {
-                    'total': 0,
-                    'short_tenure': 0,
-                    'performance_scores': []
-                }
+        Departments are given by name: the table's department codes need not match those
+        of the aggregates (a manager's running aggregates keep their original categories).
+        """
+        index = self._get_department_index()
+        table_codes = {label: code for code, label in enumerate(self.table.categories['department_name'])}
+        counts = np.zeros(len(departments), dtype=np.int64)
+        for position, dept in enumerate(departments):
+            code = table_codes.get(dept)
+            if code is not None:
+                department_tenures = index['tenures'][index['starts'][code]:index['ends'][code]]
+                counts[position] = np.searchsorted(department_tenures, tenure_threshold, side='left')
+        return counts
 
-            department_data[dept]['total'] += 1
-            department_data[dept]['performance_scores'].append(emp.performance_score)
+    def calculate_turnover_rates(self, tenure_threshold: float = 2.0) -> Dict:
+        """
+        Calculate the turnover rate for each department
+
+        Results are memoized per tenure_threshold: repeated calls return the same
+        (shared, read-only) dictionary.
+        """
+        if tenure_threshold not in self._turnover_cache:
+            self._turnover_cache[tenure_threshold] = self._calculate_turnover_rates(tenure_threshold)
+        return self._turnover_cache[tenure_threshold]
 
-            if emp.tenure_years < tenure_threshold:
-                department_data[dept]['short_tenure'] += 1
+    def _calculate_turnover_rates(self, tenure_threshold: float) -> Dict:
+        """Build the turnover rates of calculate_turnover_rates"""
+        aggregates = self._get_aggregates()
+        codes = aggregates.group_keys('department_name')
+        totals = aggregates.marginal('count', ['department_name'])
+        performance_sums = aggregates.marginal('performance_score', ['department_name'])
+        tenure_sums = aggregates.marginal('tenure_years', ['department_name'])
+        if tenure_threshold == aggregates.tenure_threshold:
+            short_tenure = aggregates.marginal('short_tenure', ['department_name'])
+        else:
+            short_tenure = np.zeros(len(totals), dtype=np.int64)
+            short_tenure[codes] = self._count_short_tenure(
+                [aggregates.label('department_name', code) for code in codes], tenure_threshold)
 
         result = {}
-        for dept, data in department_data.items():
-            turnover_rate = (data['short_tenure'] / data['total']) * 100
-            avg_performance = sum(data['performance_scores']) / len(data['performance_scores'])
+        for code in codes:
+            dept = aggregates.label('department_name', code)
+            turnover_rate = (short_tenure[code] / totals[code]) * 100
+            avg_performance = performance_sums[code] / totals[code]
 
             result[dept] = {
-                'total_employees': data['total'],
-                'short_tenure_count': data['short_tenure'],
-                'turnover_rate': round(turnover_rate, 1),
-                'average_performance': round(avg_performance, 1),
-                'average_tenure': self._get_avg_tenure(dept)
+                'total_employees': int(totals[code]),
+                'short_tenure_count': int(short_tenure[code]),
+                'turnover_rate': round(float(turnover_rate), 1),
+                'average_performance': round(float(avg_performance), 1),
+                'average_tenure': round(float(tenure_sums[code] / totals[code]), 1)
             }
 
         return dict(sorted(result.items(), key=lambda x: x[1]['turnover_rate'], reverse=True))
 
-    def _get_avg_tenure(self, department: str) -> float:
-        """Calculate average tenure for a department"""
-        tenures = [emp.tenure_years for emp in self.employees if emp.department_name == department]
-        return round(sum(tenures) / len(tenures), 1) if tenures else 0
+    def calculate_turnover_sweep(self, tenure_thresholds: Sequence[float] = SWEEP_TENURE_THRESHOLDS) -> Dict:
+        """
+        Calculate the turnover rate of every department for many tenure thresholds at once
+
+        Tenures are sorted per department once (the index calculate_turnover_rates uses for
+        non-default thresholds); every threshold is then a binary search per department.
+
+        Args:
+            tenure_thresholds: Tenure thresholds in years (0.5 to 5 years by default)
+
+        Returns:
+            Dictionary with the departments (in order of first appearance), the thresholds,
+            total_employees per department and department x threshold arrays
+            short_tenure_count and turnover_rate (percent)
+        """
+        thresholds = np.asarray(tenure_thresholds, dtype=np.float64)
+        index = self._get_department_index()
+        codes = self._get_department_codes()
+
+        short_tenure = np.zeros((len(codes), len(thresholds)), dtype=np.int64)
+        for position, code in enumerate(codes):
+            department_tenures = index['tenures'][index['starts'][code]:index['ends'][code]]
+            short_tenure[position] = np.searchsorted(department_tenures, thresholds, side='left')
+        totals = (index['ends'] - index['starts'])[codes]
+
+        return {
+            'departments': [self.table.categories['department_name'][code] for code in codes],
+            'thresholds': thresholds,
+            'total_employees': totals,
+            'short_tenure_count': short_tenure,
+            'turnover_rate': np.round(short_tenure / totals[:, None] * 100, 1)
+        }
+
+    def calculate_turnover_time_series(self, as_of_dates: Sequence[Union[pd.Timestamp, str]],
+                                       tenure_threshold: float = 2.0) -> Dict:
+        """
+        Calculate department headcounts and short-tenure counts at many as-of dates at once
+
+        At each date only employees hired by then are counted (as in EmployeeTable.as_of),
+        and an employee has short tenure when hired less than tenure_threshold years before
+        it. Hire times are sorted per department once; each count is then a binary search,
+        so a monthly curve over several years costs no more than a few table passes.
+
+        Args:
+            as_of_dates: Dates to calculate at (Timestamps or ISO strings, e.g. month ends)
+            tenure_threshold: Tenure in years below which an employee counts as short tenure
+
+        Returns:
+            Dictionary with the dates, the departments (in order of first appearance) and
+            department x date arrays headcount, short_tenure_count and turnover_rate
+            (percent, NaN where a department has no employees yet)
+        """
+        dates = pd.DatetimeIndex(as_of_dates)
+        times = dates.values.astype('datetime64[us]').view(np.int64)
+        # tenure_days < threshold days  <=>  hired after date - threshold days (floor of whole days)
+        window = self._short_tenure_days(tenure_threshold) * MICROSECONDS_PER_DAY
+
+        index = self._get_hire_index()
+        codes = self._get_department_codes()
+        headcount = np.zeros((len(codes), len(times)), dtype=np.int64)
+        short_tenure = np.zeros((len(codes), len(times)), dtype=np.int64)
+        for position, code in enumerate(codes):
+            hires = index['hires'][index['starts'][code]:index['ends'][code]]
+            headcount[position] = np.searchsorted(hires, times, side='right')
+            short_tenure[position] = headcount[position] - np.searchsorted(hires, times - window, side='right')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            turnover_rate = np.round(short_tenure / headcount * 100, 1)
+
+        return {
+            'dates': list(dates),
+            'departments': [self.table.categories['department_name'][code] for code in codes],
+            'tenure_threshold': tenure_threshold,
+            'headcount': headcount,
+            'short_tenure_count': short_tenure,
+            'turnover_rate': turnover_rate
+        }
 
     def identify_turnover_extremes(self) -> Dict:
         """Identify the departments with the highest and lowest turnover"""
@@ -0,0 +1,41 @@
+"""
+Benchmark of the sharded aggregation engine: serial vs a process pool
+
+Run from the repository root:
+    python -m benchmarks.bench_aggregation --sizes 1000000 4000000 --jobs 1 2 4
+"""
+import argparse
+import time
+
+import numpy as np
+
+from employee import EmployeeTable
+from analyzers.AggregationEngine import AggregationEngine
+from benchmarks.synthetic import generate_employee_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000000])
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--shard-size', type=int, default=AggregationEngine.SHARD_SIZE)
+    args = parser.parse_args()
+
+    print(f"{'employees':>10} {'jobs':>5} {'time, s':>9} {'speedup':>9} {'identical':>10}")
+    for size in args.sizes:
+        table = EmployeeTable.from_records(generate_employee_records(size))
+        serial = None
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            result = AggregationEngine(table, jobs=jobs, shard_size=args.shard_size).run()
+            elapsed = time.perf_counter() - start
+
+            if serial is None:
+                serial, serial_time = result, elapsed
+            identical = (all(np.array_equal(result.cube[metric], serial.cube[metric]) for metric in serial.cube) and
+                         np.array_equal(result.salary_medians, serial.salary_medians, equal_nan=True))
+            print(f"{size:>10} {jobs:>5} {elapsed:>9.3f} {serial_time / elapsed:>8.1f}x {str(identical):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Memory and construction time of Employee records: bytes per employee, before and after slots
+
+Run from the repository root:
+    python -m benchmarks.bench_employee_memory --sizes 10000 100000
+
+The "before" columns measure LegacyEmployee, a copy of the Employee record as it was
+before it became slotted (per-instance __dict__, Timestamps parsed with pd.to_datetime,
+derived fields computed and stored at construction); "after" measures Employee.
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import pandas as pd
+
+from employee import CURRENT_DATE, Employee
+from benchmarks.synthetic import generate_employee_records
+
+
+class LegacyEmployee:
+    """Unslotted Employee record of the baseline, kept as the memory reference"""
+
+    EDUCATION_MAP = {
+        'Среднее специальное': 1,
+        'Высшее': 2,
+        'Магистратура': 3,
+        'Кандидат наук': 4,
+        'Доктор наук': 5
+    }
+
+    def __init__(self, employee_data: Dict[str, Any]):
+        self.employee_id = employee_data['employee_id']
+
+        personal_info = employee_data['personal_info']
+        self.first_name = personal_info['first_name']
+        self.last_name = personal_info['last_name']
+        self.middle_name = personal_info['middle_name']
+        self.full_name = personal_info['full_name']
+        self.gender = personal_info['gender']
+        self.birth_date = pd.to_datetime(personal_info['birth_date'])
+        self.email = personal_info['email']
+        self.phone = personal_info['phone']
+        self.address = personal_info['address']
+
+        work_info = employee_data['work_info']
+        self.department_id = work_info['department_id']
+        self.department_name = work_info['department_name']
+        self.position = work_info['position']
+        self.salary = work_info['salary']
+        self.hire_date = pd.to_datetime(work_info['hire_date'])
+        self.experience_years = work_info['experience_years']
+        self.performance_score = work_info['performance_score']
+        self.skills = work_info['skills']
+        self.is_team_lead = work_info['is_team_lead']
+        self.work_schedule = work_info['work_schedule']
+
+        additional_info = employee_data['additional_info']
+        self.education = additional_info['education']
+        self.language_skills = additional_info['language_skills']
+        self.certifications = additional_info['certifications']
+        self.has_company_car = additional_info['has_company_car']
+        self.security_clearance = additional_info['security_clearance']
+
+        # Derived fields were stored per instance
+        self.current_date = CURRENT_DATE
+        self.age = (self.current_date - self.birth_date).days / 365.25
+        self.tenure_days = (self.current_date - self.hire_date).days
+        self.tenure_years = self.tenure_days / 365.25
+        self.age_group = ("18-25" if self.age <= 25 else "26-35" if self.age <= 35 else "36-45" if self.age <= 45
+                          else "46-55" if self.age <= 55 else "56-65" if self.age <= 65 else "65+")
+        self.education_level = self.EDUCATION_MAP.get(self.education, 0)
+
+
+def measure(cls: Callable[[Dict[str, Any]], Any], records: list) -> tuple:
+    """Return (bytes per employee, microseconds per employee) of building records of a class"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    employees = [cls(record) for record in records]
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Derived fields are part of the record's cost only if they are stored
+    for employee in employees[:1000]:
+        employee.age, employee.tenure_years, employee.age_group, employee.education_level
+    return allocated / len(employees), elapsed / len(employees) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'employees':>10} {'bytes before':>13} {'bytes after':>12} {'us before':>10} {'us after':>9}")
+    for size in args.sizes:
+        # Source records are built first: strings shared with them are not counted
+        records = list(generate_employee_records(size))
+        bytes_before, micros_before = measure(LegacyEmployee, records)
+        bytes_after, micros_after = measure(Employee, records)
+        print(f"{size:>10} {bytes_before:>13.0f} {bytes_after:>12.0f} {micros_before:>10.1f} {micros_after:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
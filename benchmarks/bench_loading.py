@@ -0,0 +1,52 @@
+"""
+Benchmark of employee loading: per-object Employee construction vs the bulk EmployeeTable path
+
+Run from the repository root:
+    python -m benchmarks.bench_loading --sizes 10000 100000 1000000
+"""
+import argparse
+import time
+from typing import Callable, List
+
+from employee import EmployeeTable, create_employees_from_json
+from benchmarks.synthetic import generate_employee_records
+
+
+def load_per_object(records: List[dict]) -> EmployeeTable:
+    """Per-object path: build every (slotted) Employee, then the table from their fields"""
+    return EmployeeTable.from_employees(create_employees_from_json(records))
+
+
+def load_bulk(records: List[dict]) -> EmployeeTable:
+    """Bulk path: collect raw fields and parse dates in one vectorized pass"""
+    return EmployeeTable.from_records(records)
+
+
+def time_call(func: Callable, records: List[dict]) -> float:
+    """Return wall-clock seconds of a single call"""
+    start = time.perf_counter()
+    func(records)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--max-per-object', type=int, default=100000,
+                        help='Largest size the (slow) per-object path is timed at')
+    args = parser.parse_args()
+
+    print(f"{'employees':>10} {'per-object, s':>14} {'bulk, s':>12} {'speedup':>9}")
+    for size in args.sizes:
+        records = list(generate_employee_records(size))
+        bulk = time_call(load_bulk, records)
+
+        if size <= args.max_per_object:
+            per_object = time_call(load_per_object, records)
+            print(f"{size:>10} {per_object:>14.3f} {bulk:>12.3f} {per_object / bulk:>8.1f}x")
+        else:
+            print(f"{size:>10} {'skipped':>14} {bulk:>12.3f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of the project analyzer: columnar loading and the sparse department x project matrix
+
+Run from the repository root:
+    python -m benchmarks.bench_projects --sizes 10000 100000 --departments 3000
+"""
+import argparse
+import time
+
+from analyzers.ProjectAnalyzer import ProjectAnalyzer, ProjectTable
+from benchmarks.synthetic import generate_project_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--departments', type=int, default=3000)
+    args = parser.parse_args()
+
+    print(f"{'projects':>10} {'departments':>12} {'allocations':>12} {'table, s':>9} {'matrix, s':>10} {'metrics, s':>11}")
+    for size in args.sizes:
+        records = list(generate_project_records(size, departments=args.departments))
+
+        start = time.perf_counter()
+        projects = ProjectTable.from_records(records)
+        table_time = time.perf_counter() - start
+
+        analyzer = ProjectAnalyzer(projects)
+        start = time.perf_counter()
+        matrix = analyzer.matrix
+        matrix_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        analyzer.calculate_department_project_load()
+        metrics_time = time.perf_counter() - start
+
+        print(f"{size:>10} {matrix.shape[0]:>12} {matrix.nnz:>12} {table_time:>9.3f} {matrix_time:>10.3f} {metrics_time:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
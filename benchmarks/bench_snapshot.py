@@ -0,0 +1,53 @@
+"""
+Cold start of a company export: parsing the JSON vs loading a columnar snapshot or mapping raw columns
+
+Run from the repository root:
+    python -m benchmarks.bench_snapshot --sizes 100000 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from employee import EmployeeTable, load_employees_from_file, pa
+from benchmarks.bench_streaming import write_company_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    args = parser.parse_args()
+
+    formats = ['.npz'] + (['.parquet'] if pa is not None else []) + ['mapped']
+    print(f"{'employees':>10} {'format':>9} {'json, s':>9} {'snapshot, s':>12} {'file MB':>8} {'snapshot MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            json_path = os.path.join(tmp, f"company_{size}.json")
+            write_company_file(json_path, size)
+
+            start = time.perf_counter()
+            table = load_employees_from_file(json_path, as_table=True)
+            json_seconds = time.perf_counter() - start
+
+            for extension in formats:
+                path = os.path.join(tmp, f"company_{size}.employees{extension}")
+                if extension == 'mapped':
+                    table.save_columns(path)
+                    start = time.perf_counter()
+                    EmployeeTable.open_mapped(path)
+                    snapshot_seconds = time.perf_counter() - start
+                    snapshot_bytes = sum(entry.stat().st_size for entry in os.scandir(path))
+                else:
+                    table.save_snapshot(path)
+                    start = time.perf_counter()
+                    EmployeeTable.load_snapshot(path)
+                    snapshot_seconds = time.perf_counter() - start
+                    snapshot_bytes = os.path.getsize(path)
+
+                print(f"{size:>10} {extension:>9} {json_seconds:>9.2f} {snapshot_seconds:>12.3f} "
+                      f"{os.path.getsize(json_path) / 2 ** 20:>8.0f} {snapshot_bytes / 2 ** 20:>12.1f}")
+            os.remove(json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Peak memory of loading a company export: json.load vs the streaming EmployeeTable path
+
+Run from the repository root:
+    python -m benchmarks.bench_streaming --sizes 10000 100000 300000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_employee_records
+
+
+def write_company_file(path: str, employees: int):
+    """Write a synthetic company export with a large non-employee section before the employees"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"metadata": {"data_version": "1.0"}, "projects": [')
+        for i in range(employees):
+            if i:
+                f.write(',')
+            json.dump({'project_id': f"PROJ_{i}", 'description': 'x' * 200, 'metrics': {'risk_level': 'low'}},
+                      f, ensure_ascii=False)
+        f.write('], "employees": [')
+        for i, record in enumerate(generate_employee_records(employees)):
+            if i:
+                f.write(',')
+            json.dump(record, f, ensure_ascii=False)
+        f.write('], "company_overview": {}}')
+
+
+def run_child(path: str, mode: str):
+    """Load the file in this process and print elapsed seconds and peak RSS in MB"""
+    from employee import EmployeeTable, load_employees_from_file
+
+    start = time.perf_counter()
+    if mode == 'stream':
+        table = load_employees_from_file(path, as_table=True)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            table = EmployeeTable.from_records(json.load(f)['employees'])
+    elapsed = time.perf_counter() - start
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{len(table)} {elapsed:.3f} {peak_mb:.1f}")
+
+
+def measure(path: str, mode: str):
+    """Run a loading mode in a fresh interpreter and return (seconds, peak MB)"""
+    output = subprocess.run([sys.executable, '-m', 'benchmarks.bench_streaming', '--child', path, mode],
+                            capture_output=True, text=True, check=True).stdout.split()
+    return float(output[1]), float(output[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 300000])
+    parser.add_argument('--child', nargs=2, metavar=('PATH', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    print(f"{'employees':>10} {'file, MB':>9} {'json.load s':>12} {'peak MB':>8} {'stream s':>9} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"company_{size}.json")
+            write_company_file(path, size)
+            file_mb = os.path.getsize(path) / 2 ** 20
+
+            load_s, load_mb = measure(path, 'load')
+            stream_s, stream_mb = measure(path, 'stream')
+            print(f"{size:>10} {file_mb:>9.0f} {load_s:>12.2f} {load_mb:>8.0f} {stream_s:>9.2f} {stream_mb:>8.0f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
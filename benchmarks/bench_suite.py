@@ -0,0 +1,267 @@
+"""
+Benchmark suite: time and peak memory of loading, records and every public analyzer method
+
+Run from the repository root:
+    python -m benchmarks.bench_suite run --sizes 1000 10000 100000 1000000 --output results.json
+    python -m benchmarks.bench_suite compare baseline.json results.json
+
+run writes a JSON results file (one entry per case and size: best-of-N seconds and
+tracemalloc peak bytes); compare flags cases that got slower or use more memory than in
+the baseline and fits each case's scaling exponent (time ~ size^k) over the sizes.
+
+Analyzer method cases get aggregates computed beforehand (as main.py shares them between
+analyzers), so they time the method alone; the '<Analyzer>[cold]' cases time a fresh
+analyzer without aggregates running all its methods, aggregation pass included.
+"""
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import main as main_module
+from employee import Employee, EmployeeManager, snapshot_path
+from analyzers.AggregationEngine import aggregate
+from analyzers.DemographicAnalyzer import DemographicAnalyzer
+from analyzers.TurnoverAnalyzer import TurnoverAnalyzer
+from analyzers.EducationAnalyzer import EducationAnalyzer
+from analyzers.CareerDevelompentAnalyzer import CareerDevelopmentAnalyzer
+from analyzers.HRStrategyAdvisor import HRStrategyAdvisor
+from benchmarks.synthetic import generate_employee_records
+
+ANALYZERS = [DemographicAnalyzer, TurnoverAnalyzer, EducationAnalyzer, CareerDevelopmentAnalyzer, HRStrategyAdvisor]
+
+# Month-end frequency alias ('M' was renamed to 'ME' in pandas 2.2)
+MONTH_END = 'ME' if tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2) else 'M'
+
+# Arguments of public methods without defaults
+METHOD_ARGUMENTS = {
+    'calculate_turnover_time_series': (tuple(pd.date_range('2015-01-31', '2025-09-30', freq=MONTH_END)),)
+}
+
+# Benchmark case: (name, setup returning the call's argument, call)
+Case = Tuple[str, Callable[[], Any], Callable[[Any], Any]]
+
+
+def write_company_file(path: str, employees: int):
+    """Write a synthetic company export with only an employees section"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"employees": [')
+        for i, record in enumerate(generate_employee_records(employees)):
+            if i:
+                f.write(',')
+            json.dump(record, f, ensure_ascii=False)
+        f.write(']}')
+
+
+def measure(setup: Callable[[], Any], call: Callable[[Any], Any], repeat: int,
+            memory: bool) -> Tuple[float, Optional[int]]:
+    """
+    Return (best seconds over repeat calls, peak traced bytes of one more call)
+
+    Setup runs before every call and is neither timed nor traced; time is measured
+    without tracemalloc, which slows allocations down.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        call(argument)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        argument = setup()
+        tracemalloc.start()
+        call(argument)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def public_methods(cls: type) -> List[str]:
+    """Public methods of an analyzer class, in definition order"""
+    return [name for name, member in vars(cls).items() if callable(member) and not name.startswith('_')]
+
+
+def method_call(method: str) -> Callable[[Any], Any]:
+    """Call of an analyzer method with its benchmark arguments; reports are printed to a buffer"""
+    arguments = METHOD_ARGUMENTS.get(method, ())
+
+    def call(analyzer: Any):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return getattr(analyzer, method)(*arguments)
+    return call
+
+
+def benchmark_methods(cls: type) -> List[str]:
+    """Public methods of an analyzer class that can be called with METHOD_ARGUMENTS or defaults"""
+    methods = []
+    for method in public_methods(cls):
+        parameters = list(inspect.signature(getattr(cls, method)).parameters.values())[1:]
+        required = [p for p in parameters if p.default is inspect.Parameter.empty]
+        if not required or method in METHOD_ARGUMENTS:
+            methods.append(method)
+    return methods
+
+
+def cold_call(cls: type) -> Callable[[Any], Any]:
+    """Run every benchmark method of a fresh analyzer (it aggregates the table itself)"""
+    calls = [method_call(method) for method in benchmark_methods(cls)]
+
+    def call(table: Any):
+        analyzer = cls(table)
+        for method in calls:
+            method(analyzer)
+    return call
+
+
+def build_cases(path: str, size: int, max_per_object: int) -> List[Case]:
+    """Benchmark cases over the synthetic company file of one size"""
+    def cold_load():
+        # Without a snapshot load_data parses the JSON (and writes the snapshot)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(snapshot_path(path))
+        return path
+
+    table = main_module.load_data(path)
+    aggregates = aggregate(table)
+
+    cases = [
+        ('load_data', cold_load, main_module.load_data),
+        ('load_data[snapshot]', lambda: path, main_module.load_data),
+        ('aggregate', lambda: table, aggregate)
+    ]
+    if size <= max_per_object:
+        records = list(generate_employee_records(size))
+        cases.append(('Employee.__init__', lambda: records, lambda items: [Employee(record) for record in items]))
+    cases.append(('EmployeeManager.get_analytics_dataframe', lambda: EmployeeManager(table),
+                  lambda manager: manager.get_analytics_dataframe()))
+
+    for cls in ANALYZERS:
+        for method in benchmark_methods(cls):
+            # A fresh analyzer per call, so per-instance memoization does not hide the cost
+            cases.append((f"{cls.__name__}.{method}", lambda cls=cls: cls(table, aggregates), method_call(method)))
+        cases.append((f"{cls.__name__}[cold]", lambda: table, cold_call(cls)))
+    return cases
+
+
+def run(args: argparse.Namespace):
+    """Run all cases at every size and write the results file"""
+    results = []
+    print(f"{'case':<64} {'employees':>10} {'time, s':>10} {'peak MB':>9}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'company.json')
+            write_company_file(path, size)
+            for name, setup, call in build_cases(path, size, args.max_per_object):
+                if args.filter and args.filter not in name:
+                    continue
+                seconds, peak = measure(setup, call, args.repeat, not args.no_memory)
+                results.append({'case': name, 'size': size, 'seconds': seconds, 'peak_bytes': peak})
+                peak_text = '-' if peak is None else f"{peak / 2 ** 20:.1f}"
+                print(f"{name:<64} {size:>10} {seconds:>10.4f} {peak_text:>9}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'metadata': {
+                'created': pd.Timestamp.now().isoformat(),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'pandas': pd.__version__,
+                'platform': platform.platform(),
+                'repeat': args.repeat
+            },
+            'results': results
+        }, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+def scaling_exponent(points: List[Tuple[int, float]]) -> Optional[float]:
+    """Slope of log(time) over log(size): about 1 for linear cases, None with fewer than 2 sizes"""
+    points = [(size, seconds) for size, seconds in points if seconds > 0]
+    if len({size for size, _ in points}) < 2:
+        return None
+    sizes, seconds = zip(*points)
+    return float(np.polyfit(np.log(sizes), np.log(seconds), 1)[0])
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Print current vs baseline per case and size; return 1 if any regression was flagged"""
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = {(entry['case'], entry['size']): entry for entry in json.load(f)['results']}
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)['results']
+
+    regressions = 0
+    print(f"{'case':<64} {'employees':>10} {'base, s':>10} {'now, s':>10} {'time':>7} {'memory':>7}  flag")
+    for entry in current:
+        before = baseline.get((entry['case'], entry['size']))
+        if before is None:
+            continue
+        time_ratio = entry['seconds'] / before['seconds'] if before['seconds'] else float('inf')
+        slower = time_ratio > args.threshold and entry['seconds'] - before['seconds'] > args.min_seconds
+        memory_ratio = None
+        if entry.get('peak_bytes') is not None and before.get('peak_bytes'):
+            memory_ratio = entry['peak_bytes'] / before['peak_bytes']
+        larger = (memory_ratio is not None and memory_ratio > args.threshold and
+                  entry['peak_bytes'] - before['peak_bytes'] > args.min_bytes)
+
+        flags = [flag for flag, raised in [('SLOWER', slower), ('MORE MEMORY', larger)] if raised]
+        regressions += bool(flags)
+        memory_text = '-' if memory_ratio is None else f"{memory_ratio:.2f}x"
+        print(f"{entry['case']:<64} {entry['size']:>10} {before['seconds']:>10.4f} {entry['seconds']:>10.4f} "
+              f"{time_ratio:>6.2f}x {memory_text:>7}  {', '.join(flags)}")
+
+    print(f"\n{'case':<64} {'exponent (base)':>16} {'exponent (now)':>15}")
+    for case in dict.fromkeys(entry['case'] for entry in current):
+        now = scaling_exponent([(entry['size'], entry['seconds']) for entry in current if entry['case'] == case])
+        base = scaling_exponent([(size, entry['seconds']) for (name, size), entry in baseline.items() if name == case])
+        print(f"{case:<64} {'-' if base is None else f'{base:.2f}':>16} {'-' if now is None else f'{now:.2f}':>15}")
+
+    print(f"\n{regressions} regression(s) (threshold {args.threshold}x)")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the benchmarks and write a results file")
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    run_parser.add_argument('--repeat', type=int, default=3, help="Timed calls per case (the best is kept)")
+    run_parser.add_argument('--output', default='bench_results.json')
+    run_parser.add_argument('--filter', help="Only run cases whose name contains this text")
+    run_parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass")
+    run_parser.add_argument('--max-per-object', type=int, default=100000,
+                            help="Largest size Employee.__init__ (one object per record) is measured at")
+
+    compare_parser = commands.add_parser('compare', help="Compare a results file against a baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=1.25,
+                                help="Ratio to the baseline above which a case is flagged")
+    compare_parser.add_argument('--min-seconds', type=float, default=0.001,
+                                help="Slowdowns smaller than this are never flagged (timer noise)")
+    compare_parser.add_argument('--min-bytes', type=int, default=1 << 20,
+                                help="Memory growth smaller than this is never flagged")
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
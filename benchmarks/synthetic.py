@@ -0,0 +1,151 @@
+import numpy as np
+from typing import Dict, Iterator
+
+GENDERS = ['male', 'female']
+EDUCATIONS = ['Среднее специальное', 'Высшее', 'Магистратура', 'Кандидат наук', 'Доктор наук']
+POSITIONS = ['Инженер', 'Старший разработчик', 'Аналитик', 'Team Lead', 'Менеджер проектов',
+             'Ведущий исследователь', 'Архитектор ПО', 'Специалист']
+FIRST_NAMES = ['Анна', 'Иван', 'Ольга', 'Сергей', 'Мария', 'Виктор']
+LAST_NAMES = ['Иванов', 'Петрова', 'Смирнов', 'Кузнецова', 'Орлов', 'Морозова']
+SKILLS = ['Python', 'SQL', 'Git', 'Docker']
+LANGUAGES = ['Русский', 'Английский']
+
+
+def generate_employee_records(count: int, departments: int = 30, seed: int = 0,
+                              chunk_size: int = 100000) -> Iterator[Dict]:
+    """
+    Generate synthetic employee records in the company.json layout
+
+    Records are produced lazily in chunks so very large workforces do not have to
+    be held in memory at once.
+
+    Args:
+        count: Number of employees to generate
+        departments: Number of distinct departments
+        seed: Random seed (same seed gives the same records)
+        chunk_size: Number of records generated per vectorized batch
+    """
+    rng = np.random.default_rng(seed)
+    department_names = [f"Отдел {i}" for i in range(1, departments + 1)]
+
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        birth_dates = np.datetime_as_string(
+            np.datetime64('1960-01-01') + rng.integers(0, 365 * 45, size).astype('timedelta64[D]'), unit='D')
+        hire_dates = np.datetime_as_string(
+            np.datetime64('2000-01-01T22:30:00.755032')
+            + (rng.integers(0, 365 * 25, size) * 86400).astype('timedelta64[s]'), unit='us')
+        department_ids = rng.integers(0, departments, size)
+        genders = rng.integers(0, len(GENDERS), size)
+        educations = rng.integers(0, len(EDUCATIONS), size)
+        positions = rng.integers(0, len(POSITIONS), size)
+        salaries = rng.integers(60000, 300000, size)
+        experiences = rng.integers(0, 35, size)
+        performance = np.round(rng.uniform(50, 100, size), 1)
+        team_leads = rng.random(size) < 0.15
+        certifications = rng.integers(0, 5, size)
+
+        for i in range(size):
+            first_name = FIRST_NAMES[i % len(FIRST_NAMES)]
+            last_name = LAST_NAMES[(i // 7) % len(LAST_NAMES)]
+            department_id = int(department_ids[i])
+            yield {
+                'employee_id': start + i + 1,
+                'personal_info': {
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'middle_name': '',
+                    'full_name': f"{last_name} {first_name}",
+                    'gender': GENDERS[genders[i]],
+                    'birth_date': str(birth_dates[i]),
+                    'email': '',
+                    'phone': '',
+                    'address': ''
+                },
+                'work_info': {
+                    'department_id': department_id + 1,
+                    'department_name': department_names[department_id],
+                    'position': POSITIONS[positions[i]],
+                    'salary': int(salaries[i]),
+                    'hire_date': str(hire_dates[i]),
+                    'experience_years': int(experiences[i]),
+                    'performance_score': float(performance[i]),
+                    'skills': SKILLS,
+                    'is_team_lead': bool(team_leads[i]),
+                    'work_schedule': 'офис'
+                },
+                'additional_info': {
+                    'education': EDUCATIONS[educations[i]],
+                    'language_skills': LANGUAGES,
+                    'certifications': int(certifications[i]),
+                    'has_company_car': False,
+                    'security_clearance': False
+                }
+            }
+
+
+PROJECT_STATUSES = ['active', 'completed', 'planning', 'on_hold']
+RISK_LEVELS = ['low', 'medium', 'high']
+PRIORITIES = ['low', 'medium', 'high', 'critical']
+
+
+def generate_project_records(count: int, departments: int = 30, seed: int = 0,
+                             chunk_size: int = 100000) -> Iterator[Dict]:
+    """
+    Generate synthetic project records in the company.json layout
+
+    Every project has 1 to 4 participating departments, as in company.json.
+
+    Args:
+        count: Number of projects to generate
+        departments: Number of distinct departments
+        seed: Random seed (same seed gives the same records)
+        chunk_size: Number of records generated per vectorized batch
+    """
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        start_days = rng.integers(0, 365 * 5, size)
+        durations = rng.integers(30, 730, size)
+        start_dates = np.datetime64('2021-01-01T22:30:00.824047') + (start_days * 86400).astype('timedelta64[s]')
+        end_dates = start_dates + (durations * 86400).astype('timedelta64[s]')
+        start_dates = np.datetime_as_string(start_dates, unit='us')
+        end_dates = np.datetime_as_string(end_dates, unit='us')
+        budgets = rng.integers(500000, 5000000, size)
+        costs = np.round(budgets * rng.uniform(0.1, 1.3, size)).astype(np.int64)
+        statuses = rng.integers(0, len(PROJECT_STATUSES), size)
+        risks = rng.integers(0, len(RISK_LEVELS), size)
+        priorities = rng.integers(0, len(PRIORITIES), size)
+        completion = rng.integers(0, 101, size)
+        participants = rng.integers(1, 5, size)
+
+        for i in range(size):
+            department_ids = rng.choice(departments, int(participants[i]), replace=False) + 1
+            yield {
+                'project_id': f"PROJ_{start + i + 1:06d}",
+                'name': f"Проект {start + i + 1}",
+                'description': '',
+                'status': PROJECT_STATUSES[statuses[i]],
+                'timeline': {
+                    'start_date': str(start_dates[i]),
+                    'end_date': str(end_dates[i]),
+                    'duration_days': int(durations[i])
+                },
+                'financials': {
+                    'budget': int(budgets[i]),
+                    'actual_cost': int(costs[i]),
+                    'profit': 0,
+                    'roi_percentage': 0
+                },
+                'participating_departments': [{
+                    'department_id': int(department_id),
+                    'department_name': f"Отдел {department_id}",
+                    'budget_allocation': int(budgets[i] // len(department_ids))
+                } for department_id in department_ids],
+                'metrics': {
+                    'completion_percentage': int(completion[i]),
+                    'risk_level': RISK_LEVELS[risks[i]],
+                    'priority': PRIORITIES[priorities[i]]
+                }
+            }
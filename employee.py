@@ -1,10 +1,106 @@
+import bisect
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
+from json_stream import iter_json_array
+
+if TYPE_CHECKING:
+    # For annotations only: the analyzers package imports this module
+    from analyzers.AggregationEngine import GroupedAggregates
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet snapshots are optional, .npz is used without pyarrow
+    pa = None
+    pq = None
+
+# Generation date of the company data, used as "today" for age and tenure
+CURRENT_DATE = pd.Timestamp('2025-10-05')
+
+# Age group labels and their (inclusive) upper bounds, shared by Employee and EmployeeTable
+AGE_GROUPS = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
+AGE_GROUP_BOUNDS = [25, 35, 45, 55, 65]
+
+# Numerical mapping of education levels
+EDUCATION_LEVELS = {
+    'Среднее специальное': 1,  # Vocational/Technical
+    'Высшее': 2,  # Bachelor's
+    'Магистратура': 3,  # Master's
+    'Кандидат наук': 4,  # PhD Candidate
+    'Доктор наук': 5  # Doctor of Sciences
+}
+HIGHER_EDUCATION = ['Магистратура', 'Кандидат наук', 'Доктор наук']
+
+MICROSECONDS_PER_DAY = 86400 * 10 ** 6
+
+# Bumped whenever the snapshot layout or the derived columns change
+SNAPSHOT_VERSION = 2
+
+
+def parse_timestamp(value: str) -> int:
+    """Parse an ISO date or datetime string into microseconds since the epoch"""
+    return int(np.datetime64(value, 'us').astype(np.int64))
+
+
+def current_timestamp(current_date: pd.Timestamp) -> int:
+    """Microseconds since the epoch of an as-of date"""
+    return current_date.value // 1000
+
+
+def calculate_derived_columns(birth_dates: np.ndarray, hire_dates: np.ndarray,
+                              current_date: pd.Timestamp = CURRENT_DATE) -> Dict[str, np.ndarray]:
+    """
+    Calculate age and tenure for all employees at once (vectorized Employee._calculate_derived_fields)
+
+    Args:
+        birth_dates: datetime64 array of birth dates
+        hire_dates: datetime64 array of hire dates
+        current_date: Date the age and tenure are calculated at
+
+    Returns:
+        Dictionary with age, tenure_days and tenure_years arrays
+    """
+    current = np.datetime64(current_date, 'us')
+    one_day = np.timedelta64(1, 'D')
+
+    # Floor division matches Timedelta.days for partial days
+    age_days = (current - birth_dates) // one_day
+    tenure_days = (current - hire_dates) // one_day
+
+    return {
+        'age': age_days / 365.25,
+        'tenure_days': tenure_days,
+        'tenure_years': tenure_days / 365.25
+    }
 
 
 class Employee:
-    """Class representing an employee with all personal, work, and additional information"""
+    """Class representing an employee with all personal, work, and additional information
+
+    Records are slotted (no per-instance __dict__). Department, position, education and
+    other repeated labels are interned, dates are kept as integer timestamps
+    (microseconds since the epoch, the unit of EmployeeTable date columns) and age,
+    tenure, age group and education level are computed on demand.
+    """
+
+    __slots__ = (
+        'employee_id',
+        'first_name', 'last_name', 'middle_name', 'full_name', 'gender', 'birth_timestamp',
+        'email', 'phone', 'address',
+        'department_id', 'department_name', 'position', 'salary', 'hire_timestamp', 'experience_years',
+        'performance_score', 'skills', 'is_team_lead', 'work_schedule',
+        'education', 'language_skills', 'certifications', 'has_company_car', 'security_clearance'
+    )
+
+    # Date age and tenure are calculated at
+    current_date = CURRENT_DATE
 
     def __init__(self, employee_data: Dict[str, Any]):
         """
@@ -22,8 +118,8 @@ class Employee:
         self.last_name = personal_info['last_name']
         self.middle_name = personal_info['middle_name']
         self.full_name = personal_info['full_name']
-        self.gender = personal_info['gender']
-        self.birth_date = pd.to_datetime(personal_info['birth_date'])
+        self.gender = sys.intern(personal_info['gender'])
+        self.birth_timestamp = parse_timestamp(personal_info['birth_date'])
         self.email = personal_info['email']
         self.phone = personal_info['phone']
         self.address = personal_info['address']
@@ -31,70 +127,66 @@ class Employee:
         # Work Information
         work_info = employee_data['work_info']
         self.department_id = work_info['department_id']
-        self.department_name = work_info['department_name']
-        self.position = work_info['position']
+        self.department_name = sys.intern(work_info['department_name'])
+        self.position = sys.intern(work_info['position'])
         self.salary = work_info['salary']
-        self.hire_date = pd.to_datetime(work_info['hire_date'])
+        self.hire_timestamp = parse_timestamp(work_info['hire_date'])
         self.experience_years = work_info['experience_years']
         self.performance_score = work_info['performance_score']
         self.skills = work_info['skills']
         self.is_team_lead = work_info['is_team_lead']
-        self.work_schedule = work_info['work_schedule']
+        self.work_schedule = sys.intern(work_info['work_schedule'])
 
         # Additional Information
         additional_info = employee_data['additional_info']
-        self.education = additional_info['education']
+        self.education = sys.intern(additional_info['education'])
         self.language_skills = additional_info['language_skills']
         self.certifications = additional_info['certifications']
         self.has_company_car = additional_info['has_company_car']
         self.security_clearance = additional_info['security_clearance']
 
-        # Calculated fields
-        self._calculate_derived_fields()
+    @property
+    def birth_date(self) -> pd.Timestamp:
+        """Birth date as a Timestamp"""
+        return pd.Timestamp(self.birth_timestamp, unit='us')
+
+    @property
+    def hire_date(self) -> pd.Timestamp:
+        """Hire date as a Timestamp"""
+        return pd.Timestamp(self.hire_timestamp, unit='us')
 
-    def _calculate_derived_fields(self):
-        """Calculate derived fields like age and tenure"""
-        # Use generation date from metadata as current date
-        self.current_date = pd.to_datetime('2025-10-05')
+    @property
+    def age(self) -> float:
+        """Age in years at current_date"""
+        return (current_timestamp(self.current_date) - self.birth_timestamp) // MICROSECONDS_PER_DAY / 365.25
 
-        # Calculate age
-        self.age = (self.current_date - self.birth_date).days / 365.25
+    @property
+    def tenure_days(self) -> int:
+        """Full days since hire at current_date"""
+        return (current_timestamp(self.current_date) - self.hire_timestamp) // MICROSECONDS_PER_DAY
 
-        # Calculate tenure
-        self.tenure_days = (self.current_date - self.hire_date).days
-        self.tenure_years = self.tenure_days / 365.25
+    @property
+    def tenure_years(self) -> float:
+        """Tenure in years at current_date"""
+        return self.tenure_days / 365.25
 
-        # Age group categorization
-        self.age_group = self._get_age_group()
+    @property
+    def age_group(self) -> str:
+        """Age group of the employee"""
+        return self._get_age_group()
 
-        # Education level numerical mapping
-        self.education_level = self._map_education_level()
+    @property
+    def education_level(self) -> int:
+        """Numerical education level"""
+        return self._map_education_level()
 
     def _get_age_group(self) -> str:
         """Categorize employee into age group"""
-        if self.age <= 25:
-            return "18-25"
-        elif self.age <= 35:
-            return "26-35"
-        elif self.age <= 45:
-            return "36-45"
-        elif self.age <= 55:
-            return "46-55"
-        elif self.age <= 65:
-            return "56-65"
-        else:
-            return "65+"
+        return AGE_GROUPS[bisect.bisect_left(AGE_GROUP_BOUNDS, self.age)]
 
     def _map_education_level(self) -> int:
         """Map education level to numerical value for analysis"""
-        education_map = {
-            'Среднее специальное': 1,  # Vocational/Technical
-            'Высшее': 2,  # Bachelor's
-            'Магистратура': 3,  # Master's
-            'Кандидат наук': 4,  # PhD Candidate
-            'Доктор наук': 5  # Doctor of Sciences
-        }
-        return education_map.get(self.education, 0)
+        return EDUCATION_LEVELS.get(self.education, 0)
 
     def is_high_performer(self, threshold: float = 85.0) -> bool:
         """Check if employee is a high performer"""
@@ -106,8 +198,7 @@ class Employee:
 
     def has_higher_education(self) -> bool:
         """Check if employee has higher education (Master's, PhD, Doctor)"""
-        higher_education = ['Магистратура', 'Кандидат наук', 'Доктор наук']
-        return self.education in higher_education
+        return self.education in HIGHER_EDUCATION
 
     def get_employee_summary(self) -> Dict[str, Any]:
         """Get comprehensive employee summary for analysis"""
@@ -218,50 +309,954 @@ class Employee:
         }
 
 
+class EmployeeTable:
+    """Columnar storage of the employee fields used by the analyzers
+
+    Numeric fields are NumPy arrays with one element per employee. String fields are
+    dictionary-encoded: an integer code per employee plus the list of distinct labels
+    (in order of first appearance, so grouped results keep the original ordering).
+    """
+
+    NUMERIC_FIELDS = {
+        'employee_id': np.int64,
+        'department_id': np.int32,
+        'salary': np.int64,
+        'performance_score': np.float64,
+        # Whether the source score was an integer (JSON 95 vs 95.0), to hand it back unchanged
+        'performance_score_is_integer': np.bool_,
+        'age': np.float64,
+        'tenure_days': np.int32,
+        'tenure_years': np.float64,
+        'experience_years': np.int32,
+        'education_level': np.int8,
+        'is_team_lead': np.bool_,
+        'certifications': np.int16,
+        'skills_count': np.int16,
+        'languages_count': np.int16
+    }
+    DATE_FIELDS = ['birth_date', 'hire_date']
+    CATEGORICAL_FIELDS = ['department_name', 'position', 'gender', 'education']
+    TEXT_FIELDS = ['first_name', 'last_name']
+
+    def __init__(self, columns: Dict[str, np.ndarray], codes: Dict[str, np.ndarray],
+                 categories: Dict[str, List[str]], current_date: pd.Timestamp = CURRENT_DATE):
+        """
+        Initialize table from already encoded columns
+
+        Args:
+            columns: Numeric and text columns by field name
+            codes: Integer codes of the categorical fields
+            categories: Distinct labels of the categorical fields (code -> label)
+            current_date: Date age, tenure and age group are calculated at
+        """
+        self.columns = columns
+        self.codes = codes
+        self.categories = categories
+        self.current_date = current_date
+
+    @classmethod
+    def from_columns(cls, data: Dict[str, Sequence], current_date: pd.Timestamp = CURRENT_DATE) -> 'EmployeeTable':
+        """Build table from plain per-field sequences (dictionary-encodes string fields)"""
+        columns = {name: np.asarray(data[name], dtype=dtype) for name, dtype in cls.NUMERIC_FIELDS.items()}
+        for name in cls.DATE_FIELDS:
+            columns[name] = np.asarray(data[name], dtype='datetime64[us]')
+        for name in cls.TEXT_FIELDS:
+            columns[name] = np.asarray(data[name], dtype=object)
+
+        codes = {}
+        categories = {}
+        for name in cls.CATEGORICAL_FIELDS:
+            field_codes, labels = pd.factorize(np.asarray(data[name], dtype=object))
+            codes[name] = field_codes.astype(np.int32)
+            categories[name] = list(labels)
+
+        # Age groups use the fixed label order
+        codes['age_group'] = np.digitize(columns['age'], AGE_GROUP_BOUNDS, right=True).astype(np.int8)
+        categories['age_group'] = list(AGE_GROUPS)
+
+        return cls(columns, codes, categories, current_date)
+
+    @classmethod
+    def from_employees(cls, employees: List['Employee'],
+                       current_date: pd.Timestamp = CURRENT_DATE) -> 'EmployeeTable':
+        """Build table from a list of Employee objects (derived fields are computed as array operations)"""
+        data = {name: [getattr(emp, name) for emp in employees]
+                for name in cls._empty_raw_columns() if name not in cls.DATE_FIELDS + ['skills_count', 'languages_count']}
+        data['birth_date'] = np.array([emp.birth_timestamp for emp in employees], dtype=np.int64).view('datetime64[us]')
+        data['hire_date'] = np.array([emp.hire_timestamp for emp in employees], dtype=np.int64).view('datetime64[us]')
+        data['skills_count'] = [len(emp.skills) for emp in employees]
+        data['languages_count'] = [len(emp.language_skills) for emp in employees]
+        return cls.from_raw_columns(data, current_date)
+
+    @staticmethod
+    def _empty_raw_columns() -> Dict[str, List]:
+        """Per-field lists collected by from_records"""
+        return {name: [] for name in ['employee_id', 'department_id', 'salary', 'performance_score',
+                                      'experience_years', 'is_team_lead', 'certifications',
+                                      'skills_count', 'languages_count'] +
+                EmployeeTable.DATE_FIELDS + EmployeeTable.CATEGORICAL_FIELDS + EmployeeTable.TEXT_FIELDS}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], current_date: pd.Timestamp = CURRENT_DATE,
+                     batch_size: int = 100000) -> 'EmployeeTable':
+        """
+        Build table directly from raw JSON employee records (bulk loading path)
+
+        Only the fields used by the analyzers are collected. Records are consumed in
+        batches: each batch is converted to compact arrays (dates parsed in one vectorized
+        pass, derived fields computed as array operations) before the next one is read,
+        so records can be streamed without keeping Python objects for all of them.
+
+        Args:
+            records: Iterable of employee dictionaries in the company.json layout
+            current_date: Date age and tenure are calculated at
+            batch_size: Number of records converted to arrays at once
+        """
+        batches = []
+        data = cls._empty_raw_columns()
+
+        for record in records:
+            personal_info = record['personal_info']
+            work_info = record['work_info']
+            additional_info = record['additional_info']
+
+            data['employee_id'].append(record['employee_id'])
+            data['first_name'].append(personal_info['first_name'])
+            data['last_name'].append(personal_info['last_name'])
+            data['gender'].append(personal_info['gender'])
+            data['birth_date'].append(personal_info['birth_date'])
+            data['department_id'].append(work_info['department_id'])
+            data['department_name'].append(work_info['department_name'])
+            data['position'].append(work_info['position'])
+            data['salary'].append(work_info['salary'])
+            data['hire_date'].append(work_info['hire_date'])
+            data['experience_years'].append(work_info['experience_years'])
+            data['performance_score'].append(work_info['performance_score'])
+            data['skills_count'].append(len(work_info['skills']))
+            data['is_team_lead'].append(work_info['is_team_lead'])
+            data['education'].append(additional_info['education'])
+            data['languages_count'].append(len(additional_info['language_skills']))
+            data['certifications'].append(additional_info['certifications'])
+
+            if len(data['employee_id']) >= batch_size:
+                batches.append(cls.from_raw_columns(data, current_date))
+                data = cls._empty_raw_columns()
+
+        if data['employee_id'] or not batches:
+            batches.append(cls.from_raw_columns(data, current_date))
+
+        return cls.concat(batches)
+
+    @classmethod
+    def from_raw_columns(cls, data: Dict[str, List], current_date: pd.Timestamp = CURRENT_DATE) -> 'EmployeeTable':
+        """Build table from per-field lists with dates still as ISO strings"""
+        for name in cls.DATE_FIELDS:
+            data[name] = np.array(data[name], dtype='datetime64[us]')
+
+        # Share one string object per distinct name instead of one per employee
+        for name in cls.TEXT_FIELDS:
+            name_codes, names = pd.factorize(np.asarray(data[name], dtype=object))
+            data[name] = np.asarray(names, dtype=object)[name_codes]
+
+        data['performance_score_is_integer'] = [isinstance(score, int) for score in data['performance_score']]
+        data.update(calculate_derived_columns(data['birth_date'], data['hire_date'], current_date))
+        education_codes, education_labels = pd.factorize(np.asarray(data['education'], dtype=object))
+        data['education_level'] = np.array([EDUCATION_LEVELS.get(label, 0) for label in education_labels],
+                                           dtype=np.int8)[education_codes]
+        return cls.from_columns(data, current_date)
+
+    def __len__(self) -> int:
+        """Return number of employees"""
+        return len(self.columns['employee_id'])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Access numeric and text columns as attributes (table.salary)"""
+        columns = self.__dict__.get('columns')
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the table in bytes"""
+        total = sum(column.nbytes for column in self.columns.values())
+        total += sum(field_codes.nbytes for field_codes in self.codes.values())
+        return total
+
+    def labels(self, name: str) -> np.ndarray:
+        """Decode a categorical field into per-employee labels"""
+        return np.asarray(self.categories[name], dtype=object)[self.codes[name]]
+
+    def code_of(self, name: str, label: str) -> int:
+        """Return the code of a label, or -1 if the label does not occur"""
+        try:
+            return self.categories[name].index(label)
+        except ValueError:
+            return -1
+
+    def isin(self, name: str, labels: Sequence[str]) -> np.ndarray:
+        """Boolean mask of employees whose categorical field is one of labels"""
+        lookup = np.isin(np.asarray(self.categories[name], dtype=object), list(labels))
+        return lookup[self.codes[name]]
+
+    def group_keys(self, name: str) -> np.ndarray:
+        """Codes present in the table, in order of first appearance"""
+        return pd.unique(self.codes[name])
+
+    def group_count(self, name: str) -> np.ndarray:
+        """Number of employees per code of a categorical field"""
+        return np.bincount(self.codes[name], minlength=len(self.categories[name]))
+
+    def group_sum(self, name: str, values: np.ndarray) -> np.ndarray:
+        """Sum of values per code of a categorical field"""
+        return np.bincount(self.codes[name], weights=values, minlength=len(self.categories[name]))
+
+    def group_min(self, name: str, values: np.ndarray) -> np.ndarray:
+        """Minimum of values per code (NaN for empty groups)"""
+        return self._group_reduce(np.minimum, name, values)
+
+    def group_max(self, name: str, values: np.ndarray) -> np.ndarray:
+        """Maximum of values per code (NaN for empty groups)"""
+        return self._group_reduce(np.maximum, name, values)
+
+    def _group_reduce(self, ufunc: np.ufunc, name: str, values: np.ndarray) -> np.ndarray:
+        """Reduce values per code of a categorical field with a ufunc"""
+        field_codes = self.codes[name]
+        result = np.full(len(self.categories[name]), np.nan)
+        if len(field_codes) == 0:
+            return result
+
+        order = np.argsort(field_codes, kind='stable')
+        sorted_codes = field_codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        result[sorted_codes[starts]] = ufunc.reduceat(np.asarray(values, dtype=np.float64)[order], starts)
+        return result
+
+    def take(self, indices: np.ndarray) -> 'EmployeeTable':
+        """Select a subset of employees (categories are shared with this table)"""
+        return EmployeeTable(
+            {name: column[indices] for name, column in self.columns.items()},
+            {name: field_codes[indices] for name, field_codes in self.codes.items()},
+            self.categories,
+            self.current_date
+        )
+
+    def as_of(self, current_date: Union[pd.Timestamp, str]) -> 'EmployeeTable':
+        """
+        The employees as of another date: age, tenure and age group calculated at that date
+
+        Employees hired after the date are left out. Derived columns are recomputed in
+        one vectorized step; all other columns are shared with this table when every
+        employee is kept.
+
+        Args:
+            current_date: Date to calculate at (Timestamp or ISO string)
+        """
+        current_date = pd.Timestamp(current_date)
+        if current_date == self.current_date:
+            return self
+
+        table = self
+        hired = self.hire_date <= np.datetime64(current_date, 'us')
+        if not hired.all():
+            table = self.take(np.flatnonzero(hired))
+
+        columns = dict(table.columns)
+        for name, values in calculate_derived_columns(table.birth_date, table.hire_date, current_date).items():
+            columns[name] = values.astype(self.NUMERIC_FIELDS[name])
+        codes = dict(table.codes)
+        codes['age_group'] = np.digitize(columns['age'], AGE_GROUP_BOUNDS, right=True).astype(np.int8)
+        return EmployeeTable(columns, codes, self.categories, current_date)
+
+    @classmethod
+    def concat(cls, tables: List['EmployeeTable']) -> 'EmployeeTable':
+        """Concatenate tables, merging their categories in order of first appearance"""
+        if len(tables) == 1:
+            return tables[0]
+        if any(table.current_date != tables[0].current_date for table in tables):
+            raise ValueError("Cannot concatenate tables calculated at different dates")
+
+        columns = {name: np.concatenate([table.columns[name] for table in tables]) for name in tables[0].columns}
+        codes = {}
+        categories = {}
+        for name in tables[0].codes:
+            merged = {}
+            remapped = []
+            for table in tables:
+                lookup = np.array([merged.setdefault(label, len(merged)) for label in table.categories[name]],
+                                  dtype=np.int32)
+                remapped.append(lookup[table.codes[name]] if len(lookup) else table.codes[name])
+            codes[name] = np.concatenate(remapped).astype(tables[0].codes[name].dtype)
+            categories[name] = list(merged)
+
+        return cls(columns, codes, categories, tables[0].current_date)
+
+    def append(self, other: 'EmployeeTable') -> 'EmployeeTable':
+        """Return a new table with the employees of other appended"""
+        return EmployeeTable.concat([self, other])
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Get analytics data of a single employee"""
+        result = {name: column[index] if column.dtype == object else column[index].item()
+                  for name, column in self.columns.items()}
+        del result['performance_score_is_integer']
+        result['performance_score'] = self.performance_value(index)
+        for name, field_codes in self.codes.items():
+            result[name] = self.categories[name][field_codes[index]]
+        return result
+
+    def performance_value(self, index: int) -> Union[int, float]:
+        """Performance score of a single employee with its type in the source data (int or float)"""
+        score = float(self.performance_score[index])
+        return int(score) if self.performance_score_is_integer[index] else score
+
+    def _snapshot_metadata(self) -> Dict[str, Any]:
+        """Metadata stored with a snapshot to decode it and to detect stale files"""
+        return {
+            'version': SNAPSHOT_VERSION,
+            'current_date': str(self.current_date),
+            'categories': self.categories,
+            'code_dtypes': {name: field_codes.dtype.name for name, field_codes in self.codes.items()}
+        }
+
+    def save_snapshot(self, path: str):
+        """
+        Save table as a binary columnar snapshot
+
+        The format follows the file extension: '.parquet' (requires pyarrow) or '.npz'.
+        String columns are stored dictionary-encoded (codes plus distinct labels). The
+        snapshot is written to a temporary file next to path and then renamed over it, so
+        an interrupted run never leaves a truncated snapshot behind.
+        """
+        directory, name = os.path.split(os.path.abspath(path))
+        handle, temporary_path = tempfile.mkstemp(prefix=f'.{name}.', suffix=os.path.splitext(path)[1], dir=directory)
+        os.close(handle)
+        try:
+            self._write_snapshot(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+            raise
+
+    def _write_snapshot(self, path: str):
+        """Write the snapshot file of save_snapshot"""
+        metadata = self._snapshot_metadata()
+
+        if path.endswith('.parquet'):
+            if pa is None:
+                raise ImportError("pyarrow is required for Parquet snapshots, use a .npz path instead")
+            fields = {}
+            for name, column in self.columns.items():
+                if column.dtype == object:
+                    text_codes, labels = pd.factorize(column)
+                    fields[name] = pa.DictionaryArray.from_arrays(text_codes.astype(np.int32), pa.array(list(labels)))
+                else:
+                    fields[name] = pa.array(column)
+            for name, field_codes in self.codes.items():
+                fields[name] = pa.DictionaryArray.from_arrays(field_codes, pa.array(self.categories[name]))
+
+            arrow_table = pa.table(fields).replace_schema_metadata({'employee_table': json.dumps(metadata)})
+            pq.write_table(arrow_table, path)
+            return
+
+        arrays = {'metadata': np.array(json.dumps(metadata))}
+        for name, column in self.columns.items():
+            if column.dtype == object:
+                text_codes, labels = pd.factorize(column)
+                arrays[f"text_codes:{name}"] = text_codes.astype(np.int32)
+                arrays[f"text_labels:{name}"] = np.array(list(labels), dtype=str)
+            else:
+                arrays[f"column:{name}"] = column
+        for name, field_codes in self.codes.items():
+            arrays[f"codes:{name}"] = field_codes
+            arrays[f"labels:{name}"] = np.array(self.categories[name], dtype=str)
+
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> 'EmployeeTable':
+        """Load table from a snapshot written by save_snapshot"""
+        if path.endswith('.parquet'):
+            if pq is None:
+                raise ImportError("pyarrow is required for Parquet snapshots")
+            arrow_table = pq.read_table(path)
+            metadata = json.loads(arrow_table.schema.metadata[b'employee_table'])
+            categories = metadata['categories']
+
+            columns = {}
+            codes = {}
+            for name in arrow_table.column_names:
+                column = arrow_table.column(name).unify_dictionaries().combine_chunks()
+                if name in categories:
+                    # Map the file dictionary back to the stored category order
+                    position = {label: code for code, label in enumerate(categories[name])}
+                    lookup = np.array([position[label] for label in column.dictionary.to_pylist()], dtype=np.int64)
+                    codes[name] = lookup[column.indices.to_numpy()].astype(metadata['code_dtypes'][name]) \
+                        if len(lookup) else np.zeros(len(column), dtype=metadata['code_dtypes'][name])
+                elif pa.types.is_dictionary(column.type):
+                    labels = np.asarray(column.dictionary.to_pylist(), dtype=object)
+                    columns[name] = labels[column.indices.to_numpy()] if len(labels) else np.empty(0, dtype=object)
+                else:
+                    columns[name] = column.to_numpy(zero_copy_only=False)
+            return cls(columns, codes, categories, pd.Timestamp(metadata['current_date']))
+
+        with np.load(path, allow_pickle=False) as arrays:
+            metadata = json.loads(arrays['metadata'].item())
+            columns = {}
+            codes = {}
+            for key in arrays.files:
+                kind, _, name = key.partition(':')
+                if kind == 'column':
+                    columns[name] = arrays[key]
+                elif kind == 'text_codes':
+                    columns[name] = np.asarray(arrays[f"text_labels:{name}"].tolist(), dtype=object)[arrays[key]]
+                elif kind == 'codes':
+                    codes[name] = arrays[key]
+            return cls(columns, codes, metadata['categories'], pd.Timestamp(metadata['current_date']))
+
+    def save_columns(self, directory: str):
+        """
+        Save table as raw column files that other processes can memory-map
+
+        Every numeric, date and code column is written as a raw C-ordered array
+        ('<name>.bin', page-aligned since it starts at offset 0). Text fields are
+        dictionary-encoded. Dtypes, labels and the row count go to 'manifest.json',
+        which is written last.
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest = self._snapshot_metadata()
+        manifest.update({'rows': len(self), 'columns': {}, 'codes': {}, 'text_labels': {}})
+
+        for name, column in self.columns.items():
+            if column.dtype == object:
+                text_codes, labels = pd.factorize(column)
+                column = text_codes.astype(np.int32)
+                manifest['text_labels'][name] = list(labels)
+            np.ascontiguousarray(column).tofile(os.path.join(directory, f"{name}.bin"))
+            manifest['columns'][name] = column.dtype.str
+        for name, field_codes in self.codes.items():
+            np.ascontiguousarray(field_codes).tofile(os.path.join(directory, f"codes.{name}.bin"))
+            manifest['codes'][name] = field_codes.dtype.str
+
+        with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+    @classmethod
+    def open_mapped(cls, directory: str) -> 'EmployeeTable':
+        """
+        Open a table written by save_columns with numpy.memmap (read-only, zero-copy)
+
+        Column data is not read or deserialized: pages are loaded on first access and
+        shared through the OS page cache between all processes mapping the same files.
+        Only the text fields (names) are decoded into per-process object arrays.
+        """
+        with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        rows = manifest['rows']
+
+        def mapped(file_name: str, dtype: str) -> np.ndarray:
+            if rows == 0:  # Empty files cannot be mapped
+                return np.zeros(0, dtype=dtype)
+            return np.memmap(os.path.join(directory, file_name), dtype=np.dtype(dtype), mode='r', shape=(rows,))
+
+        columns = {}
+        for name, dtype in manifest['columns'].items():
+            columns[name] = mapped(f"{name}.bin", dtype)
+            if name in manifest['text_labels']:
+                columns[name] = np.asarray(manifest['text_labels'][name], dtype=object)[columns[name]] \
+                    if rows else np.empty(0, dtype=object)
+        codes = {name: mapped(f"codes.{name}.bin", dtype) for name, dtype in manifest['codes'].items()}
+
+        return cls(columns, codes, manifest['categories'], pd.Timestamp(manifest['current_date']))
+
+    @staticmethod
+    def is_snapshot_fresh(path: str, source_path: str) -> bool:
+        """
+        Check that a snapshot exists, is newer than its source file and matches the current layout
+
+        A snapshot that cannot be read (truncated, corrupt, another format) is not fresh.
+        """
+        if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source_path):
+            return False
+        try:
+            if path.endswith('.parquet'):
+                if pq is None:
+                    return False
+                metadata = json.loads(pq.read_schema(path).metadata[b'employee_table'])
+            else:
+                with np.load(path, allow_pickle=False) as arrays:
+                    metadata = json.loads(arrays['metadata'].item())
+            return metadata['version'] == SNAPSHOT_VERSION and metadata['current_date'] == str(CURRENT_DATE)
+        except Exception:
+            return False
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert table to the analytics DataFrame layout"""
+        return pd.DataFrame({
+            'employee_id': self.employee_id,
+            'gender': self.labels('gender'),
+            'age': self.age,
+            'age_group': self.labels('age_group'),
+            'department_name': self.labels('department_name'),
+            'position': self.labels('position'),
+            'salary': self.salary,
+            'tenure_years': self.tenure_years,
+            'performance_score': self.performance_score,
+            'is_team_lead': self.is_team_lead,
+            'education': self.labels('education'),
+            'education_level': self.education_level,
+            'certifications': self.certifications,
+            'skills_count': self.skills_count,
+            'languages_count': self.languages_count
+        })
+
+
+def as_employee_table(employees: Union[List['Employee'], EmployeeTable, 'EmployeeManager']) -> EmployeeTable:
+    """Return employees as an EmployeeTable (building it from Employee objects if needed)"""
+    if isinstance(employees, EmployeeTable):
+        return employees
+    if isinstance(employees, EmployeeManager):
+        return employees.table
+    return EmployeeTable.from_employees(employees)
+
+
+class EmployeeIndex:
+    """Secondary indexes over employee rows for repeated queries
+
+    Hash indexes map a department or position to its rows, sorted indexes hold the rows
+    ordered by performance_score or salary for range queries, and the boolean flags are
+    packed bitmaps. Rows added later are kept in a small pending buffer that queries scan
+    and that is merged into the indexes once it outgrows about sqrt(n) rows, so adding an
+    employee costs O(1) amortized. Every query returns table rows in ascending order.
+    """
+
+    HASH_FIELDS = ['department_name', 'position']
+    SORTED_FIELDS = ['performance_score', 'salary']
+    FLAG_FIELDS = ['is_team_lead', 'higher_education']
+
+    def __init__(self, table: EmployeeTable):
+        """
+        Args:
+            table: Employees to index (row i of the table is row i of the index)
+        """
+        self.size = len(table)
+        self.hash = {}
+        for name in self.HASH_FIELDS:
+            order = np.argsort(table.codes[name], kind='stable')
+            codes, starts = np.unique(table.codes[name][order], return_index=True)
+            self.hash[name] = {table.categories[name][code]: rows
+                               for code, rows in zip(codes, np.split(order, starts[1:]))}
+
+        self.sorted = {}
+        for name in self.SORTED_FIELDS:
+            values = np.asarray(table.columns[name], dtype=np.float64)
+            order = np.argsort(values, kind='stable')
+            self.sorted[name] = (values[order], order)
+
+        self.flags = {
+            'is_team_lead': np.packbits(table.is_team_lead),
+            'higher_education': np.packbits(table.isin('education', HIGHER_EDUCATION))
+        }
+        self.pending = {name: [] for name in self.HASH_FIELDS + self.SORTED_FIELDS + self.FLAG_FIELDS}
+
+    def __len__(self) -> int:
+        """Number of indexed rows"""
+        return self.size + len(self.pending['salary'])
+
+    def add(self, employee: 'Employee'):
+        """Index an employee appended as the next row"""
+        self.pending['department_name'].append(employee.department_name)
+        self.pending['position'].append(employee.position)
+        self.pending['performance_score'].append(employee.performance_score)
+        self.pending['salary'].append(employee.salary)
+        self.pending['is_team_lead'].append(bool(employee.is_team_lead))
+        self.pending['higher_education'].append(employee.education in HIGHER_EDUCATION)
+
+        if len(self.pending['salary']) > max(1024, int(np.sqrt(self.size))):
+            self._merge_pending()
+
+    def _pending_rows(self, mask: Sequence[bool]) -> np.ndarray:
+        """Rows of the pending employees selected by mask"""
+        return self.size + np.flatnonzero(np.asarray(mask, dtype=bool))
+
+    def _merge_pending(self):
+        """Move the pending rows into the indexes"""
+        count = len(self.pending['salary'])
+        rows = np.arange(self.size, self.size + count)
+
+        for name in self.HASH_FIELDS:
+            labels = np.asarray(self.pending[name], dtype=object)
+            for label in pd.unique(labels):
+                existing = self.hash[name].get(label, rows[:0])
+                self.hash[name][label] = np.concatenate([existing, rows[labels == label]])
+
+        for name in self.SORTED_FIELDS:
+            values, order = self.sorted[name]
+            new_values = np.asarray(self.pending[name], dtype=np.float64)
+            new_order = np.argsort(new_values, kind='stable')
+            # New rows go after equal values, keeping ties in row order
+            positions = np.searchsorted(values, new_values[new_order], side='right')
+            self.sorted[name] = (np.insert(values, positions, new_values[new_order]),
+                                 np.insert(order, positions, rows[new_order]))
+
+        for name in self.FLAG_FIELDS:
+            bits = np.unpackbits(self.flags[name], count=self.size)
+            self.flags[name] = np.packbits(np.concatenate([bits, np.asarray(self.pending[name], dtype=np.uint8)]))
+
+        self.size += count
+        self.pending = {name: [] for name in self.pending}
+
+    def rows_equal(self, name: str, label: str) -> np.ndarray:
+        """Rows whose hash-indexed field equals label"""
+        rows = self.hash[name].get(label, np.array([], dtype=np.int64))
+        pending = [value == label for value in self.pending[name]]
+        return np.concatenate([rows, self._pending_rows(pending)]) if any(pending) else rows
+
+    def rows_between(self, name: str, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Rows whose sorted-indexed field lies in [low, high] (open-ended if None)"""
+        values, order = self.sorted[name]
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        # NaN sorts after every number and never matches
+        end = np.searchsorted(values, np.inf if high is None else high, side='right')
+        rows = np.sort(order[start:end])
+
+        pending = np.asarray(self.pending[name], dtype=np.float64)
+        if len(pending):
+            matches = ((pending >= (-np.inf if low is None else low)) &
+                       (pending <= (np.inf if high is None else high)))
+            rows = np.concatenate([rows, self._pending_rows(matches)])
+        return rows
+
+    def flag_bits(self, name: str, rows: np.ndarray) -> np.ndarray:
+        """Values of a flag for the given rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        indexed = rows < self.size
+        bits = np.zeros(len(rows), dtype=bool)
+        bitmap = self.flags[name]
+        bits[indexed] = (bitmap[rows[indexed] >> 3] >> (7 - (rows[indexed] & 7))) & 1
+        bits[~indexed] = np.asarray(self.pending[name], dtype=bool)[rows[~indexed] - self.size]
+        return bits
+
+    def rows_with(self, name: str, value: bool = True) -> np.ndarray:
+        """Rows whose flag has the given value"""
+        bits = np.unpackbits(self.flags[name], count=self.size).astype(bool)
+        rows = np.flatnonzero(bits == value)
+        pending = [flag == value for flag in self.pending[name]]
+        return np.concatenate([rows, self._pending_rows(pending)]) if any(pending) else rows
+
+    def query(self, equal: Optional[Dict[str, str]] = None,
+              between: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+              flags: Optional[Dict[str, bool]] = None) -> np.ndarray:
+        """
+        Rows matching every condition, by intersecting the indexes
+
+        The row sets of the hash and range conditions are intersected from the smallest
+        up, then the remaining rows are checked against the flag bitmaps.
+
+        Args:
+            equal: Hash-indexed field -> label
+            between: Sorted-indexed field -> (low, high)
+            flags: Flag -> required value
+        """
+        row_sets = [self.rows_equal(name, label) for name, label in (equal or {}).items()]
+        row_sets += [self.rows_between(name, low, high) for name, (low, high) in (between or {}).items()]
+        flags = dict(flags or {})
+
+        if row_sets:
+            row_sets.sort(key=len)
+            rows = row_sets[0]
+            for other in row_sets[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+        elif flags:
+            name, value = flags.popitem()
+            rows = self.rows_with(name, value)
+        else:
+            rows = np.arange(len(self))
+
+        for name, value in flags.items():
+            rows = rows[self.flag_bits(name, rows) == value]
+        return rows
+
+
 class EmployeeManager:
-    """Manager class for handling multiple employees and bulk operations"""
+    """Manager class for handling multiple employees and bulk operations
+
+    Employees can be added, removed and updated one at a time (e.g. hires, terminations
+    and profile edits pushed by the HR system). Once aggregates has been used, these
+    events keep it up to date incrementally, so refreshing aggregate-based reports after
+    an edit does not go over all employees again. Table-backed managers record the
+    events and apply them to the table the next time row-level data is needed.
+
+    Queries (get_employees_by_department, find_employees, ...) go through an
+    EmployeeIndex built on first use and extended by add_employee.
+    """
+
+    def __init__(self, employees: Union[List[Employee], EmployeeTable] = None):
+        # Fixed at construction: a manager built from Employee objects keeps them (and
+        # hands them out) even while the list is empty and its table has been built
+        self._table_backed = isinstance(employees, EmployeeTable)
+        if self._table_backed:
+            self.employees = []
+            self._table = employees
+        else:
+            self.employees = employees or []
+            self._table = None
 
-    def __init__(self, employees: List[Employee] = None):
-        self.employees = employees or []
+        # Set up by the first change event: sequence number of every employee (in order),
+        # employee_id -> sequence number, and the next number to hand out
+        self._sequences = None
+        self._ids = None
+        self._next_sequence = 0
+        # Table-backed managers: sequence numbers of the table rows, and employees added
+        # or updated since the table was built
+        self._table_sequences = None
+        self._changed = {}
+        self._stale = False
+
+        self._running = None
+        self._aggregates = None
+        self._index = None
+        # As-of date -> table calculated at that date
+        self._as_of_tables = {}
+
+    @classmethod
+    def open_mapped(cls, directory: str) -> 'EmployeeManager':
+        """Create a manager over memory-mapped columns written by EmployeeTable.save_columns"""
+        return cls(EmployeeTable.open_mapped(directory))
+
+    def _is_table_backed(self) -> bool:
+        """Whether employees are held as a table rather than Employee objects"""
+        return self._table_backed
+
+    @property
+    def table(self) -> EmployeeTable:
+        """Columnar view of the managed employees (built once, on first use)"""
+        if self._table is None:
+            self._table = EmployeeTable.from_employees(self.employees)
+        elif self._stale:
+            self._apply_changes()
+        return self._table
+
+    def _apply_changes(self):
+        """Rebuild the table from its rows still managed and the employees added or updated since"""
+        sequences = np.array(self._sequences, dtype=np.int64)
+        rows = np.searchsorted(self._table_sequences, sequences)
+        changed = np.isin(sequences, list(self._changed))
+
+        table = self._table
+        if changed.any():
+            table = table.append(EmployeeTable.from_employees([self._changed[seq] for seq in sequences[changed]],
+                                                              self._table.current_date))
+            rows[changed] = len(self._table) + np.arange(changed.sum())
+
+        self._table = table.take(rows)
+        self._table_sequences = sequences
+        self._changed = {}
+        self._stale = False
+
+    def _track(self):
+        """Number the employees and index them by employee_id (on the first change event)"""
+        if self._sequences is not None:
+            return
+
+        count = len(self)
+        self._sequences = list(range(count))
+        self._next_sequence = count
+        if self._is_table_backed():
+            self._table_sequences = np.arange(count)
+            ids = self._table.employee_id.tolist()
+        else:
+            ids = [emp.employee_id for emp in self.employees]
+        self._ids = dict(zip(ids, self._sequences))
+
+    def _find(self, employee_id: int) -> Tuple[int, int]:
+        """Return (row, sequence number) of a managed employee"""
+        self._track()
+        if employee_id not in self._ids:
+            raise KeyError(f"No employee with employee_id {employee_id}")
+        sequence = self._ids[employee_id]
+        return bisect.bisect_left(self._sequences, sequence), sequence
+
+    def _current(self, row: int, sequence: int) -> Union[Employee, Dict[str, Any]]:
+        """Current data of a managed employee (Employee object or analytics row dict)"""
+        if not self._is_table_backed():
+            return self.employees[row]
+        if sequence in self._changed:
+            return self._changed[sequence]
+        return self._table.row(int(np.searchsorted(self._table_sequences, sequence)))
+
+    @property
+    def aggregates(self) -> 'GroupedAggregates':
+        """
+        Grouped aggregates of the managed employees (see analyzers.AggregationEngine)
+
+        Computed in one pass on first use, then maintained by add_employee,
+        remove_employee and update_employee; pass them to analyzers or an AnalysisSession
+        along with the manager.
+        """
+        # Imported here: the analyzers package imports this module
+        from analyzers.AggregationEngine import RunningAggregates
+
+        if self._running is None:
+            self._track()
+            self._running = RunningAggregates(self.table, np.array(self._sequences, dtype=np.int64))
+        if self._aggregates is None:
+            self._aggregates = self._running.to_aggregates(
+                lambda sequences: np.searchsorted(np.array(self._sequences, dtype=np.int64), sequences))
+        return self._aggregates
+
+    def as_of(self, current_date: Union[pd.Timestamp, str]) -> EmployeeTable:
+        """
+        Managed employees with age, tenure and age group calculated at another date
+
+        Tables are cached per date (until the next change event), so reports over many
+        as-of dates recompute the derived columns once per date and never reload data.
+
+        Args:
+            current_date: Date to calculate at (Timestamp or ISO string)
+        """
+        current_date = pd.Timestamp(current_date)
+        if current_date not in self._as_of_tables:
+            self._as_of_tables[current_date] = self.table.as_of(current_date)
+        return self._as_of_tables[current_date]
 
     def add_employee(self, employee: Employee):
         """Add an employee to the manager"""
-        self.employees.append(employee)
+        self._track()
+        sequence = self._next_sequence
+        self._next_sequence += 1
+
+        if self._is_table_backed():
+            self._changed[sequence] = employee
+            self._stale = True
+        else:
+            self.employees.append(employee)
+            self._table = None
+        self._as_of_tables = {}
+
+        self._sequences.append(sequence)
+        self._ids[employee.employee_id] = sequence
+        if self._index is not None:
+            self._index.add(employee)
+        if self._running is not None:
+            self._running.add(employee, sequence)
+            self._aggregates = None
+
+    def remove_employee(self, employee_id: int):
+        """Remove an employee (e.g. after termination)"""
+        row, sequence = self._find(employee_id)
+        if self._running is not None:
+            self._running.remove(self._current(row, sequence), sequence)
+            self._aggregates = None
 
-    def get_employees_by_department(self, department_name: str) -> List[Employee]:
+        if self._is_table_backed():
+            self._changed.pop(sequence, None)
+            self._stale = True
+        else:
+            del self.employees[row]
+            self._table = None
+        self._as_of_tables = {}
+
+        del self._sequences[row]
+        del self._ids[employee_id]
+        # Rows after the removed one move up: the indexes are rebuilt on the next query
+        self._index = None
+
+    def update_employee(self, employee: Employee):
+        """Replace the managed employee with the same employee_id (e.g. after a profile edit), keeping its position"""
+        row, sequence = self._find(employee.employee_id)
+        if self._running is not None:
+            self._running.remove(self._current(row, sequence), sequence)
+            self._running.add(employee, sequence)
+            self._aggregates = None
+
+        if self._is_table_backed():
+            self._changed[sequence] = employee
+            self._stale = True
+        else:
+            self.employees[row] = employee
+            self._table = None
+        self._index = None
+        self._as_of_tables = {}
+
+    @property
+    def index(self) -> EmployeeIndex:
+        """Query indexes of the managed employees (built on first use, extended by add_employee)"""
+        if self._index is None:
+            self._index = EmployeeIndex(self.table)
+        return self._index
+
+    def _select(self, rows: np.ndarray) -> Union[List[Employee], EmployeeTable]:
+        """Select employees by rows (Employee objects if available, otherwise a sub-table)"""
+        if not self._is_table_backed():
+            return [self.employees[i] for i in rows]
+        return self.table.take(rows)
+
+    def get_employees_by_department(self, department_name: str) -> Union[List[Employee], EmployeeTable]:
         """Get all employees in a specific department"""
-        return [emp for emp in self.employees if emp.department_name == department_name]
+        return self._select(self.index.rows_equal('department_name', department_name))
 
-    def get_employees_by_position(self, position: str) -> List[Employee]:
+    def get_employees_by_position(self, position: str) -> Union[List[Employee], EmployeeTable]:
         """Get all employees with a specific position"""
-        return [emp for emp in self.employees if emp.position == position]
+        return self._select(self.index.rows_equal('position', position))
 
-    def get_high_performers(self, threshold: float = 85.0) -> List[Employee]:
+    def get_high_performers(self, threshold: float = 85.0) -> Union[List[Employee], EmployeeTable]:
         """Get all high-performing employees"""
-        return [emp for emp in self.employees if emp.is_high_performer(threshold)]
+        return self._select(self.index.rows_between('performance_score', threshold))
+
+    def get_employees_by_salary(self, min_salary: Optional[float] = None,
+                                max_salary: Optional[float] = None) -> Union[List[Employee], EmployeeTable]:
+        """Get all employees with a salary in [min_salary, max_salary]"""
+        return self._select(self.index.rows_between('salary', min_salary, max_salary))
 
-    def get_team_leads(self) -> List[Employee]:
+    def get_team_leads(self) -> Union[List[Employee], EmployeeTable]:
         """Get all team leads"""
-        return [emp for emp in self.employees if emp.is_team_lead]
+        return self._select(self.index.rows_with('is_team_lead'))
 
-    def get_employees_with_higher_education(self) -> List[Employee]:
+    def get_employees_with_higher_education(self) -> Union[List[Employee], EmployeeTable]:
         """Get all employees with higher education"""
-        return [emp for emp in self.employees if emp.has_higher_education()]
+        return self._select(self.index.rows_with('higher_education'))
+
+    def find_employees(self, department_name: Optional[str] = None, position: Optional[str] = None,
+                       min_performance: Optional[float] = None, max_performance: Optional[float] = None,
+                       min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+                       is_team_lead: Optional[bool] = None,
+                       higher_education: Optional[bool] = None) -> Union[List[Employee], EmployeeTable]:
+        """
+        Get the employees matching every given condition (None means no condition)
+
+        Args:
+            department_name: Department of the employee
+            position: Position of the employee
+            min_performance, max_performance: Inclusive performance_score range
+            min_salary, max_salary: Inclusive salary range
+            is_team_lead: Whether the employee must (not) be a team lead
+            higher_education: Whether the employee must (not) have higher education
+        """
+        equal = {name: label for name, label in [('department_name', department_name), ('position', position)]
+                 if label is not None}
+        between = {name: (low, high) for name, low, high in [('performance_score', min_performance, max_performance),
+                                                             ('salary', min_salary, max_salary)]
+                   if low is not None or high is not None}
+        flags = {name: value for name, value in [('is_team_lead', is_team_lead), ('higher_education', higher_education)]
+                 if value is not None}
+        return self._select(self.index.query(equal, between, flags))
 
     def get_analytics_dataframe(self) -> pd.DataFrame:
         """Convert all employees to pandas DataFrame for analysis"""
-        data = [emp.get_analytics_data() for emp in self.employees]
-        return pd.DataFrame(data)
+        return self.table.to_dataframe()
 
     def get_summary_statistics(self) -> Dict[str, Any]:
         """Get summary statistics for all employees"""
-        if not self.employees:
+        if len(self) == 0:
             return {}
 
         df = self.get_analytics_dataframe()
 
         return {
-            'total_employees': len(self.employees),
+            'total_employees': len(self),
             'gender_distribution': df['gender'].value_counts().to_dict(),
             'average_age': round(df['age'].mean(), 1),
             'average_salary': round(df['salary'].mean(), 2),
@@ -274,11 +1269,17 @@ class EmployeeManager:
 
     def __len__(self) -> int:
         """Return number of employees"""
-        return len(self.employees)
+        if self._sequences is not None:
+            return len(self._sequences)
+        if not self._is_table_backed():
+            return len(self.employees)
+        return len(self._table)
 
-    def __getitem__(self, index: int) -> Employee:
-        """Get employee by index"""
-        return self.employees[index]
+    def __getitem__(self, index: int) -> Union[Employee, Dict[str, Any]]:
+        """Get employee by index (analytics data of the row for table-backed managers)"""
+        if not self._is_table_backed():
+            return self.employees[index]
+        return self.table.row(index)
 
 
 # Utility functions for working with employee data
@@ -287,21 +1288,72 @@ def create_employees_from_json(json_data: List[Dict]) -> List[Employee]:
     return [Employee(emp_data) for emp_data in json_data]
 
 
-def load_employees_from_file(file_path: str) -> List[Employee]:
-    """Load employees from JSON file"""
+def create_employee_table_from_json(json_data: Iterable[Dict]) -> EmployeeTable:
+    """Create EmployeeTable from JSON data using the vectorized bulk loading path"""
+    return EmployeeTable.from_records(json_data)
+
+
+def load_employees_from_file(file_path: str, as_table: bool = False) -> Union[List[Employee], EmployeeTable]:
+    """
+    Load employees from JSON file
+
+    Args:
+        file_path: Path to company JSON file (or a plain list of employees)
+        as_table: Return an EmployeeTable built with the bulk loading path instead of Employee objects.
+            The employees section is then streamed record by record and the other sections
+            of the file are skipped, so the whole file is never held in memory.
+    """
+    if as_table:
+        return create_employee_table_from_json(iter_json_array(file_path, 'employees'))
+
     with open(file_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
     if 'employees' in data:
-        return create_employees_from_json(data['employees'])
-    else:
-        return create_employees_from_json(data)
+        data = data['employees']
+
+    return create_employees_from_json(data)
+
+
+def snapshot_path(file_path: str) -> str:
+    """Default snapshot location for a company JSON file (Parquet if pyarrow is installed, else .npz)"""
+    extension = '.parquet' if pa is not None else '.npz'
+    return os.path.splitext(file_path)[0] + '.employees' + extension
+
+
+def load_employee_table(file_path: str, use_snapshot: bool = True) -> EmployeeTable:
+    """
+    Load employees as an EmployeeTable, going through a columnar snapshot
+
+    If a snapshot newer than the JSON file exists it is loaded instead of parsing the
+    JSON; otherwise (or if the snapshot cannot be read) the JSON is streamed and the
+    snapshot is (re)written for later runs.
+
+    Args:
+        file_path: Path to company JSON file
+        use_snapshot: Read and write the snapshot next to the JSON file
+    """
+    if not use_snapshot:
+        return load_employees_from_file(file_path, as_table=True)
+
+    path = snapshot_path(file_path)
+    if EmployeeTable.is_snapshot_fresh(path, file_path):
+        try:
+            return EmployeeTable.load_snapshot(path)
+        except Exception:
+            pass  # Corrupt snapshot: parse the JSON and replace it
+
+    table = load_employees_from_file(file_path, as_table=True)
+    try:
+        table.save_snapshot(path)
+    except OSError:
+        pass  # Read-only location: keep working from the JSON
+    return table
 
 
-def export_employees_to_dataframe(employees: List[Employee]) -> pd.DataFrame:
+def export_employees_to_dataframe(employees: Union[List[Employee], EmployeeTable]) -> pd.DataFrame:
     """Export employees to pandas DataFrame for analysis"""
-    data = [emp.get_analytics_data() for emp in employees]
-    return pd.DataFrame(data)
+    return as_employee_table(employees).to_dataframe()
 
 
 if __name__ == "__main__":
@@ -309,5 +1361,6 @@ if __name__ == "__main__":
     print("Employee module loaded successfully")
     print("This module provides:")
     print("- Employee class for individual employee data")
+    print("- EmployeeTable for columnar (NumPy) storage of employee data")
     print("- EmployeeManager for bulk operations")
     print("- Utility functions for data loading and analysis")
\ No newline at end of file
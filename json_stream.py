@@ -0,0 +1,159 @@
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+STRUCTURAL = re.compile(r'["\[\]{}]')
+STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+DECODER = json.JSONDecoder()
+
+
+class JsonStream:
+    """Incremental reader of a JSON document held in a text file
+
+    Only a bounded window of the file is kept in memory: consumed text is dropped
+    every time a new chunk is read.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = 1 << 20):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping already consumed text. Returns False at end of file"""
+        if self.eof:
+            return False
+
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        """Consume the next non-whitespace character, which must be char"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON stream, found '{found}'")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.pos)
+                # A value touching the end of the buffer (e.g. a number) may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def skip_value(self):
+        """Skip the next JSON value without building Python objects for it"""
+        if self.peek() not in '[{':
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            match = STRUCTURAL.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON stream")
+                continue
+
+            char = match.group()
+            self.pos = match.end()
+            if char == '"':
+                self._skip_string_body()
+            elif char in '[{':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_string_body(self):
+        """Skip the rest of a string whose opening quote was already consumed"""
+        while True:
+            match = STRING_BODY.match(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.end()
+                return
+            if not self._fill():
+                raise ValueError("Unterminated string in JSON stream")
+
+    def iter_array(self) -> Iterator[Any]:
+        """Iterate over the elements of the array starting at the current position"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            yield self.read_value()
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, found '{char}'")
+
+
+def iter_json_array(file_path: str, key: str, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """
+    Stream the elements of a top-level array section of a JSON file
+
+    Other top-level sections are skipped without being decoded, so memory use does not
+    depend on the file size. If the document itself is an array, its elements are streamed.
+
+    Args:
+        file_path: Path to JSON file
+        key: Name of the top-level section to stream (e.g. 'employees')
+        chunk_size: Number of characters read from the file at once
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f, chunk_size)
+
+        if stream.peek() == '[':
+            yield from stream.iter_array()
+            return
+
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+
+        while True:
+            name = stream.read_value()
+            stream.expect(':')
+            if name == key:
+                yield from stream.iter_array()
+                return
+
+            stream.skip_value()
+            char = stream.peek()
+            stream.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or '}}' in JSON object, found '{char}'")
@@ -1,56 +1,117 @@
-import json
-from employee import Employee
-from analyzers import DemographicAnalyzer
-from analyzers import TurnoverAnalyzer
-from analyzers import EducationAnalyzer
-from analyzers import CareerDevelompentAnalyzer
-from analyzers import HRStrategyAdvisor
+import argparse
+import contextlib
+import io
+import multiprocessing
+import tempfile
+from typing import Dict, List, Optional, Tuple
+from employee import EmployeeTable, load_employee_table
+from analyzers.AggregationEngine import aggregate
+from analyzers.AnalysisSession import AnalysisSession
 
+# Reports in the order they are printed: (session analyzer, report method)
+REPORTS = [
+    ('demographic_analyzer', 'generate_demographic_report'),
+    ('turnover_analyzer', 'generate_turnover_report'),
+    ('education_analyzer', 'generate_education_report'),
+    ('career_analyzer', 'generate_career_development_report'),
+    ('strategy_advisor', 'generate_strategy_report')
+]
 
-def load_data(json_file_path: str):
-    """Load data from JSON file"""
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+# Session used by report worker processes (inherited on fork or opened by _init_worker)
+_worker_session = None
 
-    employees = []
-    for emp_data in data['employees']:
-        employees.append(Employee(emp_data))
 
-    return employees
+def load_data(json_file_path: str) -> EmployeeTable:
+    """Load data from JSON file into a columnar EmployeeTable (via a snapshot when it is up to date)"""
+    return load_employee_table(json_file_path)
 
 
-def main():
-    """Main function to run all analyses"""
-    print("Loading company data...")
-    employees = load_data('company.json')
-    print(f"Loaded {len(employees)} employees\n")
+def _init_worker(mapped_directory: Optional[str]):
+    """Open the memory-mapped employee columns in a worker started without fork"""
+    global _worker_session
+    if mapped_directory is not None:
+        _worker_session = AnalysisSession(EmployeeTable.open_mapped(mapped_directory))
 
-    # Initialize all analyzers
-    demographic_analyzer = DemographicAnalyzer.DemographicAnalyzer(employees)
-    turnover_analyzer = TurnoverAnalyzer.TurnoverAnalyzer(employees)
-    education_analyzer = EducationAnalyzer.EducationAnalyzer(employees)
-    career_analyzer = CareerDevelompentAnalyzer.CareerDevelopmentAnalyzer(employees)
-    strategy_advisor = HRStrategyAdvisor.HRStrategyAdvisor(employees)
 
-    # Run all analyses
-    print("=" * 60)
-    demographic_report = demographic_analyzer.generate_demographic_report()
+def _run_report(index: int) -> Tuple[str, Dict]:
+    """Run one report in a worker process, capturing what it prints"""
+    name, method = REPORTS[index]
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        report = getattr(getattr(_worker_session, name), method)()
+    return output.getvalue(), report
 
-    print("\n" + "=" * 60)
-    turnover_report = turnover_analyzer.generate_turnover_report()
 
-    print("\n" + "=" * 60)
-    education_report = education_analyzer.generate_education_report()
+def run_reports(session: AnalysisSession, jobs: int = 1) -> List[Dict]:
+    """
+    Run all reports, printing them in a fixed order
 
-    print("\n" + "=" * 60)
-    career_report = career_analyzer.generate_career_development_report()
+    Args:
+        session: Analysis session over the loaded employees
+        jobs: Number of worker processes; with more than one, reports run concurrently and
+            their output is printed in the usual order once each is done. Workers share the
+            employee data (inherited on fork, otherwise memory-mapped), it is never pickled.
+    """
+    if jobs <= 1:
+        reports = []
+        for index, (name, method) in enumerate(REPORTS):
+            print("=" * 60 if index == 0 else "\n" + "=" * 60)
+            reports.append(getattr(getattr(session, name), method)())
+        return reports
 
-    print("\n" + "=" * 60)
-    strategy_report = strategy_advisor.generate_strategy_report()
+    global _worker_session
+    with contextlib.ExitStack() as stack:
+        if 'fork' in multiprocessing.get_all_start_methods():
+            _worker_session = session
+            context = multiprocessing.get_context('fork')
+            mapped_directory = None
+        else:
+            context = multiprocessing.get_context()
+            mapped_directory = stack.enter_context(tempfile.TemporaryDirectory())
+            session.table.save_columns(mapped_directory)
+
+        pool = stack.enter_context(context.Pool(min(jobs, len(REPORTS)), _init_worker, (mapped_directory,)))
+        results = pool.map(_run_report, range(len(REPORTS)))
+
+    reports = []
+    for index, (output, report) in enumerate(results):
+        print("=" * 60 if index == 0 else "\n" + "=" * 60)
+        print(output, end='')
+        reports.append(report)
+    return reports
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to run all analyses"""
+    parser = argparse.ArgumentParser(description="HR analysis of company data")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of processes the aggregation and the reports run on")
+    parser.add_argument('--as-of', help="Date age and tenure are calculated at (YYYY-MM-DD, default: data generation date)")
+    args = parser.parse_args(argv)
+
+    print("Loading company data...")
+    table = load_data('company.json')
+    if args.as_of:
+        # Employees hired after the as-of date are left out
+        loaded = len(table)
+        table = table.as_of(args.as_of)
+        print(f"Loaded {loaded} employees, {len(table)} hired by {args.as_of}\n")
+    else:
+        print(f"Loaded {len(table)} employees\n")
+    if not len(table):
+        print("No employees to analyze")
+        return
+
+    # One session owns every analyzer and caches their results, so each metric is computed
+    # once; the aggregates are built in a single pass over the employees, sharded over the jobs
+    session = AnalysisSession(table, aggregate(table, jobs=args.jobs))
+
+    # Run all analyses
+    demographic_report, turnover_report, education_report, career_report, strategy_report = \
+        run_reports(session, args.jobs)
 
     print("\n" + "=" * 60)
     print("ALL ANALYSES COMPLETED SUCCESSFULLY!")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,45 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import main
+from employee import load_employee_table
+from analyzers.AnalysisSession import AnalysisSession
+
+COMPANY_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'company.json')
+
+
+class EmptyAsOfTest(unittest.TestCase):
+    """An as-of date before every hire leaves no employees"""
+
+    AS_OF = '1990-01-01'
+
+    def test_gender_age_distribution_of_no_employees(self):
+        table = load_employee_table(COMPANY_FILE, use_snapshot=False).as_of(self.AS_OF)
+        self.assertEqual(len(table), 0)
+
+        distribution = AnalysisSession(table).demographic_analyzer.calculate_gender_age_distribution()
+        self.assertEqual(distribution['total_employees'], 0)
+        self.assertEqual(distribution['gender_distribution']['percentage'], {'male': 0.0, 'female': 0.0})
+
+    def test_main_reports_no_employees(self):
+        # Run in a copy of the data so the snapshot main writes stays out of the repository
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            shutil.copy(COMPANY_FILE, directory)
+            os.chdir(directory)
+            try:
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    main.main(['--as-of', self.AS_OF])
+            finally:
+                os.chdir(cwd)
+
+        self.assertIn(f"0 hired by {self.AS_OF}", output.getvalue())
+        self.assertIn("No employees to analyze", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
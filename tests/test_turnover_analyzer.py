@@ -0,0 +1,39 @@
+import json
+import os
+import unittest
+from employee import Employee, EmployeeManager
+from analyzers.AggregationEngine import aggregate
+from analyzers.AnalysisSession import AnalysisSession
+from analyzers.TurnoverAnalyzer import TurnoverAnalyzer
+
+COMPANY_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'company.json')
+
+
+class TurnoverAfterDepartmentRemovalTest(unittest.TestCase):
+    """Turnover rates of a manager whose table was rebuilt without one department"""
+
+    def setUp(self):
+        with open(COMPANY_FILE, encoding='utf-8') as f:
+            self.records = json.load(f)['employees']
+
+    def test_threshold_sweep_after_removing_a_department(self):
+        manager = EmployeeManager([Employee(record) for record in self.records])
+        session = AnalysisSession(manager, manager.aggregates)
+
+        removed = self.records[0]['work_info']['department_name']
+        for record in self.records:
+            if record['work_info']['department_name'] == removed:
+                manager.remove_employee(record['employee_id'])
+        session.set_employees(manager, manager.aggregates)
+
+        # Fresh aggregates of the rebuilt table as the reference
+        reference = TurnoverAnalyzer(manager.table, aggregate(manager.table))
+        for threshold in [0.5, 1.0, 2.0, 3.0, 5.0]:
+            with self.subTest(threshold=threshold):
+                rates = session.turnover_analyzer.calculate_turnover_rates(threshold)
+                self.assertNotIn(removed, rates)
+                self.assertEqual(rates, reference.calculate_turnover_rates(threshold))
+
+
+if __name__ == '__main__':
+    unittest.main()